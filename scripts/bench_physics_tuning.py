@@ -0,0 +1,98 @@
+"""
+Physics tuning benchmark: ms per simulated frame for each tuning profile.
+
+Runs a few representative levels (the default level, open arenas with many
+balls, and tile-built levels with ~1500 small walls) under every profile in
+minigolf.systems.tuning.PROFILES, with every ball given a random strike.
+Reports the median of several runs. Results are recorded in
+benchmarks/physics_tuning.md; re-run it there when the rules change.
+
+Usage: python scripts/bench_physics_tuning.py [--frames N] [--runs N]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import time
+from collections.abc import Callable
+
+import pymunk
+from loguru import logger
+
+from minigolf.game.levels import create_level1
+from minigolf.objects import EntityBuilder
+from minigolf.systems.physics import PhysicsSpace
+from minigolf.systems.tuning import PROFILES
+from minigolf.world import World
+
+ARENA = [(100, 900, 800, 2), (900, 100, 2, 800), (100, 100, 800, 2), (100, 100, 2, 800)]
+TILES = 1500
+TILE_SIZE = 20
+
+
+def level1() -> World:
+    world = World()
+    create_level1(world)
+    return world
+
+
+def arena(balls: int, tiles: int = 0) -> World:
+    world = World()
+    for wall in ARENA:
+        world.add_entity(EntityBuilder().wall(*wall).build())
+    rng = random.Random(0)
+    for _ in range(balls):
+        x, y = rng.uniform(120, 880), rng.uniform(120, 880)
+        world.add_entity(EntityBuilder().ball(x, y).build())
+    for _ in range(tiles):
+        x = rng.randrange(100, 880, TILE_SIZE)
+        y = rng.randrange(100, 880, TILE_SIZE)
+        world.add_entity(EntityBuilder().wall(x, y, TILE_SIZE, TILE_SIZE).build())
+    return world
+
+
+SCENARIOS: dict[str, Callable[[], World]] = {
+    "level1": level1,
+    "balls50": lambda: arena(50),
+    "balls200": lambda: arena(200),
+    "tiles_1ball": lambda: arena(1, TILES),
+    "tiles_50": lambda: arena(50, TILES),
+    "tiles_200": lambda: arena(200, TILES),
+}
+
+
+def ms_per_frame(build: Callable[[], World], profile: str, frames: int) -> float:
+    physics = PhysicsSpace(build(), tuning=profile)
+    physics.populate()
+    rng = random.Random(1)
+    for phys_obj in physics.eid_to_body.values():
+        if phys_obj.body.body_type == pymunk.Body.DYNAMIC:
+            phys_obj.body.velocity = (rng.uniform(-600, 600), rng.uniform(-600, 600))
+    started = time.perf_counter()
+    for _ in range(frames):
+        physics.step(1 / 60)
+    return (time.perf_counter() - started) / frames * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=30)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+    logger.remove()
+
+    profiles = sorted(PROFILES)
+    print(f"ms/frame, median of {args.runs} runs; {os.cpu_count()} CPUs")
+    print(f"| {'scenario':<12} | " + " | ".join(f"{p:>8}" for p in profiles) + " |")
+    print(f"|{'-' * 14}|" + "|".join("-" * 10 for _ in profiles) + "|")
+    for name, build in SCENARIOS.items():
+        cells = []
+        for profile in profiles:
+            runs = [ms_per_frame(build, profile, args.frames) for _ in range(args.runs)]
+            cells.append(f"{statistics.median(runs):>8.2f}")
+        print(f"| {name:<12} | " + " | ".join(cells) + " |")
+
+
+if __name__ == "__main__":
+    main()
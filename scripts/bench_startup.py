@@ -0,0 +1,62 @@
+"""
+Startup-time benchmark: how long a fresh interpreter takes to import a module.
+
+Worker pools pay this once per process, so it is measured the way they see
+it: a new `python -c "import ..."` each run, minus the cost of an empty
+interpreter. Also reports whether the import dragged in pygame.
+
+Usage: python scripts/bench_startup.py [module] [--runs N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+DEFAULT_MODULE = "minigolf.game.engine"
+HEAVY_MODULES = ("pygame", "pygame_gui")
+
+
+def time_command(code: str, runs: int) -> list[float]:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def loaded_heavy_modules(module: str) -> list[str]:
+    code = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    return [m for m in out.strip().split(",") if m]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("module", nargs="?", default=DEFAULT_MODULE)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    baseline = statistics.median(time_command("pass", args.runs))
+    timings = time_command(f"import {args.module}", args.runs)
+    median = statistics.median(timings) - baseline
+    best = min(timings) - baseline
+
+    print(
+        f"import {args.module}: median {median * 1000:.1f} ms, "
+        f"best {best * 1000:.1f} ms over {args.runs} runs "
+        f"(interpreter baseline {baseline * 1000:.1f} ms)"
+    )
+    heavy = loaded_heavy_modules(args.module)
+    print(f"heavy modules loaded: {', '.join(heavy) if heavy else 'none'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,398 @@
+"""
+Rest-position heatmaps: where strokes from a level's ball starts end up.
+
+Strokes are sampled in chunks, each chunk simulated headlessly in a worker
+process and folded into a RestHeatmap as it goes, so memory is one
+(bins, bins) array per chunk in flight however many strokes are run. Chunk
+heatmaps are summed in the parent as they complete.
+
+A stroke comes from a shot policy:
+
+- random: uniform in the same velocity square as RandomController.
+- aimed: straight at the hole, hard enough to stop there on open floor,
+  with Gaussian error on heading and speed. A stand-in for a competent
+  player that ignores walls.
+
+From the merged heatmap a DifficultyReport summarises the level; reports are
+kept in a DifficultyStore keyed by the level's content hash, so renaming or
+moving a level file keeps its scores.
+"""
+
+import json
+import math
+import os
+import random
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from minigolf import serialization
+from minigolf.components import Action, Hole, Position
+from minigolf.consts import DECAY_PER_PX, STOPPING_VELOCITY
+from minigolf.game.rollout import place_ball, simulate_stroke
+from minigolf.observation import Bounds, ObservationEncoder
+from minigolf.parallel import imap_bounded
+from minigolf.systems.physics import PhysicsSpace
+from minigolf.systems.shared_geometry import SharedLevel
+from minigolf.world import World
+
+DEFAULT_BINS = 128
+DEFAULT_CHUNK = 2_000
+RANDOM_MAX_FORCE = 400.0
+# Standard deviations of the aimed policy's heading (rad) and speed (ratio)
+AIM_ANGLE_ERROR = 0.1
+AIM_SPEED_ERROR = 0.15
+
+Point = tuple[float, float]
+ShotPolicy = Callable[[random.Random, Point, Point | None], Action]
+
+
+def random_shot(rng: random.Random, start: Point, hole: Point | None) -> Action:
+    vx = rng.uniform(-RANDOM_MAX_FORCE, RANDOM_MAX_FORCE)
+    vy = rng.uniform(-RANDOM_MAX_FORCE, RANDOM_MAX_FORCE)
+    return Action(type="strike", velocity=(vx, vy))
+
+
+def aimed_shot(rng: random.Random, start: Point, hole: Point | None) -> Action:
+    if hole is None:
+        return random_shot(rng, start, hole)
+    dx, dy = hole[0] - start[0], hole[1] - start[1]
+    angle = math.atan2(dy, dx) + rng.gauss(0.0, AIM_ANGLE_ERROR)
+    speed = math.hypot(dx, dy) * DECAY_PER_PX + STOPPING_VELOCITY
+    speed *= max(0.0, rng.gauss(1.0, AIM_SPEED_ERROR))
+    return Action(
+        type="strike", velocity=(math.cos(angle) * speed, math.sin(angle) * speed)
+    )
+
+
+POLICIES: dict[str, ShotPolicy] = {"random": random_shot, "aimed": aimed_shot}
+
+
+class RestHeatmap:
+    """A fixed-size 2D histogram of rest positions, plus hole captures."""
+
+    def __init__(self, bounds: Bounds, bins: int = DEFAULT_BINS):
+        self.bounds = tuple(float(b) for b in bounds)
+        self.bins = bins
+        self.rests = np.zeros((bins, bins), dtype=np.int64)
+        self.strokes = 0
+        self.captures = 0
+        # Left the level, or came to rest outside the bounds
+        self.escaped = 0
+        x0, y0, x1, y1 = self.bounds
+        self._scale = (bins / max(x1 - x0, 1e-6), bins / max(y1 - y0, 1e-6))
+
+    def add(self, rest: Point, won: bool, escaped: bool = False) -> None:
+        self.strokes += 1
+        if won:
+            self.captures += 1
+            return
+        if escaped:
+            self.escaped += 1
+            return
+        col = int((rest[0] - self.bounds[0]) * self._scale[0])
+        row = int((rest[1] - self.bounds[1]) * self._scale[1])
+        if 0 <= col < self.bins and 0 <= row < self.bins:
+            self.rests[row, col] += 1
+        else:
+            self.escaped += 1
+
+    def merge(self, other: "RestHeatmap") -> None:
+        if (other.bounds, other.bins) != (self.bounds, self.bins):
+            raise ValueError("Cannot merge heatmaps over different grids")
+        self.rests += other.rests
+        self.strokes += other.strokes
+        self.captures += other.captures
+        self.escaped += other.escaped
+
+    @property
+    def capture_rate(self) -> float:
+        return self.captures / self.strokes if self.strokes else 0.0
+
+    def density(self) -> np.ndarray:
+        """Rest probability per bin (captures and escapes excluded)."""
+        total = self.rests.sum()
+        return self.rests / total if total else np.zeros_like(self.rests, float)
+
+    def save(self, path: Path) -> None:
+        np.savez_compressed(
+            path,
+            rests=self.rests,
+            bounds=np.array(self.bounds),
+            counts=np.array([self.strokes, self.captures, self.escaped]),
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "RestHeatmap":
+        with np.load(path) as data:
+            heatmap = cls(tuple(data["bounds"]), bins=data["rests"].shape[0])
+            heatmap.rests[:] = data["rests"]
+            heatmap.strokes, heatmap.captures, heatmap.escaped = (
+                int(n) for n in data["counts"]
+            )
+        return heatmap
+
+
+# Sampling
+
+
+@dataclass(frozen=True)
+class Chunk:
+    ball_eid: int
+    seed: str
+    strokes: int
+
+
+@lru_cache(maxsize=1)
+def _load(
+    level: str, physics_profile: str | None, shared: str | None = None
+) -> tuple[World, PhysicsSpace, dict[int, Point]]:
+    """
+    Per-process level cache, as consecutive chunks are usually of the same
+    level. Ball starts are read up front: strokes move the balls. With
+    `shared`, the level is built from that SharedLevel instead of the file.
+    """
+    if shared is not None:
+        with SharedLevel.attach(shared) as published:
+            world, physics = published.build()
+    else:
+        world = World.from_json(Path(level))
+        physics = PhysicsSpace(world, tuning=physics_profile)
+        physics.populate()
+    starts = {}
+    for ball in world.get_balls():
+        pos = ball.get(Position)
+        starts[ball.id] = (pos.x, pos.y)
+    return world, physics, starts
+
+
+def level_bounds(world: World) -> Bounds:
+    return ObservationEncoder().static(world).bounds
+
+
+def sample_chunk(
+    chunk: Chunk,
+    *,
+    level: str,
+    policy: str,
+    bins: int = DEFAULT_BINS,
+    physics_profile: str | None = None,
+    shared: str | None = None,
+    bounds: Bounds | None = None,
+) -> RestHeatmap:
+    """
+    Simulate one chunk of strokes from a ball's start into a new heatmap.
+    Every other ball is back at its own start for each stroke. A shared
+    level's World has no walls, so its `bounds` must be given.
+    """
+    world, physics, starts = _load(level, physics_profile, shared)
+    shoot = POLICIES[policy]
+    rng = random.Random(chunk.seed)
+    start = starts[chunk.ball_eid]
+    holes = world.all_with(Hole, Position)
+    hole = None
+    if holes:
+        hole_pos = holes[0].get(Position)
+        hole = (hole_pos.x, hole_pos.y)
+
+    heatmap = RestHeatmap(bounds or level_bounds(world), bins)
+    for _ in range(chunk.strokes):
+        # The cached level outlives the chunk: put every ball back, not just
+        # this one, or the other balls sit wherever earlier strokes left them
+        for eid, pos in starts.items():
+            place_ball(physics, eid, pos)
+            physics.release(eid)
+        result = simulate_stroke(
+            world, physics, shoot(rng, start, hole), ball_eid=chunk.ball_eid
+        )
+        heatmap.add(result.rest, result.won, result.escaped)
+    return heatmap
+
+
+def make_chunks(
+    world: World, strokes: int, chunk: int = DEFAULT_CHUNK, seed: int = 0
+) -> Iterator[Chunk]:
+    """Split `strokes` per ball start into chunks with distinct seeds."""
+    for ball in world.get_balls():
+        for i, first in enumerate(range(0, strokes, chunk)):
+            yield Chunk(ball.id, f"{seed}:{ball.id}:{i}", min(chunk, strokes - first))
+
+
+def build_heatmap(
+    level: Path,
+    strokes: int,
+    *,
+    policy: str = "random",
+    bins: int = DEFAULT_BINS,
+    chunk: int = DEFAULT_CHUNK,
+    workers: int = 1,
+    seed: int = 0,
+    physics_profile: str | None = None,
+) -> RestHeatmap:
+    """
+    Run `strokes` strokes from every ball start in `level` and merge them.
+    With several workers the level is published once as a SharedLevel, so
+    each worker builds its walls from shared memory rather than the file.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown shot policy {policy!r}")
+    world = World.from_json(level)
+    heatmap = RestHeatmap(level_bounds(world), bins)
+    with ExitStack() as stack:
+        shared = None
+        if workers > 1:
+            shared = stack.enter_context(SharedLevel.publish(world, physics_profile))
+        run = partial(
+            sample_chunk,
+            level=str(level),
+            policy=policy,
+            bins=bins,
+            physics_profile=physics_profile,
+            shared=shared.name if shared else None,
+            bounds=heatmap.bounds,
+        )
+        chunks = make_chunks(world, strokes, chunk, seed)
+        for part in imap_bounded(run, chunks, workers):
+            heatmap.merge(part)
+    return heatmap
+
+
+# Reports
+
+
+@dataclass(frozen=True)
+class DifficultyReport:
+    level: str
+    level_hash: str
+    policy: str
+    strokes: int
+    captures: int
+    escaped: int
+    capture_rate: float
+    # Fraction of bins any stroke came to rest in
+    coverage: float
+    # Shannon entropy of the rest density over log(bins²): 0 = every stroke
+    # stops in one bin, 1 = uniformly spread
+    spread: float
+    # -log10 of the (smoothed) capture rate: 0 when every stroke sinks, and
+    # each +1 is ten times fewer sinks
+    difficulty: float
+    # Settings the heatmap was built with; a rerun only reuses a report that
+    # matches them (None in reports written before they were recorded)
+    bins: int | None = None
+    seed: int | None = None
+    physics_profile: str | None = None
+
+    @classmethod
+    def from_heatmap(
+        cls,
+        level: str,
+        level_hash: str,
+        policy: str,
+        heatmap: RestHeatmap,
+        *,
+        seed: int | None = None,
+        physics_profile: str | None = None,
+    ) -> "DifficultyReport":
+        density = heatmap.density()
+        nonzero = density[density > 0]
+        entropy = float(-(nonzero * np.log(nonzero)).sum())
+        rate = (heatmap.captures + 1) / (heatmap.strokes + 2)
+        return cls(
+            level=level,
+            level_hash=level_hash,
+            policy=policy,
+            strokes=heatmap.strokes,
+            captures=heatmap.captures,
+            escaped=heatmap.escaped,
+            capture_rate=heatmap.capture_rate,
+            coverage=float((heatmap.rests > 0).mean()),
+            spread=entropy / math.log(heatmap.bins**2),
+            difficulty=-math.log10(rate),
+            bins=heatmap.bins,
+            seed=seed,
+            physics_profile=physics_profile,
+        )
+
+
+class DifficultyStore:
+    """
+    Reports in one JSON file, as {level_hash: {policy: report}}. Rewritten
+    whole (via a temporary file) after every update.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.data: dict[str, dict[str, dict[str, Any]]] = {}
+        if path.exists():
+            self.data = json.loads(path.read_text())
+
+    def get(self, level_hash: str, policy: str) -> DifficultyReport | None:
+        report = self.data.get(level_hash, {}).get(policy)
+        return DifficultyReport(**report) if report is not None else None
+
+    def put(self, report: DifficultyReport) -> None:
+        self.data.setdefault(report.level_hash, {})[report.policy] = asdict(report)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(json.dumps(self.data, indent=2, sort_keys=True))
+        os.replace(tmp, self.path)
+
+
+def analyse_level(
+    level: Path,
+    strokes: int,
+    store: DifficultyStore,
+    out_dir: Path,
+    *,
+    policy: str = "random",
+    resume: bool = True,
+    bins: int = DEFAULT_BINS,
+    seed: int = 0,
+    physics_profile: str | None = None,
+    **kwargs,
+) -> DifficultyReport:
+    """
+    Build (or, with `resume`, reuse) a level's heatmap and report, saving
+    the heatmap as OUT_DIR/<level_hash>.<policy>.npz. A stored report is
+    reused if it has at least `strokes` strokes per ball start and was built
+    with the same bins, seed and physics profile.
+    """
+    world = World.from_json(level)
+    level_hash = serialization.level_hash(world)
+    heatmap_path = out_dir / f"{level_hash}.{policy}.npz"
+    previous = store.get(level_hash, policy)
+    if (
+        resume
+        and previous is not None
+        and previous.strokes >= strokes * len(world.get_balls())
+        and (previous.bins, previous.seed, previous.physics_profile)
+        == (bins, seed, physics_profile)
+        and heatmap_path.exists()
+    ):
+        return previous
+
+    heatmap = build_heatmap(
+        level,
+        strokes,
+        policy=policy,
+        bins=bins,
+        seed=seed,
+        physics_profile=physics_profile,
+        **kwargs,
+    )
+    heatmap.save(heatmap_path)
+    report = DifficultyReport.from_heatmap(
+        str(level),
+        level_hash,
+        policy,
+        heatmap,
+        seed=seed,
+        physics_profile=physics_profile,
+    )
+    store.put(report)
+    return report
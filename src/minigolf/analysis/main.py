@@ -0,0 +1,135 @@
+import os
+import sys
+import time
+from pathlib import Path
+
+import click
+from loguru import logger
+
+from minigolf.analysis.heatmap import (
+    DEFAULT_BINS,
+    DEFAULT_CHUNK,
+    POLICIES,
+    DifficultyStore,
+    RestHeatmap,
+    analyse_level,
+)
+from minigolf.analysis.overlay import save_overlay
+from minigolf.systems.tuning import PROFILES
+from minigolf.world import World
+
+STORE_NAME = "difficulty.json"
+
+
+@click.command()
+@click.argument(
+    "levels",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, path_type=Path),
+)
+@click.option(
+    "-o",
+    "--out-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=Path("analysis"),
+    show_default=True,
+)
+@click.option(
+    "--strokes", default=10_000, show_default=True, help="Strokes per ball start."
+)
+@click.option(
+    "-p",
+    "--policy",
+    "policies",
+    type=click.Choice(sorted(POLICIES)),
+    multiple=True,
+    default=["random", "aimed"],
+    show_default=True,
+)
+@click.option("--bins", default=DEFAULT_BINS, show_default=True)
+@click.option(
+    "--chunk",
+    default=DEFAULT_CHUNK,
+    show_default=True,
+    help="Strokes per unit of work handed to a worker.",
+)
+@click.option("--workers", default=os.cpu_count() or 1, show_default=True)
+@click.option("--seed", default=0, show_default=True)
+@click.option(
+    "--physics-profile",
+    type=click.Choice(sorted(PROFILES)),
+    default="auto",
+    show_default=True,
+)
+@click.option("--png/--no-png", default=True, show_default=True)
+@click.option(
+    "--resume/--no-resume",
+    default=True,
+    show_default=True,
+    help=(
+        "Skip levels already analysed with at least STROKES strokes per ball "
+        "start and the same bins, seed and physics profile."
+    ),
+)
+def cli(
+    levels: tuple[Path, ...],
+    out_dir: Path,
+    strokes: int,
+    policies: tuple[str, ...],
+    bins: int,
+    chunk: int,
+    workers: int,
+    seed: int,
+    physics_profile: str,
+    png: bool,
+    resume: bool,
+) -> None:
+    """
+    Build rest-position heatmaps and difficulty reports for LEVELS (level
+    files or directories of them).
+
+    Writes OUT_DIR/<level hash>.<policy>.npz (and .png), and records every
+    report in OUT_DIR/difficulty.json under the level's hash.
+    """
+    logger.remove()
+    logger.add(sys.stderr, level="INFO")
+
+    paths = [
+        path
+        for arg in levels
+        for path in (sorted(arg.glob("*.json")) if arg.is_dir() else [arg])
+    ]
+    out_dir.mkdir(parents=True, exist_ok=True)
+    store = DifficultyStore(out_dir / STORE_NAME)
+
+    for path in paths:
+        for policy in policies:
+            started = time.perf_counter()
+            report = analyse_level(
+                path,
+                strokes,
+                store,
+                out_dir,
+                policy=policy,
+                resume=resume,
+                bins=bins,
+                chunk=chunk,
+                workers=workers,
+                seed=seed,
+                physics_profile=physics_profile,
+            )
+            stem = f"{report.level_hash}.{policy}"
+            if png:
+                heatmap = RestHeatmap.load(out_dir / f"{stem}.npz")
+                save_overlay(World.from_json(path), heatmap, out_dir / f"{stem}.png")
+            logger.info(
+                f"{path.name} [{policy}] difficulty={report.difficulty:.2f} "
+                f"captures={report.captures}/{report.strokes} "
+                f"spread={report.spread:.2f} "
+                f"({time.perf_counter() - started:.1f}s)"
+            )
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,51 @@
+"""
+Heatmap PNGs: a level drawn as in the game with its rest-position heatmap
+blended on top. Renders onto an off-screen surface, so no display is needed.
+"""
+
+from math import ceil
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pygame
+
+from minigolf.systems.rendering import draw_bg, render_objects
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from minigolf.analysis.heatmap import RestHeatmap
+    from minigolf.world import World
+
+# Colour ramp from sparse to dense rests, and the strongest overlay alpha
+COLD = np.array([40, 90, 255], dtype=np.float32)
+HOT = np.array([255, 60, 20], dtype=np.float32)
+MAX_ALPHA = 200
+
+
+def heat_rgba(heatmap: "RestHeatmap") -> np.ndarray:
+    """(bins, bins, 4) uint8 colours, log-scaled; empty bins are transparent."""
+    counts = np.log1p(heatmap.rests.astype(np.float32))
+    peak = counts.max()
+    level = counts / peak if peak > 0 else counts
+    rgba = np.zeros((*counts.shape, 4), dtype=np.uint8)
+    rgba[..., :3] = (COLD + (HOT - COLD) * level[..., None]).astype(np.uint8)
+    rgba[..., 3] = np.where(counts > 0, 60 + (MAX_ALPHA - 60) * level, 0)
+    return rgba
+
+
+def render_overlay(world: "World", heatmap: "RestHeatmap") -> pygame.Surface:
+    x0, y0, x1, y1 = heatmap.bounds
+    surface = pygame.Surface((ceil(x1), ceil(y1)))
+    draw_bg(surface)
+    render_objects(surface, world)
+
+    rgba = np.ascontiguousarray(heat_rgba(heatmap))
+    heat = pygame.image.frombuffer(rgba.tobytes(), (heatmap.bins,) * 2, "RGBA")
+    size = (max(1, round(x1 - x0)), max(1, round(y1 - y0)))
+    surface.blit(pygame.transform.scale(heat, size), (x0, y0))
+    return surface
+
+
+def save_overlay(world: "World", heatmap: "RestHeatmap", path: "Path") -> None:
+    pygame.image.save(render_overlay(world, heatmap), str(path))
@@ -0,0 +1,97 @@
+import os
+import sys
+import time
+from pathlib import Path
+
+import click
+from loguru import logger
+
+from minigolf.batch.runner import (
+    DEFAULT_MAX_STROKES,
+    ResultWriter,
+    make_jobs,
+    run_jobs,
+)
+from minigolf.systems.tuning import PROFILES
+
+
+@click.command()
+@click.argument(
+    "levels_dir", type=click.Path(exists=True, file_okay=False, path_type=Path)
+)
+@click.option(
+    "-c",
+    "--controller",
+    "controllers",
+    multiple=True,
+    default=["random", "sequence"],
+    show_default=True,
+    help="'random', 'sequence' or a 'package.module:Class' import path.",
+)
+@click.option("--seeds", default=1, show_default=True, help="Games per pairing.")
+@click.option("--workers", default=os.cpu_count() or 1, show_default=True)
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=Path("results.jsonl"),
+    show_default=True,
+    help="Results file; .csv or .jsonl.",
+)
+@click.option("--max-strokes", default=DEFAULT_MAX_STROKES, show_default=True)
+@click.option(
+    "--physics-profile",
+    type=click.Choice(sorted(PROFILES)),
+    default="auto",
+    show_default=True,
+    help="pymunk tuning; 'auto' derives it from each level.",
+)
+@click.option(
+    "--resume/--no-resume",
+    default=True,
+    show_default=True,
+    help="Skip games already recorded in OUTPUT.",
+)
+def cli(
+    levels_dir: Path,
+    controllers: tuple[str, ...],
+    seeds: int,
+    workers: int,
+    output: Path,
+    max_strokes: int,
+    physics_profile: str,
+    resume: bool,
+) -> None:
+    """
+    Play every level in LEVELS_DIR against every controller, headlessly.
+    """
+    logger.remove()
+    logger.add(sys.stderr, level="INFO")
+
+    levels = sorted(levels_dir.glob("*.json"))
+    if not levels:
+        logger.error(f"No level files in {levels_dir}")
+        sys.exit(1)
+
+    jobs = make_jobs(levels, controllers, seeds)
+    writer = ResultWriter(output, resume=resume)
+    logger.info(
+        f"🏌️ {len(jobs)} games ({len(writer.done)} already done) "
+        f"on {workers} workers → {output}"
+    )
+    started = time.perf_counter()
+    try:
+        ran = run_jobs(
+            jobs,
+            writer,
+            workers=workers,
+            max_strokes=max_strokes,
+            physics_profile=physics_profile,
+        )
+    finally:
+        writer.close()
+    logger.info(f"Finished {ran} games in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    cli()
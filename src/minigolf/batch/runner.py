@@ -0,0 +1,217 @@
+"""
+Headless tournament runner: every level × controller × seed, one game each.
+
+Games are independent, so they are farmed out to a process pool and their
+results streamed to disk as soon as each finishes. Rows already present in
+the output file are skipped on restart, which makes long sweeps resumable.
+"""
+
+import csv
+import importlib
+import json
+import random
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass, fields
+from functools import partial
+from pathlib import Path
+
+from minigolf.components import Player
+from minigolf.controllers import Controller, RandomController, SequenceController
+from minigolf.game.rollout import simulate_stroke
+from minigolf.parallel import imap_bounded
+from minigolf.systems.physics import PhysicsSpace
+from minigolf.utils import drop_partial_line
+from minigolf.world import World
+
+CONTROLLERS: dict[str, type] = {
+    "random": RandomController,
+    "sequence": SequenceController,
+}
+DEFAULT_MAX_STROKES = 20
+
+
+@dataclass(frozen=True)
+class Job:
+    level: str
+    controller: str
+    seed: int
+
+    @property
+    def key(self) -> tuple[str, str, int]:
+        return (self.level, self.controller, self.seed)
+
+
+@dataclass(frozen=True)
+class GameResult:
+    level: str
+    controller: str
+    seed: int
+    strokes: int
+    won: bool
+    frames: int
+    wall_time: float
+    rollouts_per_s: float
+
+    @property
+    def key(self) -> tuple[str, str, int]:
+        return (self.level, self.controller, self.seed)
+
+
+def resolve_controller(spec: str) -> Controller:
+    """Build a controller from a short name or a 'package.module:Class' path."""
+    if spec.lower() in CONTROLLERS:
+        return CONTROLLERS[spec.lower()]()
+    module_name, _, attr = spec.partition(":")
+    if not attr:
+        raise ValueError(f"Unknown controller {spec!r}")
+    return getattr(importlib.import_module(module_name), attr)()
+
+
+def make_jobs(
+    levels: Iterable[Path], controllers: Iterable[str], seeds: int
+) -> list[Job]:
+    return [
+        Job(str(level), controller, seed)
+        for level in levels
+        for controller in controllers
+        for seed in range(seeds)
+    ]
+
+
+def play(
+    job: Job,
+    max_strokes: int = DEFAULT_MAX_STROKES,
+    physics_profile: str | None = None,
+) -> GameResult:
+    """Play one game headlessly until the ball is sunk or strokes run out."""
+    random.seed(job.seed)
+    started = time.perf_counter()
+
+    world = World.from_json(Path(job.level))
+    ball = world.get_balls()[0]
+    ball.add(Player(id=0))
+    physics = PhysicsSpace(world, tuning=physics_profile)
+    physics.populate()
+    controller = resolve_controller(job.controller)
+
+    strokes = frames = 0
+    won = False
+    while strokes < max_strokes:
+        action = controller.act(world, 0)
+        if action is None:
+            break
+        result = simulate_stroke(world, physics, action, ball_eid=ball.id)
+        strokes += 1
+        frames += result.frames
+        if result.won:
+            won = True
+            break
+
+    wall_time = time.perf_counter() - started
+    return GameResult(
+        level=job.level,
+        controller=job.controller,
+        seed=job.seed,
+        strokes=strokes,
+        won=won,
+        frames=frames,
+        wall_time=wall_time,
+        rollouts_per_s=strokes / wall_time if wall_time > 0 else 0.0,
+    )
+
+
+class ResultWriter:
+    """
+    Appends GameResults to a .csv or .jsonl file, flushing after every row so
+    that a crash loses at most the game in progress.
+    """
+
+    COLUMNS = [f.name for f in fields(GameResult)]
+
+    def __init__(self, path: Path, resume: bool = True):
+        self.path = path
+        self.csv = path.suffix.lower() == ".csv"
+        if not resume and path.exists():
+            path.unlink()
+        drop_partial_line(path)
+        self.done = self._read_done_keys()
+        fresh = not path.exists() or path.stat().st_size == 0
+        self._file = path.open("a", newline="")
+        self._csv_writer = (
+            csv.DictWriter(self._file, self.COLUMNS) if self.csv else None
+        )
+        if self._csv_writer and fresh:
+            self._csv_writer.writeheader()
+            self._file.flush()
+
+    def write(self, result: GameResult) -> None:
+        row = asdict(result)
+        if self._csv_writer:
+            self._csv_writer.writerow(row)
+        else:
+            self._file.write(json.dumps(row, separators=(",", ":")) + "\n")
+        self._file.flush()
+        self.done.add(result.key)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def _read_done_keys(self) -> set[tuple[str, str, int]]:
+        if not self.path.exists():
+            return set()
+        done: set[tuple[str, str, int]] = set()
+        with self.path.open(newline="") as f:
+            rows: Iterator[dict] = csv.DictReader(f) if self.csv else self._jsonl(f)
+            for row in rows:
+                result = self._parse(row)
+                # Anything short of a full row is a game to re-run
+                if result is not None:
+                    done.add(result.key)
+        return done
+
+    @staticmethod
+    def _parse(row: dict) -> GameResult | None:
+        """The GameResult in a row, or None unless every column is valid."""
+        values = {}
+        for field in fields(GameResult):
+            value = row.get(field.name)
+            if value is None:
+                return None
+            if field.type is bool:
+                # CSV holds "True"/"False", JSON real booleans
+                if value not in (True, False, "True", "False"):
+                    return None
+                value = value in (True, "True")
+            else:
+                try:
+                    value = field.type(value)
+                except (TypeError, ValueError):
+                    return None
+            values[field.name] = value
+        return GameResult(**values)
+
+    @staticmethod
+    def _jsonl(lines: Iterable[str]) -> Iterator[dict]:
+        for line in lines:
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(row, dict):
+                yield row
+
+
+def run_jobs(
+    jobs: list[Job],
+    writer: ResultWriter,
+    workers: int = 1,
+    max_strokes: int = DEFAULT_MAX_STROKES,
+    physics_profile: str | None = None,
+) -> int:
+    """Run every job not already in `writer`; return how many were run."""
+    todo = [job for job in jobs if job.key not in writer.done]
+    run = partial(play, max_strokes=max_strokes, physics_profile=physics_profile)
+    for result in imap_bounded(run, todo, workers):
+        writer.write(result)
+    return len(todo)
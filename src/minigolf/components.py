@@ -1,12 +1,9 @@
 from enum import Enum
 from typing import Annotated, Literal
 
-import pygame
 import pymunk
 from pydantic import BaseModel, Field
 
-from minigolf.utils import add_tuples
-
 
 class Position(BaseModel):
     x: float
@@ -38,11 +35,6 @@ class Rect(BaseModel):
     def pygame_offset(self) -> tuple[float, float]:
         return (0, 0)
 
-    def draw_at(self, screen, pos, colour) -> None:
-        draw_pos = add_tuples((pos.x, pos.y), self.pygame_offset())
-        rect = pygame.Rect(draw_pos[0], draw_pos[1], self.width, self.height)
-        pygame.draw.rect(surface=screen, color=colour, rect=rect)
-
     def to_pymunk(self, body: pymunk.Body) -> pymunk.Poly:
         return pymunk.Poly.create_box(body, (self.width, self.height))
 
@@ -60,10 +52,6 @@ class Circle(BaseModel):
     def pygame_offset(self) -> tuple[float, float]:
         return (0, 0)
 
-    def draw_at(self, screen, pos, colour) -> None:
-        draw_pos = add_tuples((pos.x, pos.y), self.pygame_offset())
-        pygame.draw.circle(screen, colour, draw_pos, self.radius)
-
     def to_pymunk(self, body: pymunk.Body) -> pymunk.Circle:
         return pymunk.Circle(body, self.radius)
 
@@ -103,6 +91,19 @@ class Hole(BaseModel):
     pass
 
 
+class Terrain(BaseModel):
+    """
+    Floor zone covering the entity's Collider rect. Replaces the global floor
+    damping and adds a constant acceleration (e.g. a slope) inside the zone.
+    """
+
+    damping: float
+    acceleration: tuple[float, float] = (0.0, 0.0)
+
+    def __str__(self) -> str:
+        return f"<Terrain damping={self.damping}, acceleration={self.acceleration}>"
+
+
 class Player(BaseModel):
     id: int
 
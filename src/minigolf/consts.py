@@ -1,8 +1,12 @@
+from math import log
+
 from pymunk import Vec2d
 
 DEFAULT_WALL_FRICTION = 0.5
 DEFAULT_ELASTICITY = 0.4
 DEFAULT_FLOOR_FRICTION = 0.8
+# Floor damping as a velocity decay rate: speed falls by this much per px rolled
+DECAY_PER_PX = -log(DEFAULT_FLOOR_FRICTION)
 SIMULATION_SPEED = 3.0
 BALL_MOMENT = 1.0
 DEFAULT_MOVES: list[list[Vec2d | float]] = list(
@@ -14,17 +18,37 @@ DEFAULT_MOVES: list[list[Vec2d | float]] = list(
     ]
 )
 STOPPING_VELOCITY: float = 10.0
+# Headless strokes give up after this many frames (one simulated minute)
+STROKE_MAX_FRAMES: int = 60 * 60
+
+# Terrain zones: velocity fraction kept per second (cf. DEFAULT_FLOOR_FRICTION)
+SAND_DAMPING: float = 0.1
+ICE_DAMPING: float = 0.97
+# Constant acceleration (px/s²) applied by a slope zone, downhill
+SLOPE_ACCELERATION: float = 80.0
+# Side length of the cells terrain zones are rasterised into at load time
+TERRAIN_CELL_SIZE: float = 10.0
 VELOCITY_THRESHOLD: float = 50.0
 
 # Outer proximity gate for enabling the funnel.
-# When the ball is within (hole_radius + ball_radius + FUNNEL_EXTRA),
-# win_condition_system will *attempt* to apply the funnel pull.
+# Each hole carries a sensor of radius (hole_radius + FUNNEL_EXTRA); while a
+# ball overlaps it (i.e. is within hole_radius + ball_radius + FUNNEL_EXTRA),
+# the ball's pymunk velocity_func *attempts* to apply the funnel pull.
 FUNNEL_EXTRA: float = 40.0
 # Inner funnel radius, measured from hole centre.
 # If the ball is within this distance, apply_funnel will apply
 # a distance-proportional pull toward the hole (with damping).
 FUNNEL_RADIUS: float = 40.0
-# How strong the pull is each frame (experiment: 0.05 → 0.5)
+# How strong the pull is per reference frame (experiment: 0.05 → 0.5)
 FUNNEL_STRENGTH: float = 0.15
 # Extra damping to bleed speed when inside funnel (0.9 = gentle, 0.7 = strong)
 FUNNEL_DAMPING: float = 0.85
+# Time span FUNNEL_STRENGTH and FUNNEL_DAMPING are defined over; they are
+# rescaled to the physics substep so results don't depend on the substep count.
+FUNNEL_REFERENCE_DT: float = 1 / 60
+
+# pymunk collision types, used to route contacts to the right handlers.
+BALL_COLLISION_TYPE: int = 1
+WALL_COLLISION_TYPE: int = 2
+HOLE_COLLISION_TYPE: int = 3
+FUNNEL_COLLISION_TYPE: int = 4
@@ -1,5 +1,15 @@
-from .base import Controller
+from .background import BackgroundController
+from .base import AsyncController, Controller, ResettableController
 from .random import RandomController
+from .remote import RemoteController
 from .sequence import SequenceController
 
-__all__ = ["Controller", "RandomController", "SequenceController"]
+__all__ = [
+    "AsyncController",
+    "BackgroundController",
+    "Controller",
+    "RandomController",
+    "RemoteController",
+    "ResettableController",
+    "SequenceController",
+]
@@ -0,0 +1,112 @@
+import copy
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+
+from loguru import logger
+
+from minigolf.components import Action
+from minigolf.controllers.base import (
+    AsyncController,
+    Controller,
+    ResettableController,
+)
+from minigolf.world import World
+
+
+class BackgroundController(Controller):
+    """
+    Runs a slow controller off the frame loop, so act() never blocks.
+
+    The first act() call for a player starts a decision and returns None; the
+    game keeps stepping and polling until the decision is ready. If it takes
+    longer than `deadline` seconds (or raises), `fallback` is played instead:
+    either a fixed Action or a (fast) Controller. The late result is dropped.
+    A decision already running can't be cancelled, so after a miss the
+    default executor is replaced and the stuck decision finishes on its own
+    thread. A passed-in executor is kept: with few workers, later decisions
+    may queue behind the missed one (and miss their deadlines too).
+
+    `inner` is either an AsyncController, which produces its own futures, or
+    a plain Controller run on `executor` (a single worker thread by default;
+    pass a ProcessPoolExecutor for CPU-bound planners, in which case `inner`
+    and the world must be picklable and `inner` state doesn't carry over).
+    With `snapshot`, the controller thinks on a copy of the world so physics
+    can keep mutating the live one.
+    """
+
+    def __init__(
+        self,
+        inner: Controller | AsyncController,
+        deadline: float | None = 1.0,
+        fallback: Action | Controller | None = None,
+        executor: Executor | None = None,
+        snapshot: bool = True,
+    ):
+        self.inner = inner
+        self.deadline = deadline
+        self.fallback = fallback
+        self.snapshot = snapshot
+        self._own_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=1)
+        # player_id -> (pending decision, monotonic start time)
+        self._pending: dict[int, tuple[Future[Action | None], float]] = {}
+
+    def act(self, world: World, player_id: int) -> Action | None:
+        job = self._pending.get(player_id)
+        if job is None:
+            self._pending[player_id] = (
+                self._submit(world, player_id),
+                time.monotonic(),
+            )
+            return None
+
+        future, started = job
+        if future.done():
+            del self._pending[player_id]
+            try:
+                return future.result()
+            except Exception as exc:
+                logger.error(f"[BgCtrl] Player {player_id} controller failed: {exc}")
+                return self._fall_back(world, player_id)
+
+        if self.deadline is not None and time.monotonic() - started >= self.deadline:
+            del self._pending[player_id]
+            if not future.cancel() and self._own_executor:
+                # Still running: don't let the next decision queue behind it
+                self._executor.shutdown(wait=False)
+                self._executor = ThreadPoolExecutor(max_workers=1)
+            logger.warning(
+                f"[BgCtrl] Player {player_id} missed its {self.deadline}s deadline"
+            )
+            return self._fall_back(world, player_id)
+
+        return None
+
+    def pending(self, player_id: int) -> bool:
+        return player_id in self._pending
+
+    def reset(self) -> None:
+        """Drop decisions made for the previous hole, and reset `inner`."""
+        for future, _ in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        if isinstance(self.inner, ResettableController):
+            self.inner.reset()
+
+    def close(self) -> None:
+        for future, _ in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        if self._own_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, world: World, player_id: int) -> Future[Action | None]:
+        view = copy.deepcopy(world) if self.snapshot else world
+        if isinstance(self.inner, AsyncController):
+            return self.inner.submit(view, player_id)
+        return self._executor.submit(self.inner.act, view, player_id)
+
+    def _fall_back(self, world: World, player_id: int) -> Action | None:
+        if self.fallback is None or isinstance(self.fallback, Action):
+            return self.fallback
+        return self.fallback.act(world, player_id)
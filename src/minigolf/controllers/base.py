@@ -1,4 +1,5 @@
-from typing import Protocol
+from concurrent.futures import Future
+from typing import Protocol, runtime_checkable
 
 from minigolf.components import Action
 from minigolf.world import World
@@ -6,3 +7,17 @@ from minigolf.world import World
 
 class Controller(Protocol):
     def act(self, world: World, player_id: int) -> Action | None: ...
+
+
+@runtime_checkable
+class AsyncController(Protocol):
+    """A controller that decides off the frame loop and hands back a future."""
+
+    def submit(self, world: World, player_id: int) -> Future[Action | None]: ...
+
+
+@runtime_checkable
+class ResettableController(Protocol):
+    """A controller with per-hole state (e.g. a move index) to clear between holes."""
+
+    def reset(self) -> None: ...
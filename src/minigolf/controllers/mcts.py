@@ -0,0 +1,460 @@
+"""
+Monte Carlo Tree Search over discretized strikes.
+
+Each node is a ball position; each edge a strike from a fixed set
+(`directions` headings × `reaches`, the distance a strike rolls on open
+floor). Physics is deterministic, so an edge is simulated once, with a real
+headless stroke, when it is expanded; those strokes are the search's
+rollouts.
+
+- Values are stroke-count returns: sinking the ball is worth 1, discounted
+  by `discount` per extra stroke. A leaf that hasn't sunk is scored by its
+  walking distance to the hole around the walls (BFS over the observation
+  wall grid), scaled below any win, so the search plans around blockades
+  instead of aiming straight at the hole.
+- Untried strikes are expanded best-first, as ranked by the analytic
+  trajectory predictor, with progressive widening so deep lines get
+  explored before every one of the root's strikes has been tried.
+- Leaf-parallel: each iteration selects up to `workers` leaves (virtual
+  loss keeps them apart) and simulates their strokes in a process pool,
+  every worker building its own copy of the level from one SharedLevel.
+- Tree reuse: after a move, the subtree under the strike played is kept.
+  If the ball comes to rest where that node predicted, the next search
+  starts from it with its statistics intact.
+"""
+
+import math
+import random
+import time
+import weakref
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from minigolf import serialization
+from minigolf.components import Action, Collider, Position
+from minigolf.consts import DECAY_PER_PX, STOPPING_VELOCITY
+from minigolf.controllers.base import Controller
+from minigolf.game.rollout import place_ball, simulate_stroke
+from minigolf.game.trajectory import predict_trajectory
+from minigolf.observation import ObservationEncoder
+from minigolf.systems.physics import PhysicsSpace
+from minigolf.systems.shared_geometry import SharedLevel
+from minigolf.systems.turn import get_player_ball
+from minigolf.world import World
+
+DEFAULT_DIRECTIONS = 16
+# Open-floor roll distances (px) of the strike speeds searched
+DEFAULT_REACHES: tuple[float, ...] = (100.0, 250.0, 450.0, 700.0)
+DEFAULT_ROLLOUTS = 200
+DEFAULT_DISCOUNT = 0.9
+DEFAULT_EXPLORATION = 0.5
+DEFAULT_MAX_DEPTH = 6
+# Leaf value at the hole's doorstep; a win is always worth more
+DISTANCE_WEIGHT = 0.5
+# Children allowed per node: WIDENING * visits ** WIDENING_EXPONENT (+1)
+WIDENING = 2.0
+WIDENING_EXPONENT = 0.5
+# How far (px) the ball may end up from the kept node's position
+REUSE_TOLERANCE = 2.0
+VIRTUAL_LOSS = 1
+# Selections in a row that only re-score terminal nodes before a search
+# stops: selection keeps coming back to lines that are already settled
+STALL_LIMIT = 64
+
+
+@dataclass(eq=False)
+class Node:
+    pos: tuple[float, float]
+    won: bool = False
+    # Strokes below the node the tree was built from; bounds the search
+    depth: int = 0
+    children: dict[int, "Node"] = field(default_factory=dict)
+    untried: list[int] | None = None
+    visits: int = 0
+    value: float = 0.0
+    # Pending virtual visits from in-flight strokes
+    pending: int = 0
+
+    def size(self) -> int:
+        return 1 + sum(child.size() for child in self.children.values())
+
+    def height(self) -> int:
+        return 1 + max((c.height() for c in self.children.values()), default=0)
+
+
+@dataclass(frozen=True)
+class SearchStats:
+    tree_size: int
+    # Nodes carried over from the previous move's tree
+    reused: int
+    # Strokes simulated; the budget counts these
+    rollouts: int
+    # Selections that ended on a terminal node and were re-scored without
+    # simulating anything
+    revisits: int
+    elapsed: float
+    height: int
+
+    @property
+    def rollouts_per_s(self) -> float:
+        return self.rollouts / self.elapsed if self.elapsed > 0 else 0.0
+
+
+# Stroke simulation, in this process or in worker processes
+
+_worker: "StrokeSimulator | None" = None
+
+
+class StrokeSimulator:
+    """A private copy of a level that strokes can be replayed on."""
+
+    def __init__(self, world: World, physics: PhysicsSpace, ball_eid: int):
+        self.world = world
+        self.physics = physics
+        self.ball_eid = ball_eid
+
+    @classmethod
+    def from_bytes(cls, level: bytes, ball_eid: int) -> "StrokeSimulator":
+        world = serialization.loads(level)
+        physics = PhysicsSpace(world)
+        physics.populate()
+        return cls(world, physics, ball_eid)
+
+    @classmethod
+    def from_shared(cls, name: str, ball_eid: int) -> "StrokeSimulator":
+        """From a SharedLevel; its World has no walls, only its physics does."""
+        with SharedLevel.attach(name) as published:
+            world, physics = published.build()
+        return cls(world, physics, ball_eid)
+
+    def run(
+        self, start: tuple[float, float], velocity: tuple[float, float]
+    ) -> tuple[tuple[float, float], bool]:
+        place_ball(self.physics, self.ball_eid, start)
+        self.physics.release(self.ball_eid)
+        result = simulate_stroke(
+            self.world,
+            self.physics,
+            Action(type="strike", velocity=velocity),
+            ball_eid=self.ball_eid,
+        )
+        return result.rest, result.won
+
+
+def _init_worker(shared: str, ball_eid: int) -> None:
+    global _worker
+    _worker = StrokeSimulator.from_shared(shared, ball_eid)
+
+
+def _run_in_worker(job: tuple[tuple[float, float], tuple[float, float]]):
+    return _worker.run(*job)
+
+
+class MCTSController(Controller):
+    def __init__(
+        self,
+        *,
+        directions: int = DEFAULT_DIRECTIONS,
+        reaches: tuple[float, ...] = DEFAULT_REACHES,
+        rollouts: int | None = DEFAULT_ROLLOUTS,
+        time_limit: float | None = None,
+        workers: int = 1,
+        discount: float = DEFAULT_DISCOUNT,
+        exploration: float = DEFAULT_EXPLORATION,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        seed: int | None = None,
+    ):
+        """
+        The per-move budget is `rollouts` simulated strokes and/or
+        `time_limit` seconds, whichever runs out first.
+        """
+        if rollouts is None and time_limit is None:
+            raise ValueError("MCTS needs a rollout budget or a time limit")
+        self.velocities = [
+            (math.cos(angle) * speed, math.sin(angle) * speed)
+            for angle in (2 * math.pi * i / directions for i in range(directions))
+            for speed in (reach * DECAY_PER_PX + STOPPING_VELOCITY for reach in reaches)
+        ]
+        self.rollouts = rollouts
+        self.time_limit = time_limit
+        self.workers = workers
+        self.discount = discount
+        self.exploration = exploration
+        self.max_depth = max_depth
+        self.rng = random.Random(seed)
+
+        self.root: Node | None = None
+        self.stats: SearchStats | None = None
+        self._played: int | None = None
+        self._world: weakref.ref[World] | None = None
+        self._executor: ProcessPoolExecutor | None = None
+        self._shared: SharedLevel | None = None
+
+    # Controller
+
+    def act(self, world: World, player_id: int) -> Action | None:
+        ball = get_player_ball(world, player_id)
+        if self._world is None or self._world() is not world:
+            self._prepare(world, ball.id)
+        pos = ball.get(Position)
+        root, reused = self._reroot((pos.x, pos.y))
+
+        started = time.perf_counter()
+        rollouts, revisits = self._search(root, started)
+        self.stats = SearchStats(
+            tree_size=root.size(),
+            reused=reused,
+            rollouts=rollouts,
+            revisits=revisits,
+            elapsed=time.perf_counter() - started,
+            height=root.height(),
+        )
+        if not root.children:
+            return None
+
+        self._played = self._best(root)
+        self.root = root
+        vx, vy = self.velocities[self._played]
+        return Action(type="strike", velocity=(vx, vy))
+
+    def close(self) -> None:
+        if self._executor is not None:
+            # Waits, so no worker is still attaching to the shared level
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
+
+    # Setup
+
+    def _prepare(self, world: World, ball_eid: int) -> None:
+        """Build the planning copy of a (new) level and its distance field."""
+        self.close()
+        self._world = weakref.ref(world)
+        self.root = self._played = None
+        self.simulator = StrokeSimulator.from_bytes(
+            serialization.dumps(world), ball_eid
+        )
+        if self.workers > 1:
+            # Published once for every worker; the planning copy keeps its
+            # walls for the distance field
+            self._shared = SharedLevel.publish(self.simulator.world)
+            self._executor = ProcessPoolExecutor(
+                self.workers,
+                initializer=_init_worker,
+                initargs=(self._shared.name, ball_eid),
+            )
+
+        planning = self.simulator.world
+        ball = planning.get_entity(ball_eid)
+        self.ball_radius = getattr(ball.get(Collider).shape, "radius", 0.0)
+        self.hole = self.capture_radius = None
+        self.layer = ObservationEncoder().static(planning)
+        if self.layer.hole is not None:
+            hole_pos = self.layer.hole.get(Position)
+            self.hole = (hole_pos.x, hole_pos.y)
+            shape = self.layer.hole.get(Collider).shape
+            self.capture_radius = getattr(shape, "radius", 0.0) + self.ball_radius
+        self.distances = _distance_field(self.layer.walls, self._cell(self.hole))
+        self.max_distance = 1.0
+        if self.distances is not None:
+            finite = self.distances[np.isfinite(self.distances)]
+            self.max_distance = float(finite.max()) + 1.0
+
+    def _reroot(self, pos: tuple[float, float]) -> tuple[Node, int]:
+        """The kept subtree if the ball is where it predicted, else a new root."""
+        if self.root is not None and self._played is not None:
+            child = self.root.children.get(self._played)
+            if child is not None and math.dist(child.pos, pos) <= REUSE_TOLERANCE:
+                _rebase(child, 0)
+                return child, child.size()
+        return Node(pos), 0
+
+    # Search
+
+    def _search(self, root: Node, started: float) -> tuple[int, int]:
+        """
+        Run iterations until the budget is spent, or until selection only
+        lands on terminals that are already scored (the whole tree, or
+        STALL_LIMIT selections in a row); returns the strokes simulated and
+        the terminal revisits.
+        """
+        done = revisits = stalled = 0
+        while self.rollouts is None or done < self.rollouts:
+            if self.time_limit is not None:
+                if time.perf_counter() - started >= self.time_limit:
+                    break
+            size = max(1, self.workers)
+            if self.rollouts is not None:
+                size = min(size, self.rollouts - done)
+            batch, revisited = self._select_batch(root, size)
+            revisits += revisited
+            stalled = 0 if batch else stalled + revisited
+            if not batch and (
+                stalled >= STALL_LIMIT or _exhausted(root, self.max_depth)
+            ):
+                break
+            jobs = [(path[-1].pos, self.velocities[a]) for path, a in batch]
+            for (path, action), (rest, won) in zip(batch, self._simulate(jobs)):
+                parent = path[-1]
+                child = Node(rest, won=won, depth=parent.depth + 1)
+                parent.children[action] = child
+                path.append(child)
+                self._backpropagate(path, self._leaf_value(child))
+            done += len(batch)
+        return done, revisits
+
+    def _select_batch(
+        self, root: Node, size: int
+    ) -> tuple[list[tuple[list[Node], int]], int]:
+        """
+        Up to `size` (path, strike) leaves to expand, and how many selections
+        ended on terminal nodes instead (re-scored on the spot).
+        """
+        batch: list[tuple[list[Node], int]] = []
+        revisited = 0
+        for _ in range(size):
+            path, action = self._select(root)
+            if action is None:
+                self._backpropagate(path, self._leaf_value(path[-1]))
+                revisited += 1
+                continue
+            for node in path:
+                node.pending += VIRTUAL_LOSS
+            path[-1].untried.remove(action)
+            batch.append((path, action))
+        for path, _ in batch:
+            for node in path:
+                node.pending -= VIRTUAL_LOSS
+        return batch, revisited
+
+    def _select(self, root: Node) -> tuple[list[Node], int | None]:
+        """
+        Walk down by UCB to a node that may grow a child, and the strike to
+        grow. The strike is None at a terminal node (sunk, or at max depth),
+        or when the whole tree below `root` has been expanded.
+        """
+        path = [root]
+        node = root
+        while True:
+            if node.won or node.depth >= self.max_depth:
+                return path, None
+            if node.untried is None:
+                node.untried = self._rank(node)
+            visits = node.visits + node.pending
+            allowed = 1 + int(WIDENING * visits**WIDENING_EXPONENT)
+            if node.untried and len(node.children) < allowed:
+                return path, node.untried[-1]
+            if not node.children:
+                return path, None
+            node = max(node.children.values(), key=lambda c: self._ucb(node, c))
+            path.append(node)
+
+    def _ucb(self, parent: Node, child: Node) -> float:
+        visits = child.visits + child.pending
+        if visits == 0:
+            return math.inf
+        mean = child.value / visits
+        total = parent.visits + parent.pending
+        return mean + self.exploration * math.sqrt(math.log(total + 1) / visits)
+
+    def _rank(self, node: Node) -> list[int]:
+        """Strike indices, most promising last (expanded first)."""
+        scores = []
+        for i, velocity in enumerate(self.velocities):
+            trajectory = predict_trajectory(
+                self.simulator.physics,
+                node.pos,
+                velocity,
+                hole=self.hole,
+                capture_radius=self.capture_radius or 0.0,
+                ball_radius=self.ball_radius,
+            )
+            score = 2.0 if trajectory.sinks else self._progress(trajectory.rest)
+            scores.append((score, self.rng.random(), i))
+        return [i for _, _, i in sorted(scores)]
+
+    def _simulate(self, jobs):
+        if self._executor is None:
+            return [self.simulator.run(*job) for job in jobs]
+        return list(self._executor.map(_run_in_worker, jobs))
+
+    def _backpropagate(self, path: list[Node], value: float) -> None:
+        for node in reversed(path):
+            node.visits += 1
+            node.value += value
+            value *= self.discount
+
+    def _leaf_value(self, node: Node) -> float:
+        if node.won:
+            return 1.0
+        return DISTANCE_WEIGHT * self.discount * self._progress(node.pos)
+
+    def _progress(self, pos: tuple[float, float]) -> float:
+        """1 at the hole, 0 at the farthest reachable point (or cut off)."""
+        cell = self._cell(pos)
+        if cell is None or self.distances is None:
+            return 0.0
+        # A ball resting against a wall can sit in the wall's cell
+        r, c = cell
+        d = self.distances[max(r - 1, 0) : r + 2, max(c - 1, 0) : c + 2].min()
+        if not np.isfinite(d):
+            return 0.0
+        return 1.0 - d / self.max_distance
+
+    def _cell(self, pos: tuple[float, float] | None) -> tuple[int, int] | None:
+        return None if pos is None else self.layer.cell(*pos)
+
+    def _best(self, root: Node) -> int:
+        """Most visited strike, preferring any that sinks the ball outright."""
+        for action, child in root.children.items():
+            if child.won:
+                return action
+        return max(
+            root.children,
+            key=lambda a: (root.children[a].visits, root.children[a].value),
+        )
+
+
+def _exhausted(node: Node, max_depth: int) -> bool:
+    """True if no strike is left to try anywhere below `node`."""
+    if node.won or node.depth >= max_depth:
+        return True
+    if node.untried is None or node.untried:
+        return False
+    return all(_exhausted(child, max_depth) for child in node.children.values())
+
+
+def _rebase(node: Node, depth: int) -> None:
+    node.depth = depth
+    for child in node.children.values():
+        _rebase(child, depth + 1)
+
+
+def _distance_field(
+    walls: np.ndarray, goal: tuple[int, int] | None
+) -> np.ndarray | None:
+    """Walking distance in cells from every free cell to `goal` (BFS)."""
+    if goal is None:
+        return None
+    n_rows, n_cols = walls.shape
+    distances = np.full(walls.shape, np.inf)
+    distances[goal] = 0.0
+    queue = deque([goal])
+    while queue:
+        r, c = queue.popleft()
+        d = distances[r, c] + 1.0
+        for nr, nc in ((r + 1, c), (r - 1, c), (r, c + 1), (r, c - 1)):
+            if (
+                0 <= nr < n_rows
+                and 0 <= nc < n_cols
+                and not walls[nr, nc]
+                and distances[nr, nc] == np.inf
+            ):
+                distances[nr, nc] = d
+                queue.append((nr, nc))
+    return distances
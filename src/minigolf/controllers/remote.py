@@ -0,0 +1,75 @@
+import os
+import socket
+from collections.abc import Callable
+from pathlib import Path
+
+from minigolf.components import Action
+from minigolf.controllers.base import Controller
+from minigolf.remote.protocol import (
+    RESPONSE,
+    Observation,
+    basic_observation,
+    decode_response,
+    encode_request,
+)
+from minigolf.world import World
+
+
+class RemoteController(Controller):
+    """
+    Asks an out-of-process policy server (see minigolf.remote) for each move.
+
+    act() blocks until the server replies; wrap it in a BackgroundController
+    to keep the frame loop running meanwhile.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        observe: Callable[[World, int], Observation] = basic_observation,
+        timeout: float | None = 10.0,
+    ):
+        self.path = Path(path)
+        self.observe = observe
+        self.timeout = timeout
+        self._sock: socket.socket | None = None
+        self._next_id = 0
+
+    def act(self, world: World, player_id: int) -> Action | None:
+        """
+        On any failure (timeout included) the connection is dropped, so a
+        late reply can't be read as the answer to the next request; the next
+        call reconnects.
+        """
+        sock = self._connect()
+        request_id = self._next_id
+        self._next_id = (self._next_id + 1) & 0xFFFFFFFF
+        try:
+            sock.sendall(encode_request(request_id, self.observe(world, player_id)))
+            data = bytearray()
+            while len(data) < RESPONSE.size:
+                chunk = sock.recv(RESPONSE.size - len(data))
+                if not chunk:
+                    raise ConnectionError("Policy server closed the connection")
+                data += chunk
+        except OSError:
+            self.close()
+            raise
+        reply_id, action = decode_response(bytes(data))
+        if reply_id != request_id:
+            self.close()
+            raise ConnectionError(f"Expected reply {request_id}, got {reply_id}")
+        return action
+
+    def close(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def _connect(self) -> socket.socket:
+        if self._sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            sock.connect(os.fspath(self.path))
+            self._sock = sock
+        return self._sock
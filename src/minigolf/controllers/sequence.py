@@ -1,7 +1,6 @@
 from typing import TYPE_CHECKING
 
-from loguru import logger
-
+from minigolf import trace
 from minigolf.components import Action
 from minigolf.consts import DEFAULT_MOVES
 from minigolf.controllers import Controller
@@ -23,9 +22,14 @@ class SequenceController(Controller):
             return None
         v, av = self._moves[self._i]
         self._i += 1
-        logger.debug(f"[SeqCtrl] Player {player_id} move {self._i}")
+        if trace.level >= trace.DEBUG:
+            trace.record(trace.Event.SEQUENCE_MOVE, player_id, self._i)
         return Action(
             type="strike",
             velocity=(float(v.x), float(v.y)),
             angular_velocity=float(av),
         )
+
+    def reset(self) -> None:
+        """Play the sequence from the start again, e.g. on the next hole."""
+        self._i = 0
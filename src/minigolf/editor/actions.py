@@ -8,7 +8,7 @@ import pygame
 import pygame_gui
 from loguru import logger
 
-from minigolf.editor.consts import TOOL_KEYS, Tool
+from minigolf.editor.consts import TERRAIN_TOOLS, TOOL_KEYS, Tool
 from minigolf.editor.files import get_filename
 from minigolf.editor.grid import build_entity, get_entity_at, snap_to_grid
 from minigolf.systems.physics import PhysicsSpace
@@ -197,14 +197,19 @@ def handle_drag(state: State) -> None:
 
     mx, my = pygame.mouse.get_pos()
     gx, gy = snap_to_grid(mx, my)
-    existing = get_entity_at(state.world, gx, gy)
 
     if state.current_tool == Tool.ERASER:
+        # Erase what sits on top first, then the terrain underneath
+        existing = get_entity_at(state.world, gx, gy) or get_entity_at(
+            state.world, gx, gy, terrain=True
+        )
         if existing:
             _snapshot_undo(state)
             del state.world.entities[existing.id]
             state.physics.remove_entity(existing)
     else:
+        terrain = state.current_tool in TERRAIN_TOOLS
+        existing = get_entity_at(state.world, gx, gy, terrain=terrain)
         if not existing:
             entity = build_entity(state.current_tool, gx, gy)
             if entity:
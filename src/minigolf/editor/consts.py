@@ -8,6 +8,12 @@ class Tool(str, Enum):
     BALL = "ball"
     HOLE = "hole"
     ERASER = "eraser"
+    SAND = "sand"
+    ICE = "ice"
+    SLOPE = "slope"
+
+
+TERRAIN_TOOLS: frozenset[Tool] = frozenset({Tool.SAND, Tool.ICE, Tool.SLOPE})
 
 
 TOOL_KEYS: dict[int, Tool] = {
@@ -15,6 +21,9 @@ TOOL_KEYS: dict[int, Tool] = {
     pygame.K_2: Tool.BALL,
     pygame.K_3: Tool.HOLE,
     pygame.K_4: Tool.ERASER,
+    pygame.K_5: Tool.SAND,
+    pygame.K_6: Tool.ICE,
+    pygame.K_7: Tool.SLOPE,
 }
 
 TOOL_NAMES: dict[Tool, str] = {
@@ -22,6 +31,9 @@ TOOL_NAMES: dict[Tool, str] = {
     Tool.BALL: "BALL (2)",
     Tool.HOLE: "HOLE (3)",
     Tool.ERASER: "ERASER (4)",
+    Tool.SAND: "SAND (5)",
+    Tool.ICE: "ICE (6)",
+    Tool.SLOPE: "SLOPE (7)",
 }
 
 TOOL_PREVIEW_COLOURS: dict[Tool, tuple[int, int, int]] = {
@@ -29,4 +41,7 @@ TOOL_PREVIEW_COLOURS: dict[Tool, tuple[int, int, int]] = {
     Tool.BALL: (255, 255, 255),
     Tool.HOLE: (91, 166, 0),
     Tool.ERASER: (255, 100, 100),
+    Tool.SAND: (194, 178, 128),
+    Tool.ICE: (170, 220, 255),
+    Tool.SLOPE: (60, 110, 60),
 }
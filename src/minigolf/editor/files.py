@@ -6,13 +6,18 @@ from pygame_gui.elements import UITextEntryLine
 # Assuming minigolf.editor.files
 PROJ_DIR = Path(__file__).resolve().parents[3]
 LEVELS_DIR = PROJ_DIR / "levels"
-LEVELS_DIR.mkdir(exist_ok=True)
 
-logger.info(f"Levels directory: {LEVELS_DIR}")
+
+def levels_dir() -> Path:
+    """Return LEVELS_DIR, creating it on first use."""
+    if not LEVELS_DIR.exists():
+        LEVELS_DIR.mkdir()
+        logger.info(f"Created levels directory: {LEVELS_DIR}")
+    return LEVELS_DIR
 
 
 def get_filename(entry: UITextEntryLine) -> Path:
     raw = entry.get_text().strip()
     if not raw.endswith(".json"):
         raw += ".json"
-    return LEVELS_DIR / raw
+    return levels_dir() / raw
@@ -11,12 +11,16 @@ def snap_to_grid(x: int, y: int) -> tuple[int, int]:
     return (x // TILE_SIZE) * TILE_SIZE, (y // TILE_SIZE) * TILE_SIZE
 
 
-def get_entity_at(world: World, x: int, y: int) -> Entity | None:
+def get_entity_at(world: World, x: int, y: int, terrain: bool = False) -> Entity | None:
+    """
+    Return the entity occupying the grid cell at (x, y).
+    Terrain zones lie under other entities, so they are looked up separately.
+    """
     gx, gy = snap_to_grid(x, y)
 
     for entity in world.entities.values():
         pos = entity.get(components.Position)
-        if not pos:
+        if not pos or entity.has(components.Terrain) != terrain:
             continue
         ex, ey = snap_to_grid(pos.x, pos.y)
         if (gx, gy) == (ex, ey):
@@ -33,12 +37,18 @@ def build_entity(tool: Tool, x: int, y: int) -> Entity | None:
 
     match tool:
         case Tool.WALL:
-            # Walls align with grid cells (top-left origin)
+            # Walls and terrain align with grid cells (top-left origin)
             return builder.wall(gx, gy, TILE_SIZE, TILE_SIZE).build()
         case Tool.BALL:
             e = builder.ball(0, 0).build()
         case Tool.HOLE:
             e = builder.hole(0, 0).build()
+        case Tool.SAND:
+            return builder.sand(gx, gy, TILE_SIZE, TILE_SIZE).build()
+        case Tool.ICE:
+            return builder.ice(gx, gy, TILE_SIZE, TILE_SIZE).build()
+        case Tool.SLOPE:
+            return builder.slope(gx, gy, TILE_SIZE, TILE_SIZE).build()
         case _:
             return None
 
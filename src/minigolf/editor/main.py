@@ -1,3 +1,4 @@
+import atexit
 import sys
 
 import click
@@ -5,13 +6,18 @@ import pygame
 from loguru import logger
 from pygame import Surface
 
+from minigolf import memory
 from minigolf.editor.actions import handle_drag, handle_event
 from minigolf.editor.draw import draw_everything
 from minigolf.editor.state import State
 from minigolf.editor.ui import setup_ui
 
 
-def main_loop() -> None:
+def log_memory(state: State) -> None:
+    memory.log_report(world=state.world, physics=state.physics, editor=state)
+
+
+def main_loop(memory_report: bool = False) -> None:
     pygame.init()
     screen: Surface = pygame.display.set_mode(
         (State.SCREEN_WIDTH, State.SCREEN_HEIGHT), vsync=1
@@ -21,6 +27,8 @@ def main_loop() -> None:
 
     state = State(screen)
     setup_ui(state)
+    if memory_report:
+        atexit.register(log_memory, state)
     logger.info("Editor initialised.")
 
     running = True
@@ -47,10 +55,18 @@ def main_loop() -> None:
 
 @click.command()
 @click.option("--debug", is_flag=True, help="Run in debug mode.")
-def cli(debug: bool) -> None:
+@click.option(
+    "--memory",
+    "memory_report",
+    is_flag=True,
+    help="Trace allocations and log a memory report, with undo/redo sizes, on exit.",
+)
+def cli(debug: bool, memory_report: bool) -> None:
     if debug:
         logger.info("Debug mode enabled.")
-    main_loop()
+    if memory_report:
+        memory.start()
+    main_loop(memory_report)
 
 
 if __name__ == "__main__":
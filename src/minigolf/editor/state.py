@@ -96,8 +96,5 @@ class State:
             state.undo_stack.append(copy.deepcopy(state.world.entities))
             state.redo_stack.clear()
             state.world.entities.clear()
-            state.physics.eid_to_body.clear()
-            state.physics.space.remove(
-                *state.physics.space.bodies, *state.physics.space.shapes
-            )
+            state.physics.clear()
             logger.info("World cleared and physics reset")
@@ -32,7 +32,7 @@ def setup_ui(state: State) -> None:
     )
 
     panel = UIPanel(
-        relative_rect=pygame.Rect(state.CANVAS_WIDTH + 10, 180, 230, 140),
+        relative_rect=pygame.Rect(state.CANVAS_WIDTH + 10, 180, 230, 35 * len(Tool)),
         manager=state.manager,
     )
 
@@ -45,7 +45,9 @@ def setup_ui(state: State) -> None:
         )
 
     UIButton(
-        relative_rect=pygame.Rect(state.CANVAS_WIDTH + 10, 330, 230, 30),
+        relative_rect=pygame.Rect(
+            state.CANVAS_WIDTH + 10, 190 + 35 * len(Tool), 230, 30
+        ),
         text="🧹 Clear",
         manager=state.manager,
     )
@@ -3,25 +3,61 @@ from typing import TypeVar, cast
 import pymunk
 from pydantic import BaseModel
 
-from minigolf.components import Collider, PhysicsBody, Position, Velocity
-from minigolf.consts import BALL_MOMENT, DEFAULT_ELASTICITY, DEFAULT_WALL_FRICTION
+from minigolf.components import (
+    Circle,
+    Collider,
+    Hole,
+    PhysicsBody,
+    Position,
+    Velocity,
+)
+from minigolf.consts import (
+    BALL_COLLISION_TYPE,
+    BALL_MOMENT,
+    DEFAULT_ELASTICITY,
+    DEFAULT_WALL_FRICTION,
+    FUNNEL_COLLISION_TYPE,
+    FUNNEL_EXTRA,
+    HOLE_COLLISION_TYPE,
+    WALL_COLLISION_TYPE,
+)
 from minigolf.utils import from_pymunk_position, to_pymunk_position
 
 T = TypeVar("T", bound=BaseModel)
 
 
 class PhysicsObject:
-    def __init__(self, entity: "Entity", body: pymunk.Body, shape: pymunk.Shape):
+    def __init__(
+        self,
+        entity: "Entity",
+        body: pymunk.Body,
+        shape: pymunk.Shape,
+        *extra_shapes: pymunk.Shape,
+        offset: tuple[float, float] | None = None,
+    ):
         self.entity = entity
         self.body = body
         self.shape = shape
+        self.extra_shapes = extra_shapes
+        # The entity's Position is the body position minus this
+        if offset is None:
+            offset = entity.get(Collider).shape.pymunk_offset()
+        self.offset = offset
+
+    @property
+    def shapes(self) -> tuple[pymunk.Shape, ...]:
+        return (self.shape, *self.extra_shapes)
 
     @classmethod
     def from_entity(cls, entity: "Entity") -> "PhysicsObject | None":
         pos = entity.get(Position)
         col = entity.get(Collider)
+        if pos is None or col is None:
+            return None
+        if entity.has(Hole):
+            return cls.hole_sensor(entity, pos, col)
         bodydef = entity.get(PhysicsBody)
-        if pos is None or col is None or bodydef is None:
+        if bodydef is None:
             return None
         if not bodydef.anchored:
             vel = entity.get(Velocity)
@@ -37,11 +73,36 @@ class PhysicsObject:
 
         shape.elasticity = DEFAULT_ELASTICITY
         shape.friction = DEFAULT_WALL_FRICTION
+        shape.collision_type = (
+            WALL_COLLISION_TYPE if bodydef.anchored else BALL_COLLISION_TYPE
+        )
 
         return cls(entity, body, shape)
 
+    @classmethod
+    def hole_sensor(
+        cls, entity: "Entity", pos: Position, col: Collider
+    ) -> "PhysicsObject":
+        """
+        Holes are static sensors: balls pass over them without any collision
+        response, but pymunk reports the overlap on every substep.
+        Circular holes get a second, wider sensor gating the funnel pull.
+        """
+        body = pymunk.Body(body_type=pymunk.Body.STATIC)
+        body.position = to_pymunk_position(col.shape, pos)
+        shape = col.shape.to_pymunk(body)
+        shape.sensor = True
+        shape.collision_type = HOLE_COLLISION_TYPE
+        if not isinstance(col.shape, Circle):
+            return cls(entity, body, shape)
+
+        gate = pymunk.Circle(body, col.shape.radius + FUNNEL_EXTRA)
+        gate.sensor = True
+        gate.collision_type = FUNNEL_COLLISION_TYPE
+        return cls(entity, body, shape, gate)
+
     def add_to_space(self, space: pymunk.Space):
-        space.add(self.body, self.shape)
+        space.add(self.body, *self.shapes)
 
     def sync_to_entity(self):
         self.entity.sync_with_pymunk_body(self.body)
@@ -0,0 +1,218 @@
+"""
+Courses: an ordered list of levels played back to back, with scorecards.
+
+Building a hole (World.from_json + PhysicsSpace.populate) takes long enough
+to stall a frame, so a Course builds the next hole on a background thread
+while the current one is being played. Moving on is then just swapping in
+the finished hole; only the first hole is built on the caller's thread.
+
+A CourseSession plays a Course with a fixed set of controllers, reset
+between holes: one Game per hole (handed the prebuilt physics), and a
+Scorecard per player with the strokes taken on each hole.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from minigolf.components import Mode, Phase
+from minigolf.controllers.base import ResettableController
+from minigolf.game.engine import Game
+from minigolf.game.state import GameState
+from minigolf.systems.physics import PhysicsSpace
+from minigolf.world import World
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import pygame
+
+    from minigolf.controllers import Controller
+
+# A hole is a level file, or a world already built in code
+HoleSource = Path | World
+
+
+@dataclass
+class LoadedHole:
+    index: int
+    source: HoleSource
+    world: World
+    physics: PhysicsSpace
+
+
+def load_hole(
+    index: int, source: HoleSource, physics_profile: str | None = None
+) -> LoadedHole:
+    """Build a hole's world and physics, ready to be played."""
+    world = World.from_json(source) if isinstance(source, Path) else source
+    physics = PhysicsSpace(world, tuning=physics_profile)
+    physics.populate()
+    return LoadedHole(index, source, world, physics)
+
+
+class Course:
+    def __init__(
+        self,
+        holes: "Sequence[HoleSource]",
+        *,
+        physics_profile: str | None = None,
+        preload: bool = True,
+    ):
+        if not holes:
+            raise ValueError("A course needs at least one hole")
+        self.holes = list(holes)
+        self.physics_profile = physics_profile
+        self._executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="course-preload")
+            if preload
+            else None
+        )
+        self._next: Future[LoadedHole] | None = None
+        self.current = load_hole(0, self.holes[0], physics_profile)
+        self._preload(1)
+
+    @classmethod
+    def from_dir(cls, path: Path, **kwargs) -> "Course":
+        """A course of every level file in `path`, in filename order."""
+        holes = sorted(path.glob("*.json"))
+        if not holes:
+            raise FileNotFoundError(f"No level files in {path}")
+        return cls(holes, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.holes)
+
+    @property
+    def has_next(self) -> bool:
+        return self.current.index + 1 < len(self.holes)
+
+    def advance(self) -> LoadedHole | None:
+        """Move to the next hole (waiting for its preload if need be)."""
+        index = self.current.index + 1
+        if index >= len(self.holes):
+            return None
+        if self._next is not None:
+            hole = self._next.result()
+        else:
+            hole = load_hole(index, self.holes[index], self.physics_profile)
+        self.current = hole
+        self._preload(index + 1)
+        return hole
+
+    def close(self) -> None:
+        self._next = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "Course":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _preload(self, index: int) -> None:
+        self._next = None
+        if self._executor is None or index >= len(self.holes):
+            return
+        self._next = self._executor.submit(
+            load_hole, index, self.holes[index], self.physics_profile
+        )
+
+
+@dataclass
+class Scorecard:
+    player_id: int
+    # Strokes taken on each completed hole, in course order
+    strokes: list[int] = field(default_factory=list)
+    # Whether the player's ball was sunk on each of those holes
+    sunk: list[bool] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return sum(self.strokes)
+
+
+class CourseSession:
+    def __init__(
+        self,
+        course: Course,
+        controllers: "Sequence[Controller]",
+        *,
+        mode: Mode = Mode.TURN,
+        screen: "pygame.Surface | None" = None,
+        max_strokes: int | None = None,
+    ):
+        """
+        `controllers` are reused from hole to hole; any ResettableController
+        is reset before each hole starts. A hole ends when a ball is sunk or,
+        with `max_strokes`, once every player has used them up and is waiting
+        to play again.
+        """
+        self.course = course
+        self.controllers = list(controllers)
+        self.mode = mode
+        self.screen = screen
+        self.max_strokes = max_strokes
+        self.scorecards = {pid: Scorecard(pid) for pid in range(len(controllers))}
+        self.finished = False
+        self.game = self._start(course.current)
+
+    def _start(self, hole: LoadedHole) -> Game:
+        game = Game(
+            world=hole.world, mode=self.mode, screen=self.screen, physics=hole.physics
+        )
+        for controller in self.controllers:
+            if isinstance(controller, ResettableController):
+                controller.reset()
+            game.add_player(controller)
+        return game
+
+    @property
+    def hole(self) -> LoadedHole:
+        return self.course.current
+
+    @property
+    def hole_over(self) -> bool:
+        game = self.game
+        if game.world.game_state is GameState.WON:
+            return True
+        if self.max_strokes is None:
+            return False
+        return game.turn.phase is Phase.AWAIT_INPUT and all(
+            n >= self.max_strokes for n in game.strokes.values()
+        )
+
+    def step(self, dt: float):
+        """Advance the current hole by one frame."""
+        if self.finished:
+            return None
+        return self.game.step(dt)
+
+    def finish_hole(self) -> bool:
+        """
+        Score the current hole and move to the next one. Returns False once
+        the course is complete.
+        """
+        game = self.game
+        sunk = {evt.ball_eid for evt in game.win_events}
+        for pid, card in self.scorecards.items():
+            card.strokes.append(game.strokes.get(pid, 0))
+            card.sunk.append(game.player_balls[pid].id in sunk)
+
+        hole = self.course.advance()
+        if hole is None:
+            self.finished = True
+            return False
+        self.game = self._start(hole)
+        return True
+
+    def play(self, dt: float = 1 / 60, max_frames: int = 60 * 60 * 10) -> None:
+        """Play every remaining hole headlessly, giving each `max_frames`."""
+        while not self.finished:
+            for _ in range(max_frames):
+                self.step(dt)
+                if self.hole_over:
+                    break
+            self.finish_hole()
@@ -8,20 +8,24 @@ Responsibilities:
 - Stop game once win condition is reached.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
-import pygame
 from loguru import logger
 
-from minigolf.components import Mode, Phase, Player, TurnState
+from minigolf.components import Action, Mode, Phase, Player, TurnState
 from minigolf.controllers import Controller
 from minigolf.entity import Entity
 from minigolf.game.state import GameState
 from minigolf.systems.physics import PhysicsSpace
 from minigolf.systems.turn import ensure_turn_manager, get_player_ball, turn_system
-from minigolf.systems.win import win_condition_system
+from minigolf.systems.win import WinEvent, win_condition_system
 from minigolf.world import World
 
+if TYPE_CHECKING:
+    import pygame
+
 
 @dataclass
 class Game:
@@ -33,18 +37,43 @@ class Game:
     - mode: gameplay mode (turn or realtime)
     - screen: optional pygame surface for rendering
     - controllers: mapping of player_id -> Controller
+    - poll_batch: realtime only; poll at most this many controllers per frame
+      (round-robin), or all of them when None
+    - physics_profile: pymunk tuning profile name (see systems.tuning), or
+      None to derive one from the level
+    - physics: an already populated PhysicsSpace for `world` (e.g. preloaded
+      by a Course); built from `world` when None
     """
 
     world: World
     mode: Mode
-    screen: pygame.Surface | None = None
+    screen: "pygame.Surface | None" = None
     controllers: dict[int, Controller] = field(default_factory=dict)
+    poll_batch: int | None = None
+    physics_profile: str | None = None
+    physics: PhysicsSpace | None = None
 
     def __post_init__(self):
+        if self.poll_batch is not None and self.poll_batch < 1:
+            raise ValueError(f"poll_batch must be at least 1, got {self.poll_batch}")
         # Initialise physics and turn manager
-        self.physics = PhysicsSpace(self.world)
-        self.physics.populate()
-        ensure_turn_manager(self.world, mode=self.mode)
+        if self.physics is None:
+            self.physics = PhysicsSpace(self.world, tuning=self.physics_profile)
+            self.physics.populate()
+        elif self.physics.world is not self.world:
+            raise ValueError("physics was built for a different world")
+        self._turn_manager = ensure_turn_manager(self.world, mode=self.mode)
+
+        # player_id -> ball, and balls not claimed by any player yet
+        self.player_balls: dict[int, Entity] = {}
+        self._free_balls: deque[Entity] | None = None
+        # Realtime: ball eid -> latest Action, applied in one pass per frame
+        self.pending_actions: dict[int, Action] = {}
+        self._poll_order: list[int] = []
+        self._poll_cursor = 0
+        # player_id -> actions taken, and the captures that ended the game
+        self.strokes: dict[int, int] = {}
+        self.win_events: list[WinEvent] = []
 
     # Player & controller management
 
@@ -56,12 +85,24 @@ class Game:
         """
         player_id = len(self.controllers)
 
-        for ball in self.world.get_balls():
-            if not ball.get(Player):
-                ball.add(Player(id=player_id))
-                self.controllers[player_id] = controller
-                logger.info(f"[Game] Assigned Player {player_id} to Ball {ball.id}")
-                return player_id
+        if not self._free_balls:
+            # Rescanned only when it runs dry (which also picks up balls added
+            # since), so adding N players costs one scan, not N
+            self._free_balls = deque(
+                b for b in self.world.get_balls() if not b.get(Player)
+            )
+
+        while self._free_balls:
+            ball = self._free_balls.popleft()
+            if ball.get(Player) or ball.id not in self.world.entities:
+                continue
+            ball.add(Player(id=player_id))
+            self.controllers[player_id] = controller
+            self.player_balls[player_id] = ball
+            self.strokes[player_id] = 0
+            self._poll_order.append(player_id)
+            logger.info(f"[Game] Assigned Player {player_id} to Ball {ball.id}")
+            return player_id
 
         raise RuntimeError("No free ball to assign!")
 
@@ -70,21 +111,14 @@ class Game:
         Poll a player’s controller for an Action and attach it to their ball.
         (Low-level helper; step() uses _maybe_request_action.)
         """
-        ctrl = self.controllers[player_id]
-        act = ctrl.act(self.world, player_id)
-        if not act:
-            return
-        for ball in self.world.all_with(Player):
-            if ball.get(Player).id == player_id:
-                ball.add(act)
-                return
+        self._maybe_request_action(player_id)
 
     # Frame loop
 
     def step(self, dt: float):
         """
         Advance one tick of the game loop:
-        1. Poll controller if waiting for input
+        1. Poll controller if waiting for input (every controller in realtime)
         2. Advance physics
         3. Apply turn logic
         4. Check win condition
@@ -94,35 +128,67 @@ class Game:
             return
 
         # 1. Poll controllers only if TurnManager wants input
-        tm = self._get_turn_manager()
-        if tm and tm.get(TurnState).phase is Phase.AWAIT_INPUT:
-            pid = tm.get(TurnState).current_player
-            self._maybe_request_action(pid)
+        turn = self._turn_manager.get(TurnState)
+        if turn.mode is Mode.REALTIME:
+            self._poll_realtime()
+        elif turn.phase is Phase.AWAIT_INPUT:
+            self._maybe_request_action(turn.current_player)
 
         # 2. Physics integration
         self.physics.step(dt)
 
         # 3. Gameplay rules (turn system)
-        turn_system(self.world, self.physics)
+        turn_system(
+            self.world,
+            self.physics,
+            pending=self.pending_actions,
+            turn_manager=self._turn_manager,
+        )
 
         # 4. Win condition check
-        evt = win_condition_system(self.world)
+        evt = win_condition_system(self.world, self.physics)
         if evt:
             self.world.game_state = GameState.WON
+            self.win_events = evt
             logger.debug("[Game] Win detected, halting loop")
             return evt
 
     # Internal helpers
 
+    def _poll_realtime(self) -> None:
+        """Poll all controllers, or the next `poll_batch` of them, round-robin."""
+        order = self._poll_order
+        if not order:
+            return
+        if self.poll_batch is None or self.poll_batch >= len(order):
+            batch = order
+        else:
+            start = self._poll_cursor % len(order)
+            batch = order[start : start + self.poll_batch]
+            batch += order[: self.poll_batch - len(batch)]
+            self._poll_cursor = start + self.poll_batch
+        for pid in batch:
+            self._maybe_request_action(pid)
+
     def _maybe_request_action(self, pid: int) -> None:
         """Ask a controller for an action if available and attach to ball."""
         ctrl = self.controllers[pid]
         act = ctrl.act(world=self.world, player_id=pid)
-        if act:
+        if not act:
+            return
+        self.strokes[pid] = self.strokes.get(pid, 0) + 1
+        ball = self.player_balls.get(pid)
+        if ball is None:
             ball = get_player_ball(world=self.world, player_id=pid)
+        if self._turn_manager.get(TurnState).mode is Mode.REALTIME:
+            self.pending_actions[ball.id] = act
+        else:
             ball.add(act)
 
+    @property
+    def turn(self) -> TurnState:
+        return self._turn_manager.get(TurnState)
+
     def _get_turn_manager(self) -> Entity | None:
         """Return the TurnManager entity, if any."""
-        matches = self.world.all_with(TurnState)
-        return matches[0] if matches else None
+        return self._turn_manager
@@ -1,3 +1,4 @@
+import atexit
 import sys
 from pathlib import Path
 
@@ -5,13 +6,16 @@ import click
 import pygame
 from loguru import logger
 
+from minigolf import memory, trace
 from minigolf.components import Mode
 from minigolf.consts import SIMULATION_SPEED
 from minigolf.controllers import SequenceController
-from minigolf.game.engine import Game
+from minigolf.game.course import Course, CourseSession
 from minigolf.game.levels import create_level1
+from minigolf.game.reload import LevelWatcher, apply_level
 from minigolf.game.state import GameState
 from minigolf.systems.rendering import render_system
+from minigolf.systems.tuning import PROFILES
 from minigolf.world import World
 
 ARM_DELAY_S = 0.5
@@ -29,18 +33,47 @@ def build_win_banner(screen: pygame.Surface) -> pygame.Surface:
 
 
 # Game loop runner
-def main_loop(world: World, *, mode: Mode = Mode.TURN) -> None:
+def reload_hole(session: CourseSession, path: Path) -> None:
+    """Apply edits to the current hole's level file to the running game."""
+    try:
+        edited = World.from_json(path)
+    except (ValueError, KeyError) as exc:
+        # Most often a save caught half-written; the next change retries
+        logger.warning(f"🔁 Not reloading {path}: {exc}")
+        return
+    game = session.game
+    diff = apply_level(game.world, game.physics, edited)
+    logger.info(
+        f"🔁 Reloaded {path}: {len(diff.added)} added, {len(diff.removed)} removed,"
+        f" {len(diff.changed)} changed"
+    )
+
+
+def log_memory(session: CourseSession) -> None:
+    game = session.game
+    memory.log_report(world=game.world, physics=game.physics)
+
+
+def main_loop(
+    course: Course,
+    *,
+    mode: Mode = Mode.TURN,
+    watch: bool = False,
+    memory_report: bool = False,
+) -> None:
     pygame.init()
     screen = pygame.display.set_mode((1000, 1000))
-    game = Game(world=world, mode=mode, screen=screen)
+    # Add player
+    session = CourseSession(course, [SequenceController()], mode=mode, screen=screen)
+    if memory_report:
+        # Whichever hole is being played when the game exits
+        atexit.register(log_memory, session)
     clock = pygame.time.Clock()
 
     win_at_ms: int | None = None
     win_banner: pygame.Surface | None = None
     win_snapshot: pygame.Surface | None = None
-
-    # Add player
-    game.add_player(SequenceController())
+    watcher: LevelWatcher | None = None
 
     running = True
     while running:
@@ -49,7 +82,16 @@ def main_loop(world: World, *, mode: Mode = Mode.TURN) -> None:
             if event.type == pygame.QUIT:
                 running = False
 
-        game.step(1.0 / 60.0)
+        # Hot reload of the current hole's file
+        source = session.hole.source
+        if watch and isinstance(source, Path):
+            if watcher is None or watcher.path != source:
+                watcher = LevelWatcher(source)
+            elif watcher.changed():
+                reload_hole(session, source)
+
+        session.step(1.0 / 60.0)
+        world = session.game.world
 
         # --- RENDER ---``
         if world.game_state is GameState.PLAYING:
@@ -69,6 +111,13 @@ def main_loop(world: World, *, mode: Mode = Mode.TURN) -> None:
                 win_at_ms = pygame.time.get_ticks()
             if WIN_EXIT_DELAY_MS is not None and win_at_ms is not None:
                 if pygame.time.get_ticks() - win_at_ms >= WIN_EXIT_DELAY_MS:
+                    # The next hole is already built; only exit after the last
+                    if session.finish_hole():
+                        win_at_ms = win_banner = win_snapshot = None
+                        continue
+                    for card in session.scorecards.values():
+                        logger.info(f"Player {card.player_id}: {card.strokes}")
+                    course.close()
                     pygame.quit()
                     sys.exit()
 
@@ -79,26 +128,73 @@ def main_loop(world: World, *, mode: Mode = Mode.TURN) -> None:
 @click.command()
 @click.argument("path", type=click.Path(path_type=Path), required=False)
 @click.option("--mode", type=click.Choice(["turn", "realtime"]), default="turn")
-def cli(path: Path | None, mode: str) -> None:
+@click.option(
+    "--physics-profile",
+    type=click.Choice(sorted(PROFILES)),
+    default="auto",
+    show_default=True,
+    help="pymunk tuning; 'auto' derives it from the level.",
+)
+@click.option(
+    "--trace",
+    "trace_level",
+    type=click.Choice(list(trace.LEVELS)),
+    default="off",
+    show_default=True,
+    help="Record simulation trace events and log them on exit.",
+)
+@click.option(
+    "--watch",
+    is_flag=True,
+    help="Apply edits to the level file to the running game.",
+)
+@click.option(
+    "--memory",
+    "memory_report",
+    is_flag=True,
+    help="Trace allocations and log a memory report on exit.",
+)
+def cli(
+    path: Path | None,
+    mode: str,
+    physics_profile: str,
+    trace_level: str,
+    watch: bool,
+    memory_report: bool,
+) -> None:
     """
     Run the game.
 
-    - If PATH is provided, load the world from a JSON file.
+    - If PATH is a directory, play its level files in order as a course.
+    - If PATH is a file, load the world from it.
     - Otherwise, build and run the default 'level1' from code.
     """
+    if trace_level != "off":
+        trace.enable(trace.LEVELS[trace_level])
+        atexit.register(trace.flush_to_logger)
+    if memory_report:
+        memory.start()
 
     if path:
         if not path.exists():
             logger.error(f"File not found: {path}")
             sys.exit(1)
-        logger.info(f"📂 Loading world from {path}")
-        world = World.from_json(path)
+        if path.is_dir():
+            try:
+                course = Course.from_dir(path, physics_profile=physics_profile)
+            except FileNotFoundError as exc:
+                logger.error(str(exc))
+                sys.exit(1)
+        else:
+            course = Course([path], physics_profile=physics_profile)
+        logger.info(f"📂 Loaded {len(course)} hole(s) from {path}")
     else:
         logger.info("🧱 Creating default level1 from code")
         world = World()
         create_level1(world)
+        course = Course([world], physics_profile=physics_profile)
 
-    main_loop(world, mode=Mode(mode))
+    main_loop(course, mode=Mode(mode), watch=watch, memory_report=memory_report)
 
 
 if __name__ == "__main__":
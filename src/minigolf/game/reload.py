@@ -0,0 +1,171 @@
+"""
+Hot reload: apply edits to a level file to a world that is being played.
+
+The edited file is loaded into a fresh World and diffed against the live one
+by entity id and component value. Only entities that actually differ are
+touched: new ones are added to the world and physics, deleted ones removed,
+and changed ones get their components replaced and their bodies rebuilt.
+
+Runtime state is left alone: components the game adds during play (Player,
+Action, TurnState) are never compared, and balls keep their live Position
+and Velocity, so editing a wall doesn't send the ball back to the tee.
+
+LevelWatcher polls the file's mtime and size, so it needs nothing beyond
+os.stat and works on any filesystem.
+"""
+
+import os
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from minigolf.components import (
+    Action,
+    PhysicsBody,
+    Player,
+    Position,
+    Terrain,
+    TurnState,
+    Velocity,
+)
+from minigolf.entity import Entity
+from minigolf.world import World
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pydantic import BaseModel
+
+    from minigolf.systems.physics import PhysicsSpace
+
+# Added by the game while playing; never part of a level file
+RUNTIME_COMPONENTS: tuple[type["BaseModel"], ...] = (Player, Action, TurnState)
+# Owned by the simulation for balls once play has started
+BALL_STATE_COMPONENTS: tuple[type["BaseModel"], ...] = (Position, Velocity)
+
+DEFAULT_POLL_INTERVAL = 0.5
+
+
+@dataclass
+class LevelDiff:
+    added: list[int] = field(default_factory=list)
+    removed: list[int] = field(default_factory=list)
+    changed: list[int] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+def _is_ball(entity: Entity) -> bool:
+    body = entity.get(PhysicsBody)
+    return body is not None and not body.anchored
+
+
+def _level_components(entity: Entity) -> dict[type["BaseModel"], "BaseModel"]:
+    """The components of `entity` a level file defines and a reload may change."""
+    skip = RUNTIME_COMPONENTS + (BALL_STATE_COMPONENTS if _is_ball(entity) else ())
+    return {t: c for t, c in entity.components.items() if t not in skip}
+
+
+def _is_runtime(entity: Entity) -> bool:
+    return not _level_components(entity) and any(
+        t in entity.components for t in RUNTIME_COMPONENTS
+    )
+
+
+def diff_levels(live: World, edited: World) -> LevelDiff:
+    """Entity ids added, removed or changed in `edited` relative to `live`."""
+    diff = LevelDiff()
+    for eid, entity in edited.entities.items():
+        current = live.entities.get(eid)
+        if current is None or _is_runtime(current):
+            diff.added.append(eid)
+        elif _level_components(current) != _level_components(entity):
+            diff.changed.append(eid)
+    for eid, entity in live.entities.items():
+        if eid not in edited.entities and not _is_runtime(entity):
+            diff.removed.append(eid)
+    return diff
+
+
+def apply_level(world: World, physics: "PhysicsSpace", edited: World) -> LevelDiff:
+    """Bring `world` and `physics` in line with `edited`, in place."""
+    diff = diff_levels(world, edited)
+    terrain = False
+
+    for eid in diff.removed:
+        entity = world.entities.pop(eid)
+        terrain |= entity.has(Terrain)
+        if eid in physics.eid_to_body:
+            physics.remove_entity(entity)
+
+    for eid in diff.changed:
+        entity = world.entities[eid]
+        new = edited.entities[eid]
+        terrain |= entity.has(Terrain) or new.has(Terrain)
+        kept = {t: entity.components[t] for t in RUNTIME_COMPONENTS if entity.has(t)}
+        if _is_ball(entity) and _is_ball(new):
+            kept.update(
+                (t, entity.components[t])
+                for t in BALL_STATE_COMPONENTS
+                if entity.has(t)
+            )
+        if eid in physics.eid_to_body:
+            physics.remove_entity(entity)
+        entity.components = {**new.components, **kept}
+        physics.add_entity(entity, rebuild_terrain=False)
+
+    for eid in diff.added:
+        if eid in world.entities:
+            _move_runtime_entity(world, eid, edited)
+        entity = edited.entities[eid]
+        world.entities[eid] = entity
+        terrain |= entity.has(Terrain)
+        physics.add_entity(entity, rebuild_terrain=False)
+
+    if diff.added:
+        world._next_id = max(world._next_id, max(world.entities) + 1)
+    if terrain:
+        physics.rebuild_terrain()
+    return diff
+
+
+def _move_runtime_entity(world: World, eid: int, edited: World) -> None:
+    """
+    Give a game-created entity (e.g. the TurnManager) a new id, freeing `eid`
+    for the level. Editors hand out the next free id, which is often the one
+    the game took when it started.
+    """
+    entity = world.entities.pop(eid)
+    new_id = max(*world.entities, *edited.entities, eid) + 1
+    entity.id = new_id
+    world.entities[new_id] = entity
+
+
+class LevelWatcher:
+    """Reports when a level file has been rewritten, by polling os.stat."""
+
+    def __init__(self, path: "Path", interval: float = DEFAULT_POLL_INTERVAL):
+        self.path = path
+        self.interval = interval
+        self._stamp = self._stat()
+        self._next_poll = time.monotonic() + interval
+
+    def _stat(self) -> tuple[int, int] | None:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def changed(self) -> bool:
+        """True once per change; cheap to call every frame."""
+        now = time.monotonic()
+        if now < self._next_poll:
+            return False
+        self._next_poll = now + self.interval
+        stamp = self._stat()
+        if stamp is None or stamp == self._stamp:
+            return False
+        self._stamp = stamp
+        return True
@@ -0,0 +1,257 @@
+"""
+Headless stroke rollouts.
+
+A stroke applies one Action to a ball and steps physics until the ball is
+captured by a hole or comes to rest, without controllers, turn phases or
+rendering. Search and analysis code builds on this.
+
+Most strokes in a search can't sink the ball, so by default a stroke also
+stops early (see StrokeBounds):
+
+- Hopeless: floor damping takes a fixed amount of speed per px rolled, so a
+  ball can roll at most (v - STOPPING_VELOCITY) / k more px. Spin can be
+  turned into speed by wall friction, so v counts the share of the spin a
+  contact could hand over. Once that distance can't reach any hole's funnel
+  gate, the ball is moved to the rest point predict_trajectory gives and
+  the stroke ends with `predicted` set.
+- Escaped: a ball that started inside the bounding box of the walls and
+  is now outside it has tunnelled out of the level; the stroke is aborted
+  with `escaped` set. Nothing says the walls enclose the level, so a
+  stroke starting outside the box (an open level, or walls that are only
+  obstacles) is never treated as escaping.
+
+The bound only holds where nothing adds speed, so it is not used on levels
+with terrain that damps less than the floor or accelerates (ice, slopes),
+while other balls are still moving, on levels without a hole, or while
+contacts are being recorded (the skipped frames would have no contacts).
+"""
+
+import math
+import weakref
+from dataclasses import dataclass
+
+from pymunk import Vec2d
+
+from minigolf.components import Action
+from minigolf.consts import (
+    FUNNEL_COLLISION_TYPE,
+    HOLE_COLLISION_TYPE,
+    STOPPING_VELOCITY,
+    STROKE_MAX_FRAMES,
+    WALL_COLLISION_TYPE,
+)
+from minigolf.game.trajectory import predict_trajectory
+from minigolf.systems.contacts import ContactStats
+from minigolf.systems.physics import PhysicsSpace
+from minigolf.systems.turn import apply_action_to_body
+from minigolf.systems.win import win_condition_system
+from minigolf.world import World
+
+# Slack (px) on the reach bound, for the frame the ball is still moving at
+# STOPPING_VELOCITY and for substep integration error
+REACH_MARGIN = 5.0
+
+BBox = tuple[float, float, float, float]
+
+
+@dataclass(frozen=True)
+class StrokeResult:
+    """Outcome of a single simulated stroke."""
+
+    ball_eid: int
+    start: tuple[float, float]
+    rest: tuple[float, float]
+    won: bool
+    frames: int
+    # Only set when the physics space records contacts
+    contacts: ContactStats | None = None
+    # Stopped early because the hole was out of reach; `rest` is predicted
+    predicted: bool = False
+    # Left the level through its walls; the stroke is invalid
+    escaped: bool = False
+
+
+@dataclass(frozen=True)
+class StrokeBounds:
+    """The parts of a level early termination checks a ball against."""
+
+    # Bounding box of every wall, or None if there are none
+    walls: BBox | None
+    # Bounding boxes of the holes' sensors (funnel gates included)
+    holes: list[BBox]
+    # Speed lost per px rolled, or None if something on the level adds speed
+    decay: float | None
+
+    def escaped(self, x: float, y: float) -> bool:
+        if self.walls is None:
+            return False
+        x0, y0, x1, y1 = self.walls
+        return not (x0 <= x <= x1 and y0 <= y <= y1)
+
+    def out_of_reach(self, x: float, y: float, reach: float) -> bool:
+        """True if no hole sensor is within `reach` px of (x, y)."""
+        return all(_bbox_distance(box, x, y) > reach for box in self.holes)
+
+
+_bounds: weakref.WeakKeyDictionary[PhysicsSpace, tuple[int, StrokeBounds]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def stroke_bounds(physics: PhysicsSpace) -> StrokeBounds:
+    """The StrokeBounds of `physics`' level, cached until its layout changes."""
+    cached = _bounds.get(physics)
+    if cached is not None and cached[0] == physics.layout_version:
+        return cached[1]
+
+    walls: list[BBox] = []
+    holes: list[BBox] = []
+    for phys_obj in physics.static_bodies.values():
+        for shape in phys_obj.shapes:
+            bb = shape.cache_bb()
+            box = (bb.left, bb.bottom, bb.right, bb.top)
+            if shape.collision_type == WALL_COLLISION_TYPE:
+                walls.append(box)
+            elif shape.collision_type in (HOLE_COLLISION_TYPE, FUNNEL_COLLISION_TYPE):
+                holes.append(box)
+
+    decay = None
+    damping = physics.space.damping
+    if 0 < damping < 1 and _terrain_only_slows(physics, damping):
+        decay = -math.log(damping)
+
+    bounds = StrokeBounds(
+        walls=(
+            min(b[0] for b in walls),
+            min(b[1] for b in walls),
+            max(b[2] for b in walls),
+            max(b[3] for b in walls),
+        )
+        if walls
+        else None,
+        holes=holes,
+        decay=decay,
+    )
+    _bounds[physics] = (physics.layout_version, bounds)
+    return bounds
+
+
+def _terrain_only_slows(physics: PhysicsSpace, damping: float) -> bool:
+    if physics.terrain is None:
+        return True
+    return all(
+        accel == (0.0, 0.0) and zone_damping <= damping
+        for accel, zone_damping in {c for c in physics.terrain.cells if c is not None}
+    )
+
+
+def _bbox_distance(box: BBox, x: float, y: float) -> float:
+    dx = max(box[0] - x, 0.0, x - box[2])
+    dy = max(box[1] - y, 0.0, y - box[3])
+    return math.hypot(dx, dy)
+
+
+def simulate_stroke(
+    world: World,
+    physics: PhysicsSpace,
+    action: Action,
+    *,
+    ball_eid: int | None = None,
+    dt: float = 1 / 60,
+    max_frames: int = STROKE_MAX_FRAMES,
+    early_exit: bool = True,
+) -> StrokeResult:
+    """
+    Apply `action` to a ball (the first one by default) and simulate until it
+    is sunk, stops below STOPPING_VELOCITY, or `max_frames` have elapsed.
+    With `early_exit`, also stop once the ball provably can't reach a hole,
+    or has escaped the level (see the module docstring).
+    """
+    if ball_eid is None:
+        ball_eid = world.get_balls()[0].id
+    phys_obj = physics.eid_to_body[ball_eid]
+    body = phys_obj.body
+    start = (float(body.position.x), float(body.position.y))
+    first_contact = len(physics.contacts)
+
+    bounds = None
+    if early_exit and not physics.record_contacts:
+        bounds = stroke_bounds(physics)
+        if not bounds.holes:
+            bounds = None
+    radius = getattr(phys_obj.shape, "radius", 0.0)
+    check_escape = bounds is not None and not bounds.escaped(*start)
+
+    apply_action_to_body(action, body)
+
+    won = predicted = escaped = False
+    frames = 0
+    while frames < max_frames:
+        physics.step(dt)
+        frames += 1
+        if any(
+            evt.ball_eid == ball_eid for evt in win_condition_system(world, physics)
+        ):
+            won = True
+            break
+        if body.velocity.length < STOPPING_VELOCITY:
+            break
+        if bounds is None:
+            continue
+        x, y = body.position
+        if check_escape and bounds.escaped(x, y):
+            escaped = True
+            place_ball(physics, ball_eid, (x, y))
+            break
+        if bounds.decay is not None and _hopeless(physics, bounds, body, radius):
+            predicted = True
+            velocity = (body.velocity.x, body.velocity.y)
+            trajectory = predict_trajectory(
+                physics, (x, y), velocity, ball_radius=radius
+            )
+            place_ball(physics, ball_eid, trajectory.rest)
+            break
+    if predicted or escaped:
+        physics.sync_bodies()
+
+    contacts = None
+    if physics.record_contacts:
+        contacts = physics.contacts.stats(first_contact, eid=ball_eid)
+    return StrokeResult(
+        ball_eid=ball_eid,
+        start=start,
+        rest=(float(body.position.x), float(body.position.y)),
+        won=won,
+        frames=frames,
+        contacts=contacts,
+        predicted=predicted,
+        escaped=escaped,
+    )
+
+
+def _hopeless(physics: PhysicsSpace, bounds: StrokeBounds, body, radius: float) -> bool:
+    """Whether `body` can no longer roll as far as any hole's sensor."""
+    # Wall friction can turn spin into speed: at most the contact point's
+    # surface speed, weighted by how the inertia splits between the two
+    mr2 = body.mass * radius * radius
+    spin = body.moment * abs(body.angular_velocity) * radius / (mr2 + body.moment)
+    speed = body.velocity.length + spin
+    reach = (speed - STOPPING_VELOCITY) / bounds.decay + radius + REACH_MARGIN
+    if not bounds.out_of_reach(body.position.x, body.position.y, reach):
+        return False
+    # Another ball still moving could knock this one on
+    return not any(
+        other.body is not body
+        and not other.body.is_sleeping
+        and other.body.velocity.length >= STOPPING_VELOCITY
+        for other in physics.dynamic_bodies.values()
+    )
+
+
+def place_ball(physics: PhysicsSpace, ball_eid: int, pos: tuple[float, float]) -> None:
+    """Teleport a ball to `pos` at rest, e.g. to replay a stroke from there."""
+    body = physics.eid_to_body[ball_eid].body
+    body.position = Vec2d(*pos)
+    body.velocity = Vec2d(0.0, 0.0)
+    body.angular_velocity = 0.0
+    physics.space.reindex_shapes_for_body(body)
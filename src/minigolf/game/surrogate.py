@@ -0,0 +1,203 @@
+"""
+Shot-outcome surrogate: approximate stroke results without simulating.
+
+A ShotSurrogate belongs to one level. It indexes logged shots
+(start position, strike velocity -> rest position, win) and answers queries
+by interpolating between the k nearest samples in NumPy: a distance-weighted
+linear fit through them, which is orders of magnitude cheaper than a
+headless rollout.
+
+Each prediction carries an uncertainty in pixels: how badly the neighbours
+disagree with that linear fit (large near walls, holes and other
+discontinuities), plus a penalty for how far the query is from its nearest
+sample. Above `threshold` the surrogate simulates the shot for real on its
+own copy of the level, answers with that exact result and adds it to the
+index, so it sharpens where it is actually queried.
+"""
+
+import copy
+from dataclasses import dataclass
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from minigolf.components import Action
+from minigolf.game.rollout import StrokeResult, place_ball, simulate_stroke
+from minigolf.systems.physics import PhysicsSpace
+from minigolf.world import World
+
+# Feature scaling: one unit of feature distance is this many px of start
+# position, or px/s of strike velocity
+POSITION_SCALE = 20.0
+VELOCITY_SCALE = 20.0
+# Uncertainty added per unit of feature distance to the nearest sample (px)
+DISTANCE_PENALTY = 10.0
+
+DEFAULT_NEIGHBOURS = 8
+DEFAULT_THRESHOLD = 25.0
+DEFAULT_CAPACITY = 1024
+
+
+class ShotSample(NamedTuple):
+    start: tuple[float, float]
+    velocity: tuple[float, float]
+    rest: tuple[float, float]
+    won: bool
+
+
+@dataclass(frozen=True)
+class Prediction:
+    rest: tuple[float, float]
+    win_probability: float
+    # Estimated error of `rest`, in px; 0 for simulated answers
+    uncertainty: float
+    simulated: bool
+
+    @property
+    def won(self) -> bool:
+        return self.win_probability >= 0.5
+
+
+class ShotSurrogate:
+    def __init__(
+        self,
+        world: World,
+        *,
+        neighbours: int = DEFAULT_NEIGHBOURS,
+        threshold: float = DEFAULT_THRESHOLD,
+        capacity: int = DEFAULT_CAPACITY,
+    ):
+        # Fallback simulations run on a private copy of the level
+        self.world = copy.deepcopy(world)
+        self.physics = PhysicsSpace(self.world)
+        self.physics.populate()
+        self.ball_eid = self.world.get_balls()[0].id
+
+        self.neighbours = neighbours
+        self.threshold = threshold
+        self.simulations = 0
+        self._size = 0
+        self._features = np.zeros((capacity, 4))
+        # Squared norms of the feature rows, so a query costs one mat-vec
+        self._norms = np.zeros(capacity)
+        self._rest = np.zeros((capacity, 2))
+        self._won = np.zeros(capacity)
+
+    def __len__(self) -> int:
+        return self._size
+
+    # Index
+
+    def add(self, sample: ShotSample) -> None:
+        i = self._size
+        if i == len(self._features):
+            self._grow()
+        self._features[i] = _features(sample.start, sample.velocity)
+        self._norms[i] = self._features[i] @ self._features[i]
+        self._rest[i] = sample.rest
+        self._won[i] = sample.won
+        self._size = i + 1
+
+    def fit(self, samples: list[ShotSample]) -> "ShotSurrogate":
+        for sample in samples:
+            self.add(sample)
+        return self
+
+    def add_result(self, result: StrokeResult, action: Action) -> None:
+        """Index a stroke simulated elsewhere, e.g. from a batch run's logs."""
+        self.add(ShotSample(result.start, action.velocity, result.rest, result.won))
+
+    def _grow(self) -> None:
+        # Double every column; amortised O(1) per sample
+        self._features = np.concatenate([self._features, np.zeros_like(self._features)])
+        self._norms = np.concatenate([self._norms, np.zeros_like(self._norms)])
+        self._rest = np.concatenate([self._rest, np.zeros_like(self._rest)])
+        self._won = np.concatenate([self._won, np.zeros_like(self._won)])
+
+    def save(self, path: Path) -> None:
+        n = self._size
+        np.savez(
+            path, features=self._features[:n], rest=self._rest[:n], won=self._won[:n]
+        )
+
+    def load(self, path: Path) -> "ShotSurrogate":
+        with np.load(path) as data:
+            n = len(data["features"])
+            while len(self._features) < self._size + n:
+                self._grow()
+            rows = slice(self._size, self._size + n)
+            self._features[rows] = data["features"]
+            self._norms[rows] = (data["features"] ** 2).sum(axis=1)
+            self._rest[rows] = data["rest"]
+            self._won[rows] = data["won"]
+            self._size += n
+        return self
+
+    # Queries
+
+    def estimate(
+        self, start: tuple[float, float], velocity: tuple[float, float]
+    ) -> Prediction | None:
+        """Interpolated prediction from the index alone; None while too small."""
+        k = self.neighbours
+        if self._size < k:
+            return None
+        query = _features(start, velocity)
+        n = self._size
+        # |f - q|^2 up to the constant |q|^2, which doesn't change the ranking
+        ranking = self._norms[:n] - 2.0 * (self._features[:n] @ query)
+        nearest = np.argpartition(ranking, k - 1)[:k]
+        offsets = self._features[nearest] - query
+        d = np.linalg.norm(offsets, axis=1)
+        weights = 1.0 / (d + 1.0)
+        weights /= weights.sum()
+
+        # Weighted least squares for rest ~ a + B·offset; a is the answer
+        design = np.hstack([np.ones((k, 1)), offsets])
+        root_w = np.sqrt(weights)[:, None]
+        targets = self._rest[nearest]
+        coef = np.linalg.lstsq(design * root_w, targets * root_w, rcond=None)[0]
+        residual = ((design @ coef - targets) ** 2).sum(axis=1)
+        return Prediction(
+            rest=(float(coef[0, 0]), float(coef[0, 1])),
+            win_probability=float(weights @ self._won[nearest]),
+            uncertainty=float(np.sqrt(weights @ residual) + d.min() * DISTANCE_PENALTY),
+            simulated=False,
+        )
+
+    def predict(
+        self, start: tuple[float, float], velocity: tuple[float, float]
+    ) -> Prediction:
+        """Interpolate if confident enough, otherwise simulate and learn."""
+        estimate = self.estimate(start, velocity)
+        if estimate is not None and estimate.uncertainty <= self.threshold:
+            return estimate
+        return self.simulate(start, velocity)
+
+    def simulate(
+        self, start: tuple[float, float], velocity: tuple[float, float]
+    ) -> Prediction:
+        """Run the real headless stroke, index it, and return its outcome."""
+        place_ball(self.physics, self.ball_eid, start)
+        self.physics.release(self.ball_eid)
+        result = simulate_stroke(
+            self.world,
+            self.physics,
+            Action(type="strike", velocity=velocity),
+            ball_eid=self.ball_eid,
+        )
+        self.simulations += 1
+        self.add(ShotSample(start, velocity, result.rest, result.won))
+        return Prediction(result.rest, float(result.won), 0.0, simulated=True)
+
+
+def _features(start: tuple[float, float], velocity: tuple[float, float]) -> np.ndarray:
+    return np.array(
+        [
+            start[0] / POSITION_SCALE,
+            start[1] / POSITION_SCALE,
+            velocity[0] / VELOCITY_SCALE,
+            velocity[1] / VELOCITY_SCALE,
+        ]
+    )
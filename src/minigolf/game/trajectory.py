@@ -0,0 +1,173 @@
+"""
+Analytic trajectory prediction for pruning candidate strikes.
+
+Instead of integrating 50 substeps per frame, the ball's path is traced as
+straight segments between wall bounces:
+
+- Floor damping keeps a fraction DEFAULT_FLOOR_FRICTION of the velocity per
+  second, i.e. dv/dt = -k·v with k = -ln(DEFAULT_FLOOR_FRICTION). Per unit of
+  distance that is dv/ds = -k, so speed falls linearly with distance rolled
+  and a ball at speed v rolls (v - STOPPING_VELOCITY) / k more px.
+- Walls are found with pymunk segment queries against the level's own
+  PhysicsSpace, swept by the ball's radius. A bounce keeps the normal
+  velocity times the combined restitution (pymunk multiplies the two
+  shapes' elasticities) and loses a little tangential speed to friction;
+  most of the friction impulse goes into spinning the ball.
+
+Terrain zones, hole funnels, spin and other balls are ignored, so this is an
+estimate: good for discarding obviously hopeless strikes, not for deciding
+between close ones.
+"""
+
+from dataclasses import dataclass, field
+
+from pymunk import ShapeFilter, Vec2d
+
+from minigolf.components import Action, Collider, Hole, Position
+from minigolf.consts import (
+    BALL_MOMENT,
+    DECAY_PER_PX,
+    DEFAULT_ELASTICITY,
+    DEFAULT_WALL_FRICTION,
+    STOPPING_VELOCITY,
+    VELOCITY_THRESHOLD,
+    WALL_COLLISION_TYPE,
+)
+from minigolf.systems.physics import PhysicsSpace
+from minigolf.world import World
+
+RESTITUTION = DEFAULT_ELASTICITY * DEFAULT_ELASTICITY
+WALL_FRICTION = DEFAULT_WALL_FRICTION * DEFAULT_WALL_FRICTION
+MAX_BOUNCES = 16
+# Distance the ball is pushed off a wall after a bounce, so the next query
+# doesn't hit the same wall at alpha 0
+CONTACT_OFFSET = 0.01
+
+
+@dataclass(frozen=True)
+class Trajectory:
+    rest: tuple[float, float]
+    # Closest the ball's centre gets to the hole's centre, and where
+    closest_approach: float
+    closest_point: tuple[float, float]
+    bounces: int
+    # Slow enough over the hole to be captured at some point on the path
+    sinks: bool
+    path: list[tuple[float, float]] = field(repr=False)
+
+
+def predict_trajectory(
+    physics: PhysicsSpace,
+    start: tuple[float, float],
+    velocity: tuple[float, float],
+    *,
+    hole: tuple[float, float] | None = None,
+    capture_radius: float = 0.0,
+    ball_radius: float = 5.0,
+    max_bounces: int = MAX_BOUNCES,
+) -> Trajectory:
+    """Trace a strike from `start` until it stops (or runs out of bounces)."""
+    pos = Vec2d(*start)
+    vel = Vec2d(*velocity)
+    target = Vec2d(*hole) if hole is not None else None
+    closest, closest_point = float("inf"), pos
+    sinks = False
+    path = [(pos.x, pos.y)]
+    bounces = 0
+
+    while vel.length > STOPPING_VELOCITY:
+        speed = vel.length
+        direction = vel / speed
+        reach = (speed - STOPPING_VELOCITY) / DECAY_PER_PX
+        hit = _first_wall_hit(physics, pos, pos + direction * reach, ball_radius)
+        travelled = reach if hit is None else reach * hit.alpha
+        end = pos + direction * travelled
+
+        if target is not None:
+            # Closest point to the hole on this segment, and the speed there
+            along = min(max((target - pos).dot(direction), 0.0), travelled)
+            point = pos + direction * along
+            dist = point.get_distance(target)
+            if dist < closest:
+                closest, closest_point = dist, point
+            if dist <= capture_radius:
+                speed_there = speed - DECAY_PER_PX * along
+                sinks = sinks or speed_there <= VELOCITY_THRESHOLD
+
+        path.append((end.x, end.y))
+        if hit is None or bounces >= max_bounces:
+            pos = end
+            break
+
+        speed_at_wall = speed - DECAY_PER_PX * travelled
+        normal = hit.normal
+        v = direction * speed_at_wall
+        vn = v.dot(normal)
+        tangent = v - normal * vn
+        # Friction stops the contact point sliding, bounded by the normal
+        # impulse (Coulomb). Most of it goes into spin: the light ball's
+        # tangential effective mass is 1 / (1 + r^2 / BALL_MOMENT)
+        slowdown = min(
+            tangent.length / (1 + ball_radius**2 / BALL_MOMENT),
+            WALL_FRICTION * (1 + RESTITUTION) * abs(vn),
+        )
+        if tangent.length > 0:
+            tangent = tangent * (1 - slowdown / tangent.length)
+        vel = tangent - normal * vn * RESTITUTION
+        pos = end + normal * CONTACT_OFFSET
+        bounces += 1
+
+    return Trajectory(
+        rest=(pos.x, pos.y),
+        closest_approach=closest,
+        closest_point=(closest_point.x, closest_point.y),
+        bounces=bounces,
+        sinks=sinks,
+        path=path,
+    )
+
+
+def predict_action(
+    world: World, physics: PhysicsSpace, action: Action, ball_eid: int | None = None
+) -> Trajectory:
+    """predict_trajectory for a ball's current position and the first hole."""
+    ball = world.get_entity(ball_eid) if ball_eid is not None else world.get_balls()[0]
+    body = physics.eid_to_body[ball.id].body
+    hole_pos, capture_radius = None, 0.0
+    for hole in world.all_with(Hole, Position, Collider):
+        pos = hole.get(Position)
+        hole_pos = (pos.x, pos.y)
+        capture_radius = getattr(hole.get(Collider).shape, "radius", 0.0)
+        break
+    ball_radius = getattr(ball.get(Collider).shape, "radius", 0.0)
+    return predict_trajectory(
+        physics,
+        (body.position.x, body.position.y),
+        action.velocity,
+        hole=hole_pos,
+        # The hole sensor triggers as soon as the two circles overlap
+        capture_radius=capture_radius + ball_radius,
+        ball_radius=ball_radius,
+    )
+
+
+def rank_actions(
+    world: World,
+    physics: PhysicsSpace,
+    actions: list[Action],
+    ball_eid: int | None = None,
+    keep: int | None = None,
+) -> list[tuple[Action, Trajectory]]:
+    """
+    Predict every action and order them by how close they bring the ball to
+    the hole (predicted sinks first); keep only the best `keep`.
+    """
+    scored = [(a, predict_action(world, physics, a, ball_eid)) for a in actions]
+    scored.sort(key=lambda pair: (not pair[1].sinks, pair[1].closest_approach))
+    return scored if keep is None else scored[:keep]
+
+
+def _first_wall_hit(physics: PhysicsSpace, a: Vec2d, b: Vec2d, radius: float):
+    hits = physics.space.segment_query(a, b, radius, ShapeFilter())
+    walls = [h for h in hits if h.shape.collision_type == WALL_COLLISION_TYPE]
+    return min(walls, key=lambda h: h.alpha, default=None)
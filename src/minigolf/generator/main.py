@@ -0,0 +1,66 @@
+import os
+import sys
+import time
+from pathlib import Path
+
+import click
+from loguru import logger
+
+from minigolf.generator.runner import LevelWriter, generate_levels
+from minigolf.generator.solver import DEFAULT_CANDIDATES, DEFAULT_STROKE_BUDGET
+
+
+@click.command()
+@click.argument("out_dir", type=click.Path(file_okay=False, path_type=Path))
+@click.option("--count", default=100, show_default=True, help="Seeds to attempt.")
+@click.option("--start-seed", default=0, show_default=True)
+@click.option("--workers", default=os.cpu_count() or 1, show_default=True)
+@click.option(
+    "--stroke-budget",
+    default=DEFAULT_STROKE_BUDGET,
+    show_default=True,
+    help="Strokes the solver may use before a level is rejected.",
+)
+@click.option(
+    "--candidates",
+    default=DEFAULT_CANDIDATES,
+    show_default=True,
+    help="Rollouts the solver tries per stroke.",
+)
+def cli(
+    out_dir: Path,
+    count: int,
+    start_seed: int,
+    workers: int,
+    stroke_budget: int,
+    candidates: int,
+) -> None:
+    """
+    Generate maze levels for seeds [START_SEED, START_SEED + COUNT) into OUT_DIR.
+
+    The same seed always yields the same level, and seeds already in
+    OUT_DIR/index.jsonl are skipped, so reruns extend or resume a dataset.
+    """
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    writer = LevelWriter(out_dir)
+    started = time.perf_counter()
+    try:
+        attempted, accepted = generate_levels(
+            range(start_seed, start_seed + count),
+            writer,
+            workers=workers,
+            stroke_budget=stroke_budget,
+            candidates=candidates,
+        )
+    finally:
+        writer.close()
+    click.echo(
+        f"Accepted {accepted}/{attempted} levels in "
+        f"{time.perf_counter() - started:.1f}s → {out_dir}"
+    )
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,160 @@
+"""
+Random maze layouts: a grid of cells carved into a spanning tree (so every
+cell is reachable) with a few extra walls knocked out to create loops.
+
+Everything is drawn from `random.Random(seed)`, so a seed always produces the
+same layout. The ball starts in a random cell and the hole goes in the cell
+farthest from it along the maze.
+"""
+
+import random
+from collections import deque
+from dataclasses import dataclass
+
+from minigolf.objects import EntityBuilder
+from minigolf.world import World
+
+Cell = tuple[int, int]
+Edge = tuple[Cell, Cell]
+
+ARENA_ORIGIN = (100, 100)
+ARENA_SIZE = 800
+WALL_THICKNESS = 2
+HOLE_RADIUS = 25
+
+
+@dataclass(frozen=True)
+class MazeLayout:
+    seed: int
+    cols: int
+    rows: int
+    # Interior walls, each between two adjacent cells (smaller cell first)
+    walls: frozenset[Edge]
+    ball: Cell
+    hole: Cell
+
+    @property
+    def cell_size(self) -> int:
+        return ARENA_SIZE // max(self.cols, self.rows)
+
+    def centre(self, cell: Cell) -> tuple[float, float]:
+        size = self.cell_size
+        return (
+            ARENA_ORIGIN[0] + (cell[0] + 0.5) * size,
+            ARENA_ORIGIN[1] + (cell[1] + 0.5) * size,
+        )
+
+    def locate(self, x: float, y: float) -> Cell:
+        """The cell containing a point, clamped to the grid."""
+        size = self.cell_size
+        col = int((x - ARENA_ORIGIN[0]) // size)
+        row = int((y - ARENA_ORIGIN[1]) // size)
+        return (min(max(col, 0), self.cols - 1), min(max(row, 0), self.rows - 1))
+
+    def neighbours(self, cell: Cell) -> list[Cell]:
+        """Adjacent cells not separated from `cell` by a wall."""
+        return [
+            other
+            for other in _adjacent(cell, self.cols, self.rows)
+            if _edge(cell, other) not in self.walls
+        ]
+
+    def path(self, start: Cell, goal: Cell) -> list[Cell]:
+        """Shortest cell path from start to goal, both inclusive."""
+        parents = _bfs(self, start)
+        path = [goal]
+        while path[-1] != start:
+            path.append(parents[path[-1]])
+        return path[::-1]
+
+    def build(self, world: World) -> None:
+        """Add the layout's walls, ball and hole to `world`."""
+        add = world.add_entity
+        size = self.cell_size
+        x0, y0 = ARENA_ORIGIN
+        width, height = self.cols * size, self.rows * size
+
+        # Outer borders
+        add(EntityBuilder().wall(x0, y0, width, WALL_THICKNESS).build())
+        add(EntityBuilder().wall(x0, y0 + height, width, WALL_THICKNESS).build())
+        add(EntityBuilder().wall(x0, y0, WALL_THICKNESS, height).build())
+        add(EntityBuilder().wall(x0 + width, y0, WALL_THICKNESS, height).build())
+
+        for (c, r), (oc, _) in sorted(self.walls):
+            x, y = x0 + c * size, y0 + r * size
+            if oc != c:
+                add(EntityBuilder().wall(x + size, y, WALL_THICKNESS, size).build())
+            else:
+                add(EntityBuilder().wall(x, y + size, size, WALL_THICKNESS).build())
+
+        bx, by = self.centre(self.ball)
+        add(EntityBuilder().ball(bx, by).velocity(dx=0, dy=0).build())
+        hx, hy = self.centre(self.hole)
+        add(EntityBuilder().hole(hx, hy, radius=HOLE_RADIUS).build())
+
+
+def generate_layout(
+    seed: int, min_cells: int = 3, max_cells: int = 5, loop_chance: float = 0.15
+) -> MazeLayout:
+    """Build a random maze layout; the same seed always gives the same maze."""
+    rng = random.Random(seed)
+    cols = rng.randint(min_cells, max_cells)
+    rows = rng.randint(min_cells, max_cells)
+
+    # Randomised depth-first carve: opened edges form a spanning tree
+    walls = {
+        _edge(cell, other)
+        for cell in _cells(cols, rows)
+        for other in _adjacent(cell, cols, rows)
+    }
+    start = (rng.randrange(cols), rng.randrange(rows))
+    visited = {start}
+    stack = [start]
+    while stack:
+        cell = stack[-1]
+        options = [c for c in _adjacent(cell, cols, rows) if c not in visited]
+        if not options:
+            stack.pop()
+            continue
+        nxt = rng.choice(options)
+        walls.discard(_edge(cell, nxt))
+        visited.add(nxt)
+        stack.append(nxt)
+
+    # Knock out a few more walls so there is more than one route
+    for edge in sorted(walls):
+        if rng.random() < loop_chance:
+            walls.discard(edge)
+
+    layout = MazeLayout(seed, cols, rows, frozenset(walls), start, start)
+    ball = (rng.randrange(cols), rng.randrange(rows))
+    # BFS visits cells in order of distance, so the last one is the farthest
+    hole = list(_bfs(layout, ball))[-1]
+    return MazeLayout(seed, cols, rows, frozenset(walls), ball, hole)
+
+
+def _cells(cols: int, rows: int) -> list[Cell]:
+    return [(c, r) for r in range(rows) for c in range(cols)]
+
+
+def _adjacent(cell: Cell, cols: int, rows: int) -> list[Cell]:
+    c, r = cell
+    candidates = [(c + 1, r), (c - 1, r), (c, r + 1), (c, r - 1)]
+    return [(x, y) for x, y in candidates if 0 <= x < cols and 0 <= y < rows]
+
+
+def _edge(a: Cell, b: Cell) -> Edge:
+    return (a, b) if a < b else (b, a)
+
+
+def _bfs(layout: MazeLayout, start: Cell) -> dict[Cell, Cell]:
+    """Parent of every reachable cell, keyed in visiting order."""
+    parents = {start: start}
+    queue = deque([start])
+    while queue:
+        cell = queue.popleft()
+        for other in layout.neighbours(cell):
+            if other not in parents:
+                parents[other] = cell
+                queue.append(other)
+    return parents
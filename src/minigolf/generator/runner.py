@@ -0,0 +1,133 @@
+"""
+Parallel level generation: one candidate maze per seed, validated by the
+solver in a worker process and streamed to disk as soon as it is judged.
+
+Every attempted seed gets a line in `index.jsonl` (accepted or not) so an
+interrupted run picks up where it stopped, and accepted levels are written
+next to it as `level_<seed>.json`.
+"""
+
+import json
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from minigolf.generator.maze import generate_layout
+from minigolf.generator.solver import (
+    DEFAULT_CANDIDATES,
+    DEFAULT_STROKE_BUDGET,
+    solve,
+)
+from minigolf.parallel import imap_bounded
+from minigolf.utils import drop_partial_line
+from minigolf.world import World
+
+INDEX_NAME = "index.jsonl"
+
+
+@dataclass(frozen=True)
+class GeneratedLevel:
+    seed: int
+    accepted: bool
+    cols: int
+    rows: int
+    walls: int
+    path_cells: int
+    # Solver stats; None when the solver gave up
+    strokes: int | None = None
+    rollouts: int | None = None
+    frames: int | None = None
+    level: dict[str, Any] | None = field(default=None, repr=False)
+
+    @property
+    def filename(self) -> str:
+        return f"level_{self.seed:06d}.json"
+
+
+def generate_level(
+    seed: int,
+    stroke_budget: int = DEFAULT_STROKE_BUDGET,
+    candidates: int = DEFAULT_CANDIDATES,
+) -> GeneratedLevel:
+    """Generate and validate the maze for `seed`."""
+    layout = generate_layout(seed)
+    path_cells = len(layout.path(layout.ball, layout.hole)) - 1
+    solution = solve(layout, stroke_budget=stroke_budget, candidates=candidates)
+    if solution is None:
+        return GeneratedLevel(
+            seed, False, layout.cols, layout.rows, len(layout.walls), path_cells
+        )
+
+    world = World()
+    layout.build(world)
+    return GeneratedLevel(
+        seed=seed,
+        accepted=True,
+        cols=layout.cols,
+        rows=layout.rows,
+        walls=len(layout.walls),
+        path_cells=path_cells,
+        strokes=solution.strokes,
+        rollouts=solution.rollouts,
+        frames=solution.frames,
+        level=world.to_json_dict(),
+    )
+
+
+class LevelWriter:
+    """Writes accepted levels and appends every attempt to the index."""
+
+    def __init__(self, out_dir: Path):
+        self.out_dir = out_dir
+        out_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = out_dir / INDEX_NAME
+        # An entry cut off by a crash is dropped, and its seed generated again
+        drop_partial_line(self.index_path)
+        self.done = self._read_done_seeds()
+        self._index = self.index_path.open("a")
+
+    def write(self, result: GeneratedLevel) -> None:
+        meta = asdict(result)
+        level = meta.pop("level")
+        if result.accepted:
+            meta["file"] = result.filename
+            # Write the level before indexing it, so the index never points
+            # at a file a crash prevented from existing
+            (self.out_dir / result.filename).write_text(json.dumps(level))
+        self._index.write(json.dumps(meta, separators=(",", ":")) + "\n")
+        self._index.flush()
+        self.done.add(result.seed)
+
+    def close(self) -> None:
+        self._index.close()
+
+    def _read_done_seeds(self) -> set[int]:
+        if not self.index_path.exists():
+            return set()
+        done: set[int] = set()
+        with self.index_path.open() as f:
+            for line in f:
+                try:
+                    done.add(int(json.loads(line)["seed"]))
+                except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                    continue
+        return done
+
+
+def generate_levels(
+    seeds: Iterable[int],
+    writer: LevelWriter,
+    workers: int = 1,
+    stroke_budget: int = DEFAULT_STROKE_BUDGET,
+    candidates: int = DEFAULT_CANDIDATES,
+) -> tuple[int, int]:
+    """Generate every seed not yet in the index; return (attempted, accepted)."""
+    todo = [seed for seed in seeds if seed not in writer.done]
+    job = partial(generate_level, stroke_budget=stroke_budget, candidates=candidates)
+    accepted = 0
+    for result in imap_bounded(job, todo, workers):
+        writer.write(result)
+        accepted += result.accepted
+    return len(todo), accepted
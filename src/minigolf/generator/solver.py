@@ -0,0 +1,112 @@
+"""
+Solver-backed validation: a level is only accepted if a simple headless
+player can sink the ball within a stroke budget.
+
+Each stroke aims at the farthest cell along the maze path that is in clear
+line of sight, hard enough to stop there on an open floor, then tries a few
+jittered variants and keeps whichever rollout ends closest to the hole
+(measured along the maze). Jitter comes from the layout's seed, so solving is
+as reproducible as generation.
+"""
+
+import random
+from dataclasses import dataclass
+from math import atan2, cos, hypot, sin
+
+from pymunk import ShapeFilter, Vec2d
+
+from minigolf.components import Action, Collider
+from minigolf.consts import DECAY_PER_PX, STOPPING_VELOCITY, WALL_COLLISION_TYPE
+from minigolf.game.rollout import place_ball, simulate_stroke
+from minigolf.generator.maze import MazeLayout
+from minigolf.systems.physics import PhysicsSpace
+from minigolf.world import World
+
+DEFAULT_STROKE_BUDGET = 8
+DEFAULT_CANDIDATES = 4
+# Extra clearance around the ball's radius for line-of-sight checks
+SIGHT_MARGIN = 4.0
+
+
+@dataclass(frozen=True)
+class Solution:
+    """How the solver sank the ball; doubles as difficulty metadata."""
+
+    strokes: int
+    rollouts: int
+    frames: int
+    path_cells: int
+
+
+def solve(
+    layout: MazeLayout,
+    stroke_budget: int = DEFAULT_STROKE_BUDGET,
+    candidates: int = DEFAULT_CANDIDATES,
+) -> Solution | None:
+    """Try to sink the ball within `stroke_budget` strokes; None if unsolved."""
+    world = World()
+    layout.build(world)
+    physics = PhysicsSpace(world)
+    physics.populate()
+    ball = world.get_balls()[0]
+    body = physics.eid_to_body[ball.id].body
+    radius = ball.get(Collider).shape.radius
+    rng = random.Random(layout.seed)
+
+    rollouts = frames = 0
+    for stroke in range(1, stroke_budget + 1):
+        start = Vec2d(*body.position)
+        aim = _aim(layout, physics, start, radius + SIGHT_MARGIN)
+        best_rest, best_score = start, _remaining(layout, start)
+        for i in range(candidates):
+            action = aim if i == 0 else _jitter(aim, rng)
+            place_ball(physics, ball.id, start)
+            result = simulate_stroke(world, physics, action, ball_eid=ball.id)
+            rollouts += 1
+            frames += result.frames
+            if result.won:
+                path_cells = len(layout.path(layout.ball, layout.hole)) - 1
+                return Solution(stroke, rollouts, frames, path_cells)
+            score = _remaining(layout, Vec2d(*result.rest))
+            if score < best_score:
+                best_rest, best_score = Vec2d(*result.rest), score
+        place_ball(physics, ball.id, best_rest)
+    return None
+
+
+def _aim(
+    layout: MazeLayout, physics: PhysicsSpace, start: Vec2d, clearance: float
+) -> Action:
+    """Strike at the farthest visible cell on the maze path to the hole."""
+    path = layout.path(layout.locate(*start), layout.hole)
+    target = Vec2d(*layout.centre(path[0]))
+    for cell in reversed(path[1:]):
+        centre = Vec2d(*layout.centre(cell))
+        if _clear(physics, start, centre, clearance):
+            target = centre
+            break
+    offset = target - start
+    dist = offset.length
+    if dist == 0:
+        return Action(type="strike", velocity=(0.0, 0.0))
+    speed = dist * DECAY_PER_PX + STOPPING_VELOCITY
+    return Action(type="strike", velocity=tuple(offset / dist * speed))
+
+
+def _jitter(action: Action, rng: random.Random) -> Action:
+    vx, vy = action.velocity
+    angle = atan2(vy, vx) + rng.uniform(-0.15, 0.15)
+    speed = hypot(vx, vy) * rng.uniform(0.9, 1.2)
+    return Action(type="strike", velocity=(cos(angle) * speed, sin(angle) * speed))
+
+
+def _clear(physics: PhysicsSpace, a: Vec2d, b: Vec2d, clearance: float) -> bool:
+    hits = physics.space.segment_query(a, b, clearance, ShapeFilter())
+    return not any(hit.shape.collision_type == WALL_COLLISION_TYPE for hit in hits)
+
+
+def _remaining(layout: MazeLayout, pos: Vec2d) -> float:
+    """Distance left to the hole, following the maze's cell path."""
+    cell = layout.locate(*pos)
+    steps = len(layout.path(cell, layout.hole)) - 1
+    return steps * layout.cell_size + pos.get_distance(layout.centre(cell))
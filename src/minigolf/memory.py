@@ -0,0 +1,359 @@
+"""
+Memory diagnostics: where a world, a physics space or the editor's history
+is spending memory, and what grew between two points in time.
+
+Sizes:
+
+- report(world=..., physics=..., editor=...) estimates the bytes held by
+  each component type in a World (a deep sys.getsizeof walk; objects shared
+  between components are counted once), counts a PhysicsSpace's pymunk
+  bodies and shapes, and the depth and bytes of the editor's undo/redo
+  stacks, which hold a deep copy of every entity per snapshot.
+- format_report() / log_report() turn that into lines for loguru.
+
+Growth:
+
+- start() turns on tracemalloc, snapshot() takes a snapshot, and
+  diff(before, after) sums the change per subsystem. An allocation is
+  charged to the innermost minigolf module on its traceback (so a deepcopy
+  made by the editor counts against minigolf.editor.actions, not the copy
+  module), and to the allocating package otherwise.
+
+`minigolf --memory` and `minigolf-editor --memory` log both on exit, the
+growth measured from startup. MINIGOLF_MEMORY=1 starts tracemalloc at
+import, e.g. for a script or a worker process.
+"""
+
+import os
+import sys
+import sysconfig
+import tracemalloc
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import TYPE_CHECKING, Any, Protocol
+
+import pymunk
+from loguru import logger
+
+if TYPE_CHECKING:
+    from minigolf.entity import Entity
+    from minigolf.systems.physics import PhysicsSpace
+    from minigolf.world import World
+
+# Frames kept per allocation: enough to get from pydantic/copy internals
+# back out to the minigolf code that asked for them
+DEFAULT_FRAMES = 25
+# Subsystems listed by log_report(), largest change first
+TOP_SUBSYSTEMS = 10
+PACKAGE = "minigolf"
+STDLIB = "<stdlib>"
+OTHER = "<other>"
+
+# Shared, immutable or owned by the interpreter: never part of an object's size
+_SKIP = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType, Enum)
+_LEAVES = (str, bytes, int, float, complex, bool, type(None))
+_STDLIB_DIR = str(Path(sysconfig.get_path("stdlib")).resolve())
+
+
+class EditorHistory(Protocol):
+    """The part of the editor's State read here (no pygame import needed)."""
+
+    undo_stack: list[dict[int, "Entity"]]
+    redo_stack: list[dict[int, "Entity"]]
+
+
+def deep_sizeof(obj: Any, seen: set[int] | None = None) -> int:
+    """
+    sys.getsizeof of `obj` and everything it references, skipping ids in
+    `seen` (updated in place, so a shared set counts shared objects once).
+    Types, modules, functions and enum members are not counted.
+    """
+    if seen is None:
+        seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen or isinstance(item, _SKIP):
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, _LEAVES):
+            continue
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, list | tuple | set | frozenset | deque):
+            stack.extend(item)
+        else:
+            if hasattr(item, "__dict__"):
+                stack.append(item.__dict__)
+            for cls in type(item).__mro__:
+                for slot in getattr(cls, "__slots__", ()):
+                    if slot != "__dict__" and hasattr(item, slot):
+                        stack.append(getattr(item, slot))
+    return total
+
+
+# Sizes
+
+
+@dataclass
+class ComponentUsage:
+    count: int = 0
+    bytes: int = 0
+
+
+@dataclass
+class WorldUsage:
+    entities: int
+    # Entity objects and their component dicts
+    entity_bytes: int
+    components: dict[str, ComponentUsage]
+
+    @property
+    def bytes(self) -> int:
+        return self.entity_bytes + sum(c.bytes for c in self.components.values())
+
+
+@dataclass
+class PhysicsUsage:
+    # pymunk bodies in the space by type ("static", "dynamic", "kinematic"),
+    # not counting the space's own static_body
+    bodies: dict[str, int]
+    # pymunk shapes in the space by class name ("Poly", "Circle", ...)
+    shapes: dict[str, int]
+    # Entities with a body: static, dynamic
+    registered: tuple[int, int]
+    contacts: int
+
+
+@dataclass
+class HistoryUsage:
+    undo_depth: int
+    undo_bytes: int
+    redo_depth: int
+    redo_bytes: int
+
+
+@dataclass
+class MemoryReport:
+    world: WorldUsage | None = None
+    physics: PhysicsUsage | None = None
+    history: HistoryUsage | None = None
+    # Subsystem -> bytes allocated since the baseline (see diff())
+    growth: dict[str, int] = field(default_factory=dict)
+
+
+def world_usage(world: "World") -> WorldUsage:
+    seen: set[int] = set()
+    components: dict[str, ComponentUsage] = {}
+    entity_bytes = 0
+    for entity in world.entities.values():
+        seen.add(id(entity))
+        entity_bytes += sys.getsizeof(entity) + sys.getsizeof(entity.components)
+        for comp_type, comp in entity.components.items():
+            usage = components.setdefault(comp_type.__name__, ComponentUsage())
+            usage.count += 1
+            usage.bytes += deep_sizeof(comp, seen)
+    return WorldUsage(len(world.entities), entity_bytes, components)
+
+
+_BODY_TYPES = {
+    pymunk.Body.STATIC: "static",
+    pymunk.Body.DYNAMIC: "dynamic",
+    pymunk.Body.KINEMATIC: "kinematic",
+}
+
+
+def physics_usage(physics: "PhysicsSpace") -> PhysicsUsage:
+    space = physics.space
+    return PhysicsUsage(
+        bodies=dict(Counter(_BODY_TYPES[body.body_type] for body in space.bodies)),
+        shapes=dict(Counter(type(shape).__name__ for shape in space.shapes)),
+        registered=(len(physics.static_bodies), len(physics.dynamic_bodies)),
+        contacts=len(physics.contacts),
+    )
+
+
+def history_usage(editor: EditorHistory) -> HistoryUsage:
+    # Snapshots are independent deep copies, so they are sized separately
+    return HistoryUsage(
+        undo_depth=len(editor.undo_stack),
+        undo_bytes=deep_sizeof(editor.undo_stack),
+        redo_depth=len(editor.redo_stack),
+        redo_bytes=deep_sizeof(editor.redo_stack),
+    )
+
+
+def report(
+    *,
+    world: "World | None" = None,
+    physics: "PhysicsSpace | None" = None,
+    editor: EditorHistory | None = None,
+) -> MemoryReport:
+    """Sizes of whichever of a world, physics space and editor are given."""
+    return MemoryReport(
+        world=world_usage(world) if world is not None else None,
+        physics=physics_usage(physics) if physics is not None else None,
+        history=history_usage(editor) if editor is not None else None,
+    )
+
+
+# Growth
+
+
+_baseline: tracemalloc.Snapshot | None = None
+
+
+def start(frames: int = DEFAULT_FRAMES) -> None:
+    """Trace allocations from now on, and snapshot now as the baseline."""
+    global _baseline
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+    _baseline = snapshot()
+
+
+def stop() -> None:
+    global _baseline
+    tracemalloc.stop()
+    _baseline = None
+
+
+def is_tracing() -> bool:
+    return tracemalloc.is_tracing()
+
+
+def snapshot() -> tracemalloc.Snapshot:
+    if not tracemalloc.is_tracing():
+        raise RuntimeError("Not tracing allocations; call memory.start() first")
+    return tracemalloc.take_snapshot()
+
+
+@lru_cache(maxsize=None)
+def subsystem(filename: str) -> str | None:
+    """
+    The minigolf module (at most three levels deep) a file is, or None for
+    code outside the package.
+    """
+    parts = Path(filename).with_suffix("").parts
+    if PACKAGE not in parts:
+        return None
+    module = parts[len(parts) - 1 - parts[::-1].index(PACKAGE) :]
+    if module[-1] == "__init__":
+        module = module[:-1]
+    return ".".join(module[:3])
+
+
+@lru_cache(maxsize=None)
+def _package(filename: str) -> str:
+    path = Path(filename)
+    for marker in ("site-packages", "dist-packages"):
+        if marker in path.parts:
+            rest = path.parts[path.parts.index(marker) + 1 :]
+            return Path(rest[0]).stem if rest else OTHER
+    if str(path.resolve()).startswith(_STDLIB_DIR) or filename.startswith("<"):
+        return STDLIB
+    return OTHER
+
+
+def _charge(traceback: tracemalloc.Traceback) -> str:
+    # Frames run oldest to newest: the innermost minigolf frame is the
+    # code responsible, whatever library did the allocating for it
+    for frame in reversed(traceback):
+        name = subsystem(frame.filename)
+        if name is not None:
+            return name
+    return _package(traceback[-1].filename) if len(traceback) else OTHER
+
+
+def by_subsystem(snap: tracemalloc.Snapshot) -> dict[str, int]:
+    """Bytes currently allocated per subsystem, tracemalloc's own excluded."""
+    sizes: Counter[str] = Counter()
+    for stat in snap.statistics("traceback"):
+        # Cheaper than Snapshot.filter_traces(), which matches every frame
+        if stat.traceback[-1].filename == tracemalloc.__file__:
+            continue
+        sizes[_charge(stat.traceback)] += stat.size
+    return dict(sizes)
+
+
+def diff(before: tracemalloc.Snapshot, after: tracemalloc.Snapshot) -> dict[str, int]:
+    """Change in bytes allocated per subsystem, largest growth first."""
+    old, new = by_subsystem(before), by_subsystem(after)
+    changes = {name: new.get(name, 0) - old.get(name, 0) for name in old | new}
+    return dict(
+        sorted(
+            ((name, change) for name, change in changes.items() if change),
+            key=lambda item: -item[1],
+        )
+    )
+
+
+def growth() -> dict[str, int]:
+    """diff() from the start() baseline to now; empty if not tracing."""
+    if _baseline is None or not tracemalloc.is_tracing():
+        return {}
+    return diff(_baseline, snapshot())
+
+
+# Output
+
+
+def _kb(n: int) -> str:
+    return f"{n / 1024:,.1f} KiB"
+
+
+def format_report(memory: MemoryReport, top: int = TOP_SUBSYSTEMS) -> list[str]:
+    lines = []
+    if memory.world is not None:
+        world = memory.world
+        lines.append(
+            f"[Memory] World: {world.entities} entities, {_kb(world.bytes)} "
+            f"({_kb(world.entity_bytes)} entity overhead)"
+        )
+        ranked = sorted(world.components.items(), key=lambda item: -item[1].bytes)
+        for name, usage in ranked:
+            lines.append(f"[Memory]   {name}: {_kb(usage.bytes)} in {usage.count}")
+    if memory.physics is not None:
+        physics = memory.physics
+        lines.append(
+            f"[Memory] Physics: bodies {physics.bodies}, shapes {physics.shapes}, "
+            f"registered static={physics.registered[0]} "
+            f"dynamic={physics.registered[1]}, contacts={physics.contacts}"
+        )
+    if memory.history is not None:
+        history = memory.history
+        lines.append(
+            f"[Memory] Editor history: undo {history.undo_depth} "
+            f"({_kb(history.undo_bytes)}), redo {history.redo_depth} "
+            f"({_kb(history.redo_bytes)})"
+        )
+    if memory.growth:
+        lines.append(
+            f"[Memory] Allocated since start: {_kb(sum(memory.growth.values()))}"
+        )
+        for name, change in list(memory.growth.items())[:top]:
+            lines.append(f"[Memory]   {name}: {change / 1024:+,.1f} KiB")
+    return lines
+
+
+def log_report(
+    *,
+    world: "World | None" = None,
+    physics: "PhysicsSpace | None" = None,
+    editor: EditorHistory | None = None,
+) -> None:
+    """Log report() of what is given, plus growth() when tracing."""
+    memory = report(world=world, physics=physics, editor=editor)
+    memory.growth = growth()
+    for line in format_report(memory):
+        logger.info(line)
+
+
+if os.environ.get("MINIGOLF_MEMORY", "").lower() in ("1", "true", "on"):
+    start()
@@ -9,9 +9,17 @@ from minigolf.components import (
     Position,
     Rect,
     Renderable,
+    Terrain,
     Velocity,
 )
-from minigolf.consts import DEFAULT_ELASTICITY, DEFAULT_WALL_FRICTION
+from minigolf.consts import (
+    DEFAULT_ELASTICITY,
+    DEFAULT_FLOOR_FRICTION,
+    DEFAULT_WALL_FRICTION,
+    ICE_DAMPING,
+    SAND_DAMPING,
+    SLOPE_ACCELERATION,
+)
 from minigolf.entity import Entity
 
 if TYPE_CHECKING:
@@ -22,6 +30,7 @@ class EntityRole(str, Enum):
     BALL = "ball"
     WALL = "wall"
     HOLE = "hole"
+    TERRAIN = "terrain"
 
 
 class EntityBuilder:
@@ -112,6 +121,71 @@ class EntityBuilder:
         ]
         return self
 
+    def terrain(
+        self,
+        x: float,
+        y: float,
+        width: int,
+        height: int,
+        damping: float,
+        acceleration: tuple[float, float] = (0.0, 0.0),
+        colour: tuple[int, int, int] = (120, 120, 120),
+    ) -> "EntityBuilder":
+        """
+        Create a terrain zone changing how balls roll inside a rectangle.
+
+        Args:
+            x (float): The x-coordinate of the zone's top-left corner.
+            y (float): The y-coordinate of the zone's top-left corner.
+            width (int): The width of the zone.
+            height (int): The height of the zone.
+            damping (float): Velocity fraction kept per second inside the zone.
+            acceleration (tuple[float, float]): Constant pull inside the zone.
+        """
+        self._set_role(EntityRole.TERRAIN)
+        shape = Rect(width=width, height=height)
+        self.components += [
+            Position(x=x, y=y),
+            Collider(shape=shape),
+            Renderable(colour=colour, shape=shape),
+            Terrain(damping=damping, acceleration=acceleration),
+        ]
+        return self
+
+    def sand(self, x: float, y: float, width: int, height: int) -> "EntityBuilder":
+        """Create a sand zone: balls slow down much faster than on the floor."""
+        return self.terrain(x, y, width, height, SAND_DAMPING, colour=(194, 178, 128))
+
+    def ice(self, x: float, y: float, width: int, height: int) -> "EntityBuilder":
+        """Create an ice zone: balls barely slow down."""
+        return self.terrain(x, y, width, height, ICE_DAMPING, colour=(170, 220, 255))
+
+    def slope(
+        self,
+        x: float,
+        y: float,
+        width: int,
+        height: int,
+        downhill: tuple[float, float] = (0.0, 1.0),
+    ) -> "EntityBuilder":
+        """
+        Create a slope zone pulling balls along `downhill` (a unit vector)
+        with SLOPE_ACCELERATION.
+        """
+        acceleration = (
+            downhill[0] * SLOPE_ACCELERATION,
+            downhill[1] * SLOPE_ACCELERATION,
+        )
+        return self.terrain(
+            x,
+            y,
+            width,
+            height,
+            DEFAULT_FLOOR_FRICTION,
+            acceleration=acceleration,
+            colour=(60, 110, 60),
+        )
+
     def velocity(self, dx: float, dy: float) -> "EntityBuilder":
         # Keep this strict: only valid while building a ball
         if self._role not in (None, EntityRole.BALL):
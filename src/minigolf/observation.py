@@ -0,0 +1,265 @@
+"""
+Observation encoding: World -> NumPy arrays for agents.
+
+Two encodings share one per-level cache:
+
+- vector: a fixed-size float32 vector (VECTOR_FIELDS) with the player ball's
+  position and velocity, the first hole, and the offset between them.
+- grid: a (GRID_CHANNELS, n, n) float32 stack over the level's bounding box:
+  wall occupancy, the ball's cell, and the hole's disc.
+
+Walls never move, so their occupancy layer (and the entity lookups both
+encodings need) is built once per World and reused. Each call then only
+reads the ball and hole components and writes them into a preallocated
+buffer. Call invalidate() after editing a level's walls.
+"""
+
+import weakref
+from collections.abc import Sequence
+from dataclasses import dataclass
+from math import ceil, floor
+
+import numpy as np
+
+from minigolf.components import (
+    Circle,
+    Collider,
+    Hole,
+    PhysicsBody,
+    Position,
+    Rect,
+    Velocity,
+)
+from minigolf.entity import Entity
+from minigolf.systems.turn import get_player_ball
+from minigolf.world import World
+
+VECTOR_FIELDS: tuple[str, ...] = (
+    "ball_x",
+    "ball_y",
+    "ball_vx",
+    "ball_vy",
+    "hole_x",
+    "hole_y",
+    "hole_radius",
+    "to_hole_x",
+    "to_hole_y",
+    "to_hole_distance",
+)
+VECTOR_SIZE = len(VECTOR_FIELDS)
+
+WALL_CHANNEL, BALL_CHANNEL, HOLE_CHANNEL = range(3)
+GRID_CHANNELS = 3
+DEFAULT_GRID_SIZE = 64
+
+Bounds = tuple[float, float, float, float]
+
+
+@dataclass
+class StaticLayer:
+    """Everything about a level that does not change between frames."""
+
+    bounds: Bounds
+    cell_size: tuple[float, float]
+    walls: np.ndarray
+    hole: Entity | None
+    # player_id -> ball entity, filled on first use
+    balls: dict[int, Entity]
+
+    def cell(self, x: float, y: float) -> tuple[int, int] | None:
+        """(row, col) of the grid cell containing a point, or None if outside."""
+        n = self.walls.shape[0]
+        col = int((x - self.bounds[0]) / self.cell_size[0])
+        row = int((y - self.bounds[1]) / self.cell_size[1])
+        if 0 <= col < n and 0 <= row < n:
+            return row, col
+        return None
+
+
+class ObservationEncoder:
+    """
+    Encodes worlds into preallocated arrays.
+
+    Without `out`, results are written into buffers owned by the encoder and
+    are overwritten by the next call of the same kind; copy them to keep them.
+    """
+
+    def __init__(
+        self, grid_size: int = DEFAULT_GRID_SIZE, bounds: Bounds | None = None
+    ):
+        self.grid_size = grid_size
+        self.bounds = bounds
+        self._static: weakref.WeakKeyDictionary[World, StaticLayer] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._vector = np.zeros(VECTOR_SIZE, dtype=np.float32)
+        self._grid = np.zeros((GRID_CHANNELS, grid_size, grid_size), dtype=np.float32)
+        self._vector_batch = np.zeros((0, VECTOR_SIZE), dtype=np.float32)
+        self._grid_batch = np.zeros(
+            (0, GRID_CHANNELS, grid_size, grid_size), dtype=np.float32
+        )
+
+    # Static layer cache
+
+    def static(self, world: World) -> StaticLayer:
+        """Return the cached static layer for `world`, building it on first use."""
+        layer = self._static.get(world)
+        if layer is None:
+            layer = self._build_static(world)
+            self._static[world] = layer
+        return layer
+
+    def invalidate(self, world: World | None = None) -> None:
+        """Forget the static layer of `world` (of every world when None)."""
+        if world is None:
+            self._static.clear()
+        else:
+            self._static.pop(world, None)
+
+    def _build_static(self, world: World) -> StaticLayer:
+        n = self.grid_size
+        walls = world.all_with(PhysicsBody, Collider, Position)
+        boxes = [_bbox(e) for e in walls if e.get(PhysicsBody).anchored]
+
+        bounds = self.bounds
+        if bounds is None:
+            everything = [_bbox(e) for e in world.all_with(Collider, Position)]
+            if everything:
+                x0s, y0s, x1s, y1s = zip(*everything)
+                bounds = (min(x0s), min(y0s), max(x1s), max(y1s))
+            else:
+                bounds = (0.0, 0.0, 1.0, 1.0)
+        cell_w = max(bounds[2] - bounds[0], 1e-6) / n
+        cell_h = max(bounds[3] - bounds[1], 1e-6) / n
+
+        occupancy = np.zeros((n, n), dtype=np.float32)
+        for x0, y0, x1, y1 in boxes:
+            c0, c1 = _span(x0, x1, bounds[0], cell_w, n)
+            r0, r1 = _span(y0, y1, bounds[1], cell_h, n)
+            occupancy[r0:r1, c0:c1] = 1.0
+
+        holes = world.all_with(Hole, Position, Collider)
+        return StaticLayer(
+            bounds=bounds,
+            cell_size=(cell_w, cell_h),
+            walls=occupancy,
+            hole=holes[0] if holes else None,
+            balls={},
+        )
+
+    def _ball(self, world: World, layer: StaticLayer, player_id: int) -> Entity:
+        ball = layer.balls.get(player_id)
+        if ball is None or ball.id not in world.entities:
+            ball = layer.balls[player_id] = get_player_ball(world, player_id)
+        return ball
+
+    # Vector encoding
+
+    def vector(
+        self, world: World, player_id: int = 0, out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Encode `world` for `player_id` as a (VECTOR_SIZE,) float32 array."""
+        out = self._vector if out is None else out
+        self._fill_vector(world, player_id, out)
+        return out
+
+    def vector_batch(
+        self,
+        worlds: Sequence[World],
+        player_ids: Sequence[int] | None = None,
+        out: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Encode many worlds into an (N, VECTOR_SIZE) array, one row each."""
+        if out is None:
+            self._vector_batch = _ensure_rows(self._vector_batch, len(worlds))
+            out = self._vector_batch[: len(worlds)]
+        for i, world in enumerate(worlds):
+            self._fill_vector(world, player_ids[i] if player_ids else 0, out[i])
+        return out
+
+    def _fill_vector(self, world: World, player_id: int, out: np.ndarray) -> None:
+        layer = self.static(world)
+        ball = self._ball(world, layer, player_id)
+        pos, vel = ball.get(Position), ball.get(Velocity)
+        out[0:4] = (pos.x, pos.y, vel.dx, vel.dy)
+        if layer.hole is None:
+            out[4:] = 0.0
+            return
+        hole_pos = layer.hole.get(Position)
+        dx, dy = hole_pos.x - pos.x, hole_pos.y - pos.y
+        out[4:] = (
+            hole_pos.x,
+            hole_pos.y,
+            getattr(layer.hole.get(Collider).shape, "radius", 0.0),
+            dx,
+            dy,
+            (dx * dx + dy * dy) ** 0.5,
+        )
+
+    # Grid encoding
+
+    def grid(
+        self, world: World, player_id: int = 0, out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Encode `world` for `player_id` as a (GRID_CHANNELS, n, n) array."""
+        out = self._grid if out is None else out
+        self._fill_grid(world, player_id, out)
+        return out
+
+    def grid_batch(
+        self,
+        worlds: Sequence[World],
+        player_ids: Sequence[int] | None = None,
+        out: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Encode many worlds into an (N, GRID_CHANNELS, n, n) array."""
+        if out is None:
+            self._grid_batch = _ensure_rows(self._grid_batch, len(worlds))
+            out = self._grid_batch[: len(worlds)]
+        for i, world in enumerate(worlds):
+            self._fill_grid(world, player_ids[i] if player_ids else 0, out[i])
+        return out
+
+    def _fill_grid(self, world: World, player_id: int, out: np.ndarray) -> None:
+        layer = self.static(world)
+        out[WALL_CHANNEL] = layer.walls
+        out[BALL_CHANNEL] = 0.0
+        out[HOLE_CHANNEL] = 0.0
+
+        pos = self._ball(world, layer, player_id).get(Position)
+        cell = layer.cell(pos.x, pos.y)
+        if cell is not None:
+            out[BALL_CHANNEL][cell] = 1.0
+
+        if layer.hole is not None:
+            x0, y0, x1, y1 = _bbox(layer.hole)
+            n = self.grid_size
+            c0, c1 = _span(x0, x1, layer.bounds[0], layer.cell_size[0], n)
+            r0, r1 = _span(y0, y1, layer.bounds[1], layer.cell_size[1], n)
+            out[HOLE_CHANNEL, r0:r1, c0:c1] = 1.0
+
+
+def _bbox(entity: Entity) -> tuple[float, float, float, float]:
+    """Axis-aligned (x0, y0, x1, y1) of an entity's collider."""
+    pos = entity.get(Position)
+    shape = entity.get(Collider).shape
+    if isinstance(shape, Rect):
+        return (pos.x, pos.y, pos.x + shape.width, pos.y + shape.height)
+    if isinstance(shape, Circle):
+        r = shape.radius
+        return (pos.x - r, pos.y - r, pos.x + r, pos.y + r)
+    return (pos.x, pos.y, pos.x, pos.y)
+
+
+def _span(lo: float, hi: float, origin: float, size: float, n: int) -> tuple[int, int]:
+    """Half-open range of cells overlapping [lo, hi] along one axis."""
+    start = floor((lo - origin) / size)
+    stop = max(ceil((hi - origin) / size), start + 1)
+    return max(start, 0), min(max(stop, 0), n)
+
+
+def _ensure_rows(buffer: np.ndarray, rows: int) -> np.ndarray:
+    """Grow a batch buffer to hold at least `rows` rows (doubling)."""
+    if len(buffer) >= rows:
+        return buffer
+    return np.zeros((max(rows, 2 * len(buffer)), *buffer.shape[1:]), buffer.dtype)
@@ -0,0 +1,47 @@
+"""
+Process-pool helpers shared by the batch runner, level generator and
+analysis tools.
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    as_completed,
+    wait,
+)
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def imap_bounded(
+    fn: Callable[[T], R], items: Iterable[T], workers: int = 1
+) -> Iterator[R]:
+    """
+    Yield fn(item) for every item in completion order, using a process pool
+    when workers > 1. Only a bounded number of items is in flight at once so
+    huge (or lazy) inputs are never queued up front; stopping iteration
+    early cancels whatever has not started yet.
+    """
+    if workers <= 1:
+        yield from map(fn, items)
+        return
+
+    window = workers * 4
+    in_flight: set[Future[R]] = set()
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        for item in items:
+            in_flight.add(pool.submit(fn, item))
+            if len(in_flight) < window:
+                continue
+            finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                yield future.result()
+        for future in as_completed(in_flight):
+            yield future.result()
+    finally:
+        pool.shutdown(cancel_futures=True)
@@ -0,0 +1,4 @@
+from .protocol import Observation, basic_observation
+from .server import PolicyServer
+
+__all__ = ["Observation", "PolicyServer", "basic_observation"]
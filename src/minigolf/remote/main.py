@@ -0,0 +1,50 @@
+import importlib
+import sys
+from pathlib import Path
+
+import click
+from loguru import logger
+
+from minigolf.remote.server import Policy, PolicyServer
+
+
+def load_policy(spec: str) -> Policy:
+    """Resolve a 'package.module:attribute' import path to a policy callable."""
+    module_name, _, attr = spec.partition(":")
+    if not attr:
+        raise click.BadParameter(f"Expected 'module:attribute', got {spec!r}")
+    policy = getattr(importlib.import_module(module_name), attr)
+    if not callable(policy):
+        raise click.BadParameter(f"{spec} is not callable")
+    return policy
+
+
+@click.command()
+@click.argument("socket_path", type=click.Path(path_type=Path))
+@click.option(
+    "--policy",
+    default="minigolf.remote.policies:aim_at_hole",
+    show_default=True,
+    help="Import path of a batched policy: list[Observation] -> list[Action].",
+)
+@click.option("--window-ms", default=5.0, show_default=True, help="Batch window.")
+@click.option("--max-batch", default=256, show_default=True)
+def cli(socket_path: Path, policy: str, window_ms: float, max_batch: int) -> None:
+    """
+    Serve a policy to RemoteControllers over a Unix socket at SOCKET_PATH.
+    """
+    server = PolicyServer(
+        socket_path,
+        load_policy(policy),
+        batch_window=window_ms / 1000.0,
+        max_batch=max_batch,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("[PolicyServer] Shutting down")
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,27 @@
+"""Reference policies for the policy server (batched: many observations in)."""
+
+from math import hypot
+
+from minigolf.components import Action
+from minigolf.consts import DECAY_PER_PX, STOPPING_VELOCITY
+from minigolf.remote.protocol import Observation
+
+
+def aim_at_hole(observations: list[Observation]) -> list[Action | None]:
+    """
+    Strike straight at the hole, just hard enough to reach it on an open
+    floor. Expects basic_observation() vectors.
+    """
+    actions: list[Action | None] = []
+    for obs in observations:
+        bx, by, _, _, hx, hy, _ = obs.values[:7]
+        dx, dy = hx - bx, hy - by
+        dist = hypot(dx, dy)
+        if dist == 0:
+            actions.append(None)
+            continue
+        speed = dist * DECAY_PER_PX + STOPPING_VELOCITY
+        actions.append(
+            Action(type="strike", velocity=(dx / dist * speed, dy / dist * speed))
+        )
+    return actions
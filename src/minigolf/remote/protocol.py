@@ -0,0 +1,87 @@
+"""
+Wire format between RemoteController and the policy server.
+
+Both directions are fixed-layout little-endian frames, no JSON:
+
+- Request:  request_id u32 | player_id i32 | n u16 | n × f32 observation
+- Response: request_id u32 | kind u8 | vx f32 | vy f32 | angular_velocity f32
+
+kind is 0 for "no action", otherwise an index into ACTION_KINDS.
+"""
+
+import struct
+from typing import NamedTuple
+
+from minigolf.components import Action, Collider, Hole, Position, Velocity
+from minigolf.systems.turn import get_player_ball
+from minigolf.world import World
+
+REQUEST_HEADER = struct.Struct("<IiH")
+RESPONSE = struct.Struct("<IBfff")
+ACTION_KINDS: tuple[str, ...] = ("", "strike", "reset")
+
+# Length of basic_observation() vectors
+BASIC_OBSERVATION_SIZE = 7
+
+
+class Observation(NamedTuple):
+    player_id: int
+    values: tuple[float, ...]
+
+
+def encode_request(request_id: int, obs: Observation) -> bytes:
+    n = len(obs.values)
+    return REQUEST_HEADER.pack(request_id, obs.player_id, n) + struct.pack(
+        f"<{n}f", *obs.values
+    )
+
+
+def decode_requests(buffer: bytearray) -> list[tuple[int, Observation]]:
+    """Pop every complete request frame off the front of `buffer`."""
+    out: list[tuple[int, Observation]] = []
+    offset = 0
+    while len(buffer) - offset >= REQUEST_HEADER.size:
+        request_id, player_id, n = REQUEST_HEADER.unpack_from(buffer, offset)
+        end = offset + REQUEST_HEADER.size + 4 * n
+        if len(buffer) < end:
+            break
+        values = struct.unpack_from(f"<{n}f", buffer, offset + REQUEST_HEADER.size)
+        out.append((request_id, Observation(player_id, values)))
+        offset = end
+    del buffer[:offset]
+    return out
+
+
+def encode_response(request_id: int, action: Action | None) -> bytes:
+    if action is None:
+        return RESPONSE.pack(request_id, 0, 0.0, 0.0, 0.0)
+    vx, vy = action.velocity
+    kind = ACTION_KINDS.index(action.type)
+    return RESPONSE.pack(request_id, kind, vx, vy, action.angular_velocity)
+
+
+def decode_response(data: bytes) -> tuple[int, Action | None]:
+    request_id, kind, vx, vy, av = RESPONSE.unpack(data)
+    if kind == 0:
+        return request_id, None
+    action = Action(type=ACTION_KINDS[kind], velocity=(vx, vy), angular_velocity=av)
+    return request_id, action
+
+
+def basic_observation(world: World, player_id: int) -> Observation:
+    """
+    Player ball position and velocity, plus the first hole's position and
+    radius: [bx, by, bvx, bvy, hx, hy, hr].
+    """
+    ball = get_player_ball(world, player_id)
+    pos, vel = ball.get(Position), ball.get(Velocity)
+    values = [pos.x, pos.y, vel.dx, vel.dy, 0.0, 0.0, 0.0]
+    for hole in world.all_with(Hole, Position, Collider):
+        hole_pos = hole.get(Position)
+        values[4:] = [
+            hole_pos.x,
+            hole_pos.y,
+            getattr(hole.get(Collider).shape, "radius", 0.0),
+        ]
+        break
+    return Observation(player_id, tuple(values))
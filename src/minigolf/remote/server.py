@@ -0,0 +1,173 @@
+"""
+Policy server: answers RemoteController requests from many games at once.
+
+A single thread multiplexes all client connections on a Unix socket. Requests
+that arrive within `batch_window` seconds of the first pending one (or until
+`max_batch` are queued) are answered by one policy call, amortising the cost
+of e.g. a neural network forward pass across environments.
+
+Replies are queued per connection and written as the socket becomes
+writable, so a client that stops reading only holds up itself. If the
+policy raises, or returns the wrong number of actions, every request in the
+batch is answered with "no action" rather than left waiting.
+"""
+
+import os
+import selectors
+import socket
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from loguru import logger
+
+from minigolf.components import Action
+from minigolf.remote.protocol import Observation, decode_requests, encode_response
+
+Policy = Callable[[list[Observation]], list[Action | None]]
+
+
+class _Client:
+    """Per-connection buffers: unparsed request bytes and unsent replies."""
+
+    def __init__(self) -> None:
+        self.inbox = bytearray()
+        self.outbox = bytearray()
+        self.closed = False
+
+
+class PolicyServer:
+    def __init__(
+        self,
+        path: Path | str,
+        policy: Policy,
+        batch_window: float = 0.005,
+        max_batch: int = 256,
+    ):
+        self.path = Path(path)
+        self.policy = policy
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.batches_served = 0
+        self._stop = threading.Event()
+        self._selector = selectors.DefaultSelector()
+        self._listener: socket.socket | None = None
+        # (connection, client, request_id, observation), oldest first
+        self._pending: list[tuple[socket.socket, _Client, int, Observation]] = []
+        self._first_pending_at = 0.0
+
+    def start(self) -> None:
+        """Bind the socket; call before clients connect."""
+        if self.path.exists():
+            self.path.unlink()
+        self._listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._listener.bind(os.fspath(self.path))
+        self._listener.listen()
+        self._listener.setblocking(False)
+        self._selector.register(self._listener, selectors.EVENT_READ, data=None)
+        logger.info(f"[PolicyServer] Listening on {self.path}")
+
+    def serve_forever(self) -> None:
+        if self._listener is None:
+            self.start()
+        try:
+            while not self._stop.is_set():
+                self._poll()
+        finally:
+            self._close()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _poll(self) -> None:
+        timeout = 0.1
+        if self._pending:
+            waited = time.monotonic() - self._first_pending_at
+            timeout = max(0.0, self.batch_window - waited)
+
+        for key, events in self._selector.select(timeout):
+            if key.data is None:
+                self._accept()
+                continue
+            if events & selectors.EVENT_READ:
+                self._read(key.fileobj, key.data)
+            if events & selectors.EVENT_WRITE and not key.data.closed:
+                self._write(key.fileobj, key.data)
+
+        if self._pending and (
+            len(self._pending) >= self.max_batch
+            or time.monotonic() - self._first_pending_at >= self.batch_window
+        ):
+            self._flush()
+
+    def _accept(self) -> None:
+        conn, _ = self._listener.accept()
+        conn.setblocking(False)
+        self._selector.register(conn, selectors.EVENT_READ, data=_Client())
+
+    def _drop(self, conn: socket.socket, client: _Client) -> None:
+        client.closed = True
+        self._selector.unregister(conn)
+        conn.close()
+
+    def _read(self, conn: socket.socket, client: _Client) -> None:
+        try:
+            chunk = conn.recv(65536)
+        except ConnectionError:
+            chunk = b""
+        if not chunk:
+            self._drop(conn, client)
+            return
+        client.inbox += chunk
+        for request_id, obs in decode_requests(client.inbox):
+            if not self._pending:
+                self._first_pending_at = time.monotonic()
+            self._pending.append((conn, client, request_id, obs))
+
+    def _write(self, conn: socket.socket, client: _Client) -> None:
+        try:
+            sent = conn.send(client.outbox)
+        except BlockingIOError:
+            return
+        except OSError:
+            self._drop(conn, client)
+            return
+        del client.outbox[:sent]
+        if not client.outbox:
+            self._selector.modify(conn, selectors.EVENT_READ, data=client)
+
+    def _flush(self) -> None:
+        batch, self._pending = self._pending, []
+        try:
+            actions = self.policy([obs for _, _, _, obs in batch])
+            if len(actions) != len(batch):
+                raise ValueError(
+                    f"Policy returned {len(actions)} actions for {len(batch)} requests"
+                )
+            replies = [
+                encode_response(request_id, action)
+                for (_, _, request_id, _), action in zip(batch, actions)
+            ]
+        except Exception:
+            logger.exception("[PolicyServer] Policy failed; answering with no action")
+            replies = [
+                encode_response(request_id, None) for _, _, request_id, _ in batch
+            ]
+        self.batches_served += 1
+
+        for (conn, client, _, _), reply in zip(batch, replies):
+            if client.closed:
+                continue
+            if not client.outbox:
+                self._selector.modify(
+                    conn, selectors.EVENT_READ | selectors.EVENT_WRITE, data=client
+                )
+            client.outbox += reply
+
+    def _close(self) -> None:
+        for key in list(self._selector.get_map().values()):
+            key.fileobj.close()
+        self._selector.close()
+        if self.path.exists():
+            self.path.unlink()
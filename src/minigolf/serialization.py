@@ -0,0 +1,150 @@
+"""
+Compact and incremental world serialization for frequent save states.
+
+`World.to_json` is meant for hand-editable level files. This module is for
+checkpoints taken many times per second:
+
+- dumps/loads: the same `to_json_dict` layout as compact JSON, or as
+  zlib-compressed JSON with binary=True (recognised by its magic prefix).
+- level_hash: a short content hash of a level, stable across saves, for
+  keying results computed from it.
+- Snapshot: a base for delta snapshots. A delta only stores components
+  that differ from the base (in practice ball Position/Velocity and
+  TurnState), plus added/removed entities and components. It is tagged with
+  the base's checksum so it is never applied to the wrong base.
+"""
+
+import hashlib
+import json
+import zlib
+from typing import TYPE_CHECKING, Any
+
+from minigolf.entity import Entity
+from minigolf.world import World, component_types
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+BINARY_MAGIC = b"MGZ1"
+LEVEL_HASH_LENGTH = 16
+
+ComponentKey = tuple[str, int]
+
+
+def encode(payload: dict[str, Any], binary: bool = False) -> bytes:
+    data = json.dumps(payload, separators=(",", ":")).encode()
+    if binary:
+        return BINARY_MAGIC + zlib.compress(data)
+    return data
+
+
+def decode(data: bytes) -> dict[str, Any]:
+    if data.startswith(BINARY_MAGIC):
+        data = zlib.decompress(data[len(BINARY_MAGIC) :])
+    return json.loads(data)
+
+
+def dumps(world: World, binary: bool = False) -> bytes:
+    """Serialize a whole world without pretty-printing."""
+    return encode(world.to_json_dict(), binary)
+
+
+def loads(data: bytes) -> World:
+    """Inverse of dumps(); accepts either encoding."""
+    return World.from_json_dict(decode(data))
+
+
+def level_hash(world: World) -> str:
+    """Hex digest identifying a level's contents (not where it is saved)."""
+    return hashlib.sha256(dumps(world)).hexdigest()[:LEVEL_HASH_LENGTH]
+
+
+class Snapshot:
+    """
+    A full snapshot of a world that later states can be diffed against.
+
+    Components are deep-copied at creation, so a delta compares values and
+    catches in-place edits (e.g. physics writing `pos.x`) as well as
+    replaced components.
+    """
+
+    def __init__(self, world: World, data: dict[str, Any] | None = None):
+        self.data = world.to_json_dict() if data is None else data
+        self.payload = encode(self.data)
+        self.checksum = zlib.crc32(self.payload)
+        self._components: dict[ComponentKey, "BaseModel"] = {
+            (type(comp).__name__, eid): comp.model_copy(deep=True)
+            for eid, entity in world.entities.items()
+            for comp in entity.components.values()
+        }
+        self._entities = set(world.entities)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Snapshot":
+        """Reload a snapshot saved with Snapshot.dumps()."""
+        payload = decode(data)
+        return cls(World.from_json_dict(payload), payload)
+
+    def dumps(self, binary: bool = False) -> bytes:
+        return self.payload if not binary else encode(self.data, binary=True)
+
+    def delta(self, world: World) -> dict[str, Any]:
+        """Everything in `world` that differs from this snapshot."""
+        changed: dict[str, dict[str, Any]] = {}
+        seen: set[ComponentKey] = set()
+        for eid, entity in world.entities.items():
+            for comp in entity.components.values():
+                key = (type(comp).__name__, eid)
+                seen.add(key)
+                if self._components.get(key) != comp:
+                    changed.setdefault(key[0], {})[str(eid)] = comp.model_dump()
+
+        removed_components: dict[str, list[int]] = {}
+        for name, eid in self._components.keys() - seen:
+            if eid in world.entities:
+                removed_components.setdefault(name, []).append(eid)
+
+        return {
+            "base": self.checksum,
+            "added": sorted(world.entities.keys() - self._entities),
+            "removed": sorted(self._entities - world.entities.keys()),
+            "components": changed,
+            "removed_components": removed_components,
+        }
+
+    def dumps_delta(self, world: World, binary: bool = False) -> bytes:
+        return encode(self.delta(world), binary)
+
+    def apply(self, delta: dict[str, Any] | bytes) -> World:
+        """Rebuild the world a delta was taken from."""
+        if isinstance(delta, bytes):
+            delta = decode(delta)
+        if delta["base"] != self.checksum:
+            raise ValueError("Delta was not taken against this snapshot")
+
+        world = World.from_json_dict(self.data)
+        for eid in delta["removed"]:
+            world.remove_entity(eid)
+        for eid in delta["added"]:
+            entity = Entity()
+            entity.id = eid
+            world.entities[eid] = entity
+
+        classes = component_types()
+        for name, eids in delta["removed_components"].items():
+            for eid in eids:
+                world.entities[eid].remove(classes[name])
+        for name, eid_map in delta["components"].items():
+            comp_cls = classes.get(name)
+            if not comp_cls:
+                raise ValueError(f"Unknown component type: {name}")
+            for eid_str, comp_data in eid_map.items():
+                world.entities[int(eid_str)].add(comp_cls(**comp_data))
+
+        world._next_id = max(world.entities.keys(), default=-1) + 1
+        return world
+
+
+def load_delta(base: bytes, delta: bytes) -> World:
+    """Apply a serialized delta on top of its serialized base snapshot."""
+    return Snapshot.from_bytes(base).apply(delta)
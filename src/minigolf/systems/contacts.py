@@ -0,0 +1,132 @@
+"""
+Contact system: a flat, append-only log of ball impacts.
+
+PhysicsSpace registers pymunk post-solve handlers for ball/wall and ball/ball
+pairs only while recording is enabled. Each new contact appends one row to
+column buffers preallocated with `array`, so recording costs a few stores per
+impact and nothing per frame; analysis code reads slices after the fact.
+
+Row layout: frame, substep, eid_a, eid_b, x, y, impulse, kind.
+"""
+
+from array import array
+from dataclasses import dataclass
+from typing import NamedTuple
+
+WALL_CONTACT = 0
+BALL_CONTACT = 1
+
+DEFAULT_CAPACITY = 1024
+
+
+class ContactEvent(NamedTuple):
+    frame: int
+    substep: int
+    eid_a: int
+    eid_b: int
+    x: float
+    y: float
+    impulse: float
+    kind: int
+
+
+@dataclass(frozen=True)
+class ContactStats:
+    """Aggregates over a range of contact events (typically one stroke)."""
+
+    wall_hits: int = 0
+    ball_hits: int = 0
+    max_impulse: float = 0.0
+    total_impulse: float = 0.0
+    first_wall_hit: tuple[float, float] | None = None
+
+
+class ContactLog:
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self._capacity = capacity
+        self._size = 0
+        self.frame = array("q", [0]) * capacity
+        self.substep = array("l", [0]) * capacity
+        self.eid_a = array("q", [0]) * capacity
+        self.eid_b = array("q", [0]) * capacity
+        self.x = array("d", [0.0]) * capacity
+        self.y = array("d", [0.0]) * capacity
+        self.impulse = array("d", [0.0]) * capacity
+        self.kind = array("b", [0]) * capacity
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _columns(self) -> tuple[array, ...]:
+        return (
+            self.frame,
+            self.substep,
+            self.eid_a,
+            self.eid_b,
+            self.x,
+            self.y,
+            self.impulse,
+            self.kind,
+        )
+
+    def record(
+        self,
+        frame: int,
+        substep: int,
+        eid_a: int,
+        eid_b: int,
+        x: float,
+        y: float,
+        impulse: float,
+        kind: int,
+    ) -> None:
+        i = self._size
+        if i == self._capacity:
+            self._grow()
+        self.frame[i] = frame
+        self.substep[i] = substep
+        self.eid_a[i] = eid_a
+        self.eid_b[i] = eid_b
+        self.x[i] = x
+        self.y[i] = y
+        self.impulse[i] = impulse
+        self.kind[i] = kind
+        self._size = i + 1
+
+    def _grow(self) -> None:
+        # Double every column in place; amortised O(1) per record
+        for column in self._columns():
+            column.extend(column)
+        self._capacity *= 2
+
+    def clear(self) -> None:
+        self._size = 0
+
+    def events(self, start: int = 0, stop: int | None = None) -> list[ContactEvent]:
+        stop = self._size if stop is None else min(stop, self._size)
+        columns = [column[start:stop] for column in self._columns()]
+        return [ContactEvent(*row) for row in zip(*columns)]
+
+    def stats(
+        self, start: int = 0, stop: int | None = None, eid: int | None = None
+    ) -> ContactStats:
+        """Aggregate events in [start, stop), optionally only those involving `eid`."""
+        stop = self._size if stop is None else min(stop, self._size)
+        wall_hits = ball_hits = 0
+        max_impulse = total_impulse = 0.0
+        first_wall_hit = None
+        for i in range(start, stop):
+            if eid is not None and eid not in (self.eid_a[i], self.eid_b[i]):
+                continue
+            impulse = self.impulse[i]
+            total_impulse += impulse
+            max_impulse = max(max_impulse, impulse)
+            if self.kind[i] == WALL_CONTACT:
+                wall_hits += 1
+                if first_wall_hit is None:
+                    first_wall_hit = (self.x[i], self.y[i])
+            else:
+                ball_hits += 1
+        return ContactStats(
+            wall_hits, ball_hits, max_impulse, total_impulse, first_wall_hit
+        )
@@ -1,45 +1,352 @@
+from array import array
+
 import pymunk
 from loguru import logger
 
-from minigolf.components import Collider
-from minigolf.consts import DEFAULT_FLOOR_FRICTION
+from minigolf.components import Collider, Position, Terrain, Velocity
+from minigolf.consts import (
+    BALL_COLLISION_TYPE,
+    DEFAULT_FLOOR_FRICTION,
+    FUNNEL_COLLISION_TYPE,
+    HOLE_COLLISION_TYPE,
+    VELOCITY_THRESHOLD,
+    WALL_COLLISION_TYPE,
+)
 from minigolf.entity import Entity, PhysicsObject
+from minigolf.systems.contacts import BALL_CONTACT, WALL_CONTACT, ContactLog
+from minigolf.systems.terrain import TerrainGrid
+from minigolf.systems.tuning import PhysicsTuning, resolve_tuning
+from minigolf.systems.win import WinEvent, apply_funnel
 from minigolf.world import World
 
+# Floats per dynamic body in PhysicsSpace.state: x, y, dx, dy
+STATE_WIDTH = 4
+
 
 class PhysicsSpace:
-    def __init__(self, world: World):
+    def __init__(
+        self,
+        world: World,
+        record_contacts: bool = False,
+        tuning: str | PhysicsTuning | None = None,
+    ):
         self.world = world
-        self.space = pymunk.Space()
-        self.space.damping = DEFAULT_FLOOR_FRICTION
+        # Every body by entity id, and the same bodies split by type: static
+        # ones never move, so only the dynamic ones are synced after a step
         self.eid_to_body: dict[int, PhysicsObject] = {}
+        self.static_bodies: dict[int, PhysicsObject] = {}
+        self.dynamic_bodies: dict[int, PhysicsObject] = {}
+        # Entity-space x, y, dx, dy of each dynamic body, STATE_WIDTH floats
+        # per row (row order follows dynamic_bodies). Readers can wrap it
+        # without copying, e.g. np.frombuffer(physics.state).reshape(-1, 4);
+        # adding or removing a body replaces the array rather than resizing it.
+        self.state = array("d")
+        self.state_rows: dict[int, int] = {}
+        # Set while populate() runs: rows are allocated once at the end
+        self._defer_rows = False
+        self.shape_to_eid: dict[pymunk.Shape, int] = {}
+        self.terrain: TerrainGrid | None = None
+        # Bumped whenever static bodies or terrain change, so caches derived
+        # from the level's layout know to rebuild
+        self.layout_version = 0
+
+        # Hole captures detected during step(), waiting to be drained
+        self.captures: list[WinEvent] = []
+        self.captured: set[int] = set()
+        # Hole centres whose funnel gate each ball body currently overlaps
+        self.funnels: dict[pymunk.Body, dict[pymunk.Shape, pymunk.Vec2d]] = {}
+
+        # Ball impacts; handlers are only registered while recording
+        self.contacts = ContactLog()
+        self.record_contacts = record_contacts
+        self.frame = 0
+        self.substep = 0
+
+        # Space settings: a profile name, explicit tuning, or None for "auto";
+        # resolved against the level in populate()
+        self.tuning_profile = tuning
+        self.tuning: PhysicsTuning | None = None
+        self.space = self._new_space()
+
+    def _new_space(self, threaded: bool = False) -> pymunk.Space:
+        space = pymunk.Space(threaded=threaded)
+        space.damping = DEFAULT_FLOOR_FRICTION
+        space.on_collision(
+            BALL_COLLISION_TYPE, HOLE_COLLISION_TYPE, pre_solve=self._ball_over_hole
+        )
+        space.on_collision(
+            BALL_COLLISION_TYPE,
+            FUNNEL_COLLISION_TYPE,
+            begin=self._enter_funnel,
+            separate=self._leave_funnel,
+        )
+        self.space = space
+        self.set_contact_recording(self.record_contacts)
+        return space
 
     def populate(self):
-        for entity in self.world.entities.values():
-            self.add_entity(entity)
+        self.apply_tuning(resolve_tuning(self.tuning_profile, self.world))
+        self._defer_rows = True
+        try:
+            for entity in self.world.entities.values():
+                self.add_entity(entity, rebuild_terrain=False)
+        finally:
+            self._defer_rows = False
+            self._grow_state()
+        self.rebuild_terrain()
+
+    def apply_tuning(self, tuning: PhysicsTuning) -> None:
+        """
+        Configure the space. The threaded solver needs a threaded Space, which
+        can only be swapped in while the space is still empty.
+        """
+        if tuning.threads > 1 and not self.space.threaded:
+            if self.space.bodies or self.space.shapes:
+                logger.warning("[Physics] Space already populated; staying unthreaded")
+            else:
+                self._new_space(threaded=True)
+        tuning.apply(self.space)
+        self.tuning = tuning
+        logger.debug(f"[Physics] Tuning: {tuning}")
 
     def step(self, timestep=1 / 60, substeps=50):
-        for _ in range(substeps):
+        for substep in range(substeps):
+            self.substep = substep
             self.space.step(timestep / substeps)
+        self.frame += 1
+        self.sync_bodies()
 
-        for eid, phys_obj in self.eid_to_body.items():
-            entity = self.world.get_entity(eid)
-            entity.sync_with_pymunk_body(phys_obj.body)  # access inner pymunk.Body here
+    def sync_bodies(self) -> None:
+        """
+        Copy dynamic bodies back into `state` and their entities' Position and
+        Velocity. Sleeping bodies, and bodies that haven't moved since the last
+        sync (e.g. sunk balls), are skipped.
+        """
+        state = self.state
+        for row, phys_obj in enumerate(self.dynamic_bodies.values()):
+            body = phys_obj.body
+            if body.is_sleeping:
+                continue
+            ox, oy = phys_obj.offset
+            x, y = body.position.x - ox, body.position.y - oy
+            dx, dy = body.velocity.x, body.velocity.y
+            i = row * STATE_WIDTH
+            if (
+                state[i] == x
+                and state[i + 1] == y
+                and state[i + 2] == dx
+                and state[i + 3] == dy
+            ):
+                continue
+            state[i : i + STATE_WIDTH] = array("d", (x, y, dx, dy))
+            entity = phys_obj.entity
+            if (pos := entity.get(Position)) is not None:
+                pos.x, pos.y = x, y
+            if (vel := entity.get(Velocity)) is not None:
+                vel.dx, vel.dy = dx, dy
 
-    @logger.catch
-    def add_entity(self, entity: Entity) -> None:
+    def add_entity(self, entity: Entity, rebuild_terrain: bool = True) -> None:
         if entity.id is None:
             raise ValueError("Entity must have an ID before adding to PhysicsSpace")
+        if entity.has(Terrain):
+            if rebuild_terrain:
+                self.rebuild_terrain()
+            return
         phys_obj = PhysicsObject.from_entity(entity)
         if phys_obj:
-            phys_obj.add_to_space(self.space)
-            self.eid_to_body[entity.id] = phys_obj
+            self.add_body(entity.id, phys_obj)
+
+    def add_body(self, eid: int, phys_obj: PhysicsObject) -> None:
+        """Add a body built without going through its entity's components."""
+        phys_obj.add_to_space(self.space)
+        self._register(eid, phys_obj)
+        for shape in phys_obj.shapes:
+            self.shape_to_eid[shape] = eid
+        self._refresh_velocity_func(phys_obj.body)
 
-    @logger.catch
     def remove_entity(self, entity: Entity) -> None:
         if entity.id is None:
             raise ValueError("Entity must have an ID before adding to PhysicsSpace")
-        phys_obj = self.eid_to_body.pop(entity.id, None)
+        phys_obj = self._unregister(entity.id)
         if phys_obj:
-            self.space.remove(phys_obj.body, phys_obj.shape)
+            self.space.remove(phys_obj.body, *phys_obj.shapes)
+            for shape in phys_obj.shapes:
+                self.shape_to_eid.pop(shape, None)
+            self.funnels.pop(phys_obj.body, None)
+            self.captured.discard(entity.id)
             entity.remove(Collider)
+        elif entity.has(Terrain):
+            self.rebuild_terrain()
+
+    def clear(self) -> None:
+        """Remove every body from the space, e.g. when the world is emptied."""
+        self.space.remove(*self.space.bodies, *self.space.shapes)
+        self.eid_to_body.clear()
+        self.static_bodies.clear()
+        self.dynamic_bodies.clear()
+        self.shape_to_eid.clear()
+        self.funnels.clear()
+        self.captured.clear()
+        self.state = array("d")
+        self.state_rows.clear()
+        self.layout_version += 1
+
+    def _register(self, eid: int, phys_obj: PhysicsObject) -> None:
+        self._unregister(eid)
+        self.eid_to_body[eid] = phys_obj
+        if phys_obj.body.body_type != pymunk.Body.DYNAMIC:
+            self.static_bodies[eid] = phys_obj
+            self.layout_version += 1
+            return
+        self.dynamic_bodies[eid] = phys_obj
+        self.state_rows[eid] = len(self.state_rows)
+        if not self._defer_rows:
+            self._grow_state()
+
+    def _grow_state(self) -> None:
+        """Give every dynamic body without one a row, in a new array."""
+        missing = len(self.state_rows) * STATE_WIDTH - len(self.state)
+        if missing > 0:
+            # NaN never compares equal, so the first sync always writes the row
+            self.state = self.state + array("d", [float("nan")] * missing)
+
+    def _unregister(self, eid: int) -> PhysicsObject | None:
+        phys_obj = self.eid_to_body.pop(eid, None)
+        if self.static_bodies.pop(eid, None) is not None:
+            self.layout_version += 1
+        if self.dynamic_bodies.pop(eid, None) is None:
+            return phys_obj
+        # Drop the row and renumber the rows after it (dicts keep order). A
+        # row populate() hasn't allocated yet is past the end: nothing to cut
+        row = self.state_rows.pop(eid)
+        start = row * STATE_WIDTH
+        self.state = self.state[:start] + self.state[start + STATE_WIDTH :]
+        for other, other_row in self.state_rows.items():
+            if other_row > row:
+                self.state_rows[other] = other_row - 1
+        return phys_obj
+
+    # Ball integration
+
+    def rebuild_terrain(self) -> None:
+        """Recompile the terrain grid from the world's Terrain zones."""
+        self.terrain = TerrainGrid.from_world(self.world)
+        self.layout_version += 1
+        for phys_obj in self.eid_to_body.values():
+            self._refresh_velocity_func(phys_obj.body)
+
+    def _refresh_velocity_func(self, body: pymunk.Body) -> None:
+        """
+        Only balls on terrain or inside a funnel gate need a Python
+        velocity_func; every other body keeps pymunk's built-in integrator.
+        """
+        if body.body_type != pymunk.Body.DYNAMIC:
+            return
+        if self.terrain is not None or body in self.funnels:
+            body.velocity_func = self._ball_velocity
+        else:
+            body.velocity_func = pymunk.Body.update_velocity
+
+    def _ball_velocity(
+        self, body: pymunk.Body, gravity: pymunk.Vec2d, damping: float, dt: float
+    ) -> None:
+        """
+        Per-substep velocity update: floor damping/acceleration from the
+        terrain grid, then the pull of any funnel the ball is inside.
+        """
+        if self.terrain is not None:
+            self.terrain.update_velocity(body, gravity, damping, dt)
+        else:
+            pymunk.Body.update_velocity(body, gravity, damping, dt)
+        for centre in self.funnels.get(body, {}).values():
+            apply_funnel(body, centre, dt)
+
+    # Hole capture
+
+    def drain_captures(self) -> list[WinEvent]:
+        """Return the captures recorded since the last call and forget them."""
+        events, self.captures = self.captures, []
+        return events
+
+    def release(self, eid: int) -> None:
+        """Allow a previously captured ball to be captured again (e.g. on reset)."""
+        self.captured.discard(eid)
+
+    def _ball_over_hole(self, arbiter: pymunk.Arbiter, space: pymunk.Space, data):
+        """
+        Called by pymunk on every substep while a ball overlaps a hole sensor.
+        A ball that is slow enough is sunk: snapped to the hole centre and frozen
+        once the current substep has finished.
+        """
+        ball_shape, hole_shape = arbiter.shapes
+        ball_eid = self.shape_to_eid[ball_shape]
+        if ball_eid in self.captured:
+            return
+
+        ball, hole = ball_shape.body, hole_shape.body
+        speed = ball.velocity.length
+        if speed > VELOCITY_THRESHOLD:
+            return
+
+        distance = (ball.position - hole.position).length
+        self.captured.add(ball_eid)
+        self.captures.append(
+            WinEvent(ball_eid, self.shape_to_eid[hole_shape], distance, speed)
+        )
+        space.add_post_step_callback(_sink_ball, ball, hole.position)
+
+    # Hole funnel
+
+    def _enter_funnel(self, arbiter: pymunk.Arbiter, space: pymunk.Space, data):
+        ball_shape, gate = arbiter.shapes
+        ball = ball_shape.body
+        self.funnels.setdefault(ball, {})[gate] = gate.body.position
+        self._refresh_velocity_func(ball)
+
+    def _leave_funnel(self, arbiter: pymunk.Arbiter, space: pymunk.Space, data):
+        # Bodies may already be detached when this fires because of a removal
+        ball_shape, gate = arbiter.shapes
+        ball = ball_shape.body
+        centres = self.funnels.get(ball)
+        if centres is None:
+            return
+        centres.pop(gate, None)
+        if not centres:
+            del self.funnels[ball]
+            self._refresh_velocity_func(ball)
+
+    # Contact recording
+
+    def set_contact_recording(self, enabled: bool) -> None:
+        """
+        Turn the contact log on or off. When off, no Python callback is
+        registered at all, so contacts cost nothing beyond pymunk itself.
+        """
+        callback = self._record_contact if enabled else pymunk.empty_callback
+        for other in (WALL_COLLISION_TYPE, BALL_COLLISION_TYPE):
+            self.space.on_collision(BALL_COLLISION_TYPE, other, post_solve=callback)
+        self.record_contacts = enabled
+
+    def _record_contact(self, arbiter: pymunk.Arbiter, space: pymunk.Space, data):
+        if not arbiter.is_first_contact:
+            return
+        shape_a, shape_b = arbiter.shapes
+        point = arbiter.contact_point_set.points[0].point_a
+        self.contacts.record(
+            self.frame,
+            self.substep,
+            self.shape_to_eid[shape_a],
+            self.shape_to_eid[shape_b],
+            point.x,
+            point.y,
+            arbiter.total_impulse.length,
+            WALL_CONTACT
+            if shape_b.collision_type == WALL_COLLISION_TYPE
+            else BALL_CONTACT,
+        )
+
+
+def _sink_ball(space: pymunk.Space, ball: pymunk.Body, centre: pymunk.Vec2d) -> None:
+    ball.position = centre
+    ball.velocity = (0.0, 0.0)
+    ball.angular_velocity = 0.0
@@ -1,17 +1,36 @@
 import pygame
 
-from minigolf.components import Position, Renderable
+from minigolf.components import Circle, Position, Rect, Renderable, Shape, Terrain
 from minigolf.entity import Entity
+from minigolf.utils import add_tuples
 from minigolf.world import World
 
 
+def draw_rect(screen: pygame.Surface, shape: Rect, pos: Position, colour) -> None:
+    draw_pos = add_tuples((pos.x, pos.y), shape.pygame_offset())
+    rect = pygame.Rect(draw_pos[0], draw_pos[1], shape.width, shape.height)
+    pygame.draw.rect(surface=screen, color=colour, rect=rect)
+
+
+def draw_circle(screen: pygame.Surface, shape: Circle, pos: Position, colour) -> None:
+    draw_pos = add_tuples((pos.x, pos.y), shape.pygame_offset())
+    pygame.draw.circle(screen, colour, draw_pos, shape.radius)
+
+
+def draw_shape(screen: pygame.Surface, shape: Shape, pos: Position, colour) -> None:
+    if isinstance(shape, Rect):
+        draw_rect(screen, shape, pos, colour)
+    elif isinstance(shape, Circle):
+        draw_circle(screen, shape, pos, colour)
+
+
 def render_entity(screen: pygame.Surface, entity: Entity) -> None:
     renderable = entity.get(Renderable)
     pos: Position | None = entity.get(Position)
     if not (pos and renderable):
         return
 
-    renderable.shape.draw_at(screen, pos, renderable.colour)
+    draw_shape(screen, renderable.shape, pos, renderable.colour)
 
 
 def draw_bg(screen) -> None:
@@ -19,7 +38,11 @@ def draw_bg(screen) -> None:
 
 
 def render_objects(screen, world: World) -> None:
-    for entity in world.all_with(Position, Renderable):
+    # Terrain zones are floor: draw them before anything that sits on top
+    entities = sorted(
+        world.all_with(Position, Renderable), key=lambda e: not e.has(Terrain)
+    )
+    for entity in entities:
         render_entity(screen, entity)
 
 
@@ -0,0 +1,201 @@
+"""
+Level geometry shared between processes.
+
+A worker that simulates strokes normally gets the level as JSON (or a
+pickled World) and rebuilds every wall: parse, validate each pydantic
+component, build an Entity, then the pymunk body. On tile-built levels that
+is thousands of entities per worker, all identical.
+
+SharedLevel.publish() packs the static walls once into a
+multiprocessing.shared_memory block as float64 rows (WALL_COLUMNS), next to
+a compact JSON of everything else (balls, holes, terrain: a handful of
+entities) and the physics tuning resolved against the full level. Workers
+attach by name, read the rows straight out of the shared buffer and create
+the pymunk shapes from them; no wall is parsed, validated or turned into an
+Entity. The pymunk shapes themselves are still one per wall.
+
+Walls are not in an attached level's World, only in its PhysicsSpace, so
+this is for code that simulates (rollouts, heatmaps), not for controllers or
+encoders that read the level's entities.
+
+Layout: HEADER (magic, row count, JSON length), the rows, the JSON.
+"""
+
+import json
+import struct
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+import numpy as np
+import pymunk
+
+from minigolf.components import Circle, Collider, Hole, PhysicsBody, Position, Rect
+from minigolf.consts import (
+    DEFAULT_ELASTICITY,
+    DEFAULT_WALL_FRICTION,
+    WALL_COLLISION_TYPE,
+)
+from minigolf.entity import Entity, PhysicsObject
+from minigolf.systems.physics import PhysicsSpace
+from minigolf.systems.tuning import PhysicsTuning, resolve_tuning
+from minigolf.utils import to_pymunk_position
+from minigolf.world import World
+
+MAGIC = b"MGSL"
+HEADER = struct.Struct("<4s4xqq")
+# eid, kind, body x, body y, then width, height (RECT) or radius, 0 (CIRCLE)
+WALL_COLUMNS = 6
+RECT, CIRCLE = 0.0, 1.0
+
+
+def _is_wall(entity: Entity) -> bool:
+    body = entity.get(PhysicsBody)
+    return (
+        body is not None
+        and body.anchored
+        and not entity.has(Hole)
+        and entity.has(Position)
+        and isinstance(getattr(entity.get(Collider), "shape", None), Rect | Circle)
+    )
+
+
+def pack_walls(world: World) -> tuple[np.ndarray, list[int]]:
+    """The world's walls as (n, WALL_COLUMNS) rows, and their entity ids."""
+    rows = []
+    for entity in world.entities.values():
+        if not _is_wall(entity):
+            continue
+        shape = entity.get(Collider).shape
+        x, y = to_pymunk_position(shape, entity.get(Position))
+        if isinstance(shape, Rect):
+            rows.append((entity.id, RECT, x, y, shape.width, shape.height))
+        else:
+            rows.append((entity.id, CIRCLE, x, y, shape.radius, 0.0))
+    packed = np.array(rows, dtype=np.float64).reshape(-1, WALL_COLUMNS)
+    return packed, [int(r[0]) for r in rows]
+
+
+def add_walls(physics: PhysicsSpace, rows: np.ndarray) -> None:
+    """Create a static body per packed wall row, as PhysicsObject.from_entity would."""
+    for eid, kind, x, y, a, b in rows.tolist():
+        body = pymunk.Body(body_type=pymunk.Body.STATIC)
+        body.position = (x, y)
+        if kind == RECT:
+            shape = pymunk.Poly.create_box(body, (a, b))
+            offset = (a / 2, b / 2)
+        else:
+            shape = pymunk.Circle(body, a)
+            offset = (0.0, 0.0)
+        shape.elasticity = DEFAULT_ELASTICITY
+        shape.friction = DEFAULT_WALL_FRICTION
+        shape.collision_type = WALL_COLLISION_TYPE
+        eid = int(eid)
+        physics.add_body(eid, PhysicsObject(Entity(eid), body, shape, offset=offset))
+
+
+def _open(name: str) -> SharedMemory:
+    """
+    Attach without registering the block with a resource tracker, which would
+    unlink it when this process exits (the publisher owns it).
+    """
+    try:
+        return SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 has no `track`. Processes started by multiprocessing
+        # share the publisher's tracker, where registering again is a no-op
+        # (and unregistering would drop the publisher's own registration).
+        return SharedMemory(name=name)
+
+
+class SharedLevel:
+    def __init__(self, shm: SharedMemory, owner: bool):
+        self._shm = shm
+        self.owner = owner
+        magic, n_rows, meta_len = HEADER.unpack_from(shm.buf)
+        if magic != MAGIC:
+            raise ValueError(f"Shared memory block {shm.name!r} is not a level")
+        # A view of the shared buffer, not a copy
+        self.walls: np.ndarray = np.ndarray(
+            (n_rows, WALL_COLUMNS), dtype=np.float64, buffer=shm.buf, offset=HEADER.size
+        )
+        start = HEADER.size + self.walls.nbytes
+        self._meta: dict[str, Any] = json.loads(
+            bytes(shm.buf[start : start + meta_len])
+        )
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @classmethod
+    def publish(
+        cls, world: World, physics_profile: "str | PhysicsTuning | None" = None
+    ) -> "SharedLevel":
+        """
+        Copy `world`'s level into a new shared memory block. The caller owns
+        it: close() (or leaving a `with` block) unlinks it.
+        """
+        walls, wall_ids = pack_walls(world)
+        skip = set(wall_ids)
+        rest = World()
+        rest.entities = {
+            eid: entity for eid, entity in world.entities.items() if eid not in skip
+        }
+        tuning = resolve_tuning(physics_profile, world)
+        meta = json.dumps(
+            {
+                "level": rest.to_json_dict(),
+                "next_id": world._next_id,
+                "tuning": {
+                    "spatial_hash": tuning.spatial_hash,
+                    "iterations": tuning.iterations,
+                    "collision_slop": tuning.collision_slop,
+                    "threads": tuning.threads,
+                },
+            },
+            separators=(",", ":"),
+        ).encode()
+
+        shm = SharedMemory(create=True, size=HEADER.size + walls.nbytes + len(meta))
+        HEADER.pack_into(shm.buf, 0, MAGIC, len(walls), len(meta))
+        start = HEADER.size
+        shm.buf[start : start + walls.nbytes] = walls.tobytes()
+        shm.buf[start + walls.nbytes : start + walls.nbytes + len(meta)] = meta
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedLevel":
+        return cls(_open(name), owner=False)
+
+    @property
+    def tuning(self) -> PhysicsTuning:
+        fields = dict(self._meta["tuning"])
+        if fields["spatial_hash"] is not None:
+            fields["spatial_hash"] = tuple(fields["spatial_hash"])
+        return PhysicsTuning(**fields)
+
+    def build(self) -> tuple[World, PhysicsSpace]:
+        """
+        A World of the level's non-wall entities and a populated PhysicsSpace
+        with every wall, built straight from the shared rows.
+        """
+        world = World.from_json_dict(self._meta["level"])
+        # Keep new entities clear of the walls' ids
+        world._next_id = max(world._next_id, self._meta["next_id"])
+        physics = PhysicsSpace(world, tuning=self.tuning)
+        physics.populate()
+        add_walls(physics, self.walls)
+        return world, physics
+
+    def close(self) -> None:
+        """Detach; the publisher also frees the block."""
+        self.walls = np.empty((0, WALL_COLUMNS))
+        self._shm.close()
+        if self.owner:
+            self._shm.unlink()
+
+    def __enter__(self) -> "SharedLevel":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
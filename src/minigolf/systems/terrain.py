@@ -0,0 +1,99 @@
+"""
+Terrain system: compiles Terrain zones into a dense lookup grid.
+
+Zones are rasterised once, when the physics space is populated. Each cell
+stores the (acceleration, damping) pair pymunk's velocity integration needs,
+so a ball samples its floor with one index computation per substep no matter
+how many zones the level has.
+
+Contracts:
+- A zone covers its entity's Collider rect, anchored at Position (top-left).
+- Where zones overlap, the one added to the world last wins.
+- Outside every zone, the space's global damping applies unchanged.
+"""
+
+from math import ceil, floor
+
+import pymunk
+
+from minigolf.components import Collider, Position, Rect, Terrain
+from minigolf.consts import TERRAIN_CELL_SIZE
+from minigolf.world import World
+
+
+class TerrainGrid:
+    def __init__(
+        self,
+        origin: tuple[float, float],
+        cell_size: float,
+        cols: int,
+        rows: int,
+        cells: list[tuple[tuple[float, float], float] | None],
+    ):
+        self.origin = origin
+        self.cell_size = cell_size
+        self.cols = cols
+        self.rows = rows
+        # Row-major; None means "no zone here, use the global floor"
+        self.cells = cells
+        self._inv_cell = 1.0 / cell_size
+
+    @classmethod
+    def from_world(
+        cls, world: World, cell_size: float = TERRAIN_CELL_SIZE
+    ) -> "TerrainGrid | None":
+        """Rasterise every Terrain zone of `world`; None if there are none."""
+        zones: list[tuple[float, float, float, float, Terrain]] = []
+        for entity in world.all_with(Terrain, Position, Collider):
+            pos, col = entity.get(Position), entity.get(Collider)
+            if not isinstance(col.shape, Rect):
+                continue
+            zones.append(
+                (pos.x, pos.y, col.shape.width, col.shape.height, entity.get(Terrain))
+            )
+        if not zones:
+            return None
+
+        x0 = min(z[0] for z in zones)
+        y0 = min(z[1] for z in zones)
+        x1 = max(z[0] + z[2] for z in zones)
+        y1 = max(z[1] + z[3] for z in zones)
+        cols = max(1, ceil((x1 - x0) / cell_size))
+        rows = max(1, ceil((y1 - y0) / cell_size))
+
+        cells: list[tuple[tuple[float, float], float] | None] = [None] * (cols * rows)
+        for zx, zy, zw, zh, terrain in zones:
+            value = (terrain.acceleration, terrain.damping)
+            # Cells whose centre lies inside the zone
+            c0 = max(0, ceil((zx - x0) / cell_size - 0.5))
+            c1 = min(cols, ceil((zx + zw - x0) / cell_size - 0.5))
+            r0 = max(0, ceil((zy - y0) / cell_size - 0.5))
+            r1 = min(rows, ceil((zy + zh - y0) / cell_size - 0.5))
+            for row in range(r0, r1):
+                base = row * cols
+                for c in range(c0, c1):
+                    cells[base + c] = value
+
+        return cls((x0, y0), cell_size, cols, rows, cells)
+
+    def sample(self, x: float, y: float) -> tuple[tuple[float, float], float] | None:
+        """Return (acceleration, damping) of the zone at (x, y), if any."""
+        col = floor((x - self.origin[0]) * self._inv_cell)
+        row = floor((y - self.origin[1]) * self._inv_cell)
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return self.cells[row * self.cols + col]
+        return None
+
+    def update_velocity(
+        self, body: pymunk.Body, gravity: pymunk.Vec2d, damping: float, dt: float
+    ) -> None:
+        """
+        Drop-in for pymunk.Body.update_velocity using the zone under `body`.
+        Like pymunk, `damping` is the factor for this step (space.damping ** dt),
+        so zone damping is converted the same way.
+        """
+        cell = self.sample(*body.position)
+        if cell is None:
+            pymunk.Body.update_velocity(body, gravity, damping, dt)
+        else:
+            pymunk.Body.update_velocity(body, cell[0], cell[1] ** dt, dt)
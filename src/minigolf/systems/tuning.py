@@ -0,0 +1,114 @@
+"""
+Physics tuning: pymunk Space settings chosen per level.
+
+A PhysicsTuning is derived from the level when PhysicsSpace.populate() runs
+(profile "auto"), or picked by name to override that, e.g. from the CLI's
+--physics-profile. Rules for "auto", from scripts/bench_physics_tuning.py
+(results in benchmarks/physics_tuning.md):
+
+- Broadphase: pymunk's default bounding-box tree. A spatial hash (cells the
+  size of a typical wall) never reliably beat it, even on tile-built levels
+  with ~1500 walls, so it is only used when asked for ("hash").
+- Iterations: fewer iterations ("lean") only helped on the most crowded
+  tile level, and resolve ball-ball overlaps less completely, so pymunk's
+  default is kept.
+- Slop: allowed overlap must stay well below the thinnest wall, or fast balls
+  sink into it.
+- Threads: pymunk's threaded solver can only help with many dynamic bodies,
+  and only with a spare core.
+"""
+
+import os
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from statistics import median
+
+import pymunk
+
+from minigolf.components import Collider, PhysicsBody, Rect
+from minigolf.world import World
+
+# Hash cells per shape in the space (pymunk suggests ~10x the object count)
+HASH_CELLS_PER_SHAPE = 10
+HASH_MIN_DIM = 10.0
+HASH_MAX_DIM = 200.0
+
+DEFAULT_ITERATIONS = 10
+LEAN_ITERATIONS = 5
+
+DEFAULT_SLOP = 0.1
+# Fraction of the thinnest wall that may be overlapped
+SLOP_WALL_FRACTION = 0.05
+
+THREADED_MIN_BALLS = 100
+THREADS = 2
+
+
+@dataclass(frozen=True)
+class PhysicsTuning:
+    # (cell size, cell count) for a spatial hash; None keeps the bb tree
+    spatial_hash: tuple[float, int] | None = None
+    iterations: int = DEFAULT_ITERATIONS
+    collision_slop: float = DEFAULT_SLOP
+    threads: int = 1
+
+    @classmethod
+    def for_world(cls, world: World, *, spatial_hash: bool = False) -> "PhysicsTuning":
+        """Derive a profile from a level's geometry and ball count."""
+        walls: list[Rect] = []
+        balls = 0
+        for entity in world.all_with(PhysicsBody, Collider):
+            if not entity.get(PhysicsBody).anchored:
+                balls += 1
+            elif isinstance(shape := entity.get(Collider).shape, Rect):
+                walls.append(shape)
+
+        hash_dims = None
+        if spatial_hash and walls:
+            typical = median(max(w.width, w.height) for w in walls)
+            dim = min(max(typical, HASH_MIN_DIM), HASH_MAX_DIM)
+            hash_dims = (dim, HASH_CELLS_PER_SHAPE * (len(walls) + balls))
+
+        slop = DEFAULT_SLOP
+        if walls:
+            thinnest = min(min(w.width, w.height) for w in walls)
+            slop = min(DEFAULT_SLOP, thinnest * SLOP_WALL_FRACTION)
+
+        threads = 1
+        if balls >= THREADED_MIN_BALLS and (os.cpu_count() or 1) > 1:
+            threads = THREADS
+
+        return cls(spatial_hash=hash_dims, collision_slop=slop, threads=threads)
+
+    def apply(self, space: pymunk.Space) -> None:
+        """Configure `space`; threads only take effect on a threaded Space."""
+        if self.spatial_hash is not None:
+            space.use_spatial_hash(*self.spatial_hash)
+        space.iterations = self.iterations
+        space.collision_slop = self.collision_slop
+        space.threads = self.threads
+
+
+# Named profiles, each resolved against the level being loaded
+PROFILES: dict[str, Callable[[World], PhysicsTuning]] = {
+    "auto": PhysicsTuning.for_world,
+    # pymunk's own defaults
+    "default": lambda world: PhysicsTuning(),
+    "lean": lambda world: PhysicsTuning(iterations=LEAN_ITERATIONS),
+    "hash": lambda world: PhysicsTuning.for_world(world, spatial_hash=True),
+    "threaded": lambda world: replace(PhysicsTuning.for_world(world), threads=THREADS),
+}
+
+
+def resolve_tuning(
+    profile: "str | PhysicsTuning | None", world: World
+) -> PhysicsTuning:
+    """Turn a profile name (None meaning "auto") into a tuning for `world`."""
+    if isinstance(profile, PhysicsTuning):
+        return profile
+    name = profile or "auto"
+    if name not in PROFILES:
+        raise ValueError(
+            f"Unknown physics profile {name!r}; expected one of {sorted(PROFILES)}"
+        )
+    return PROFILES[name](world)
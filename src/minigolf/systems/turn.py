@@ -13,9 +13,9 @@ Contracts:
 - Controllers add Action components to their player’s ball.
 """
 
-from loguru import logger
 from pymunk import Vec2d
 
+from minigolf import trace
 from minigolf.components import Action, Phase, Player, TurnState, Velocity
 from minigolf.consts import STOPPING_VELOCITY
 from minigolf.entity import Entity
@@ -47,12 +47,14 @@ def ensure_turn_manager(world: World, *, mode: str = "turn") -> Entity:
                     mode=mode,
                 )
             )
-            logger.debug(f"[Turn] Switched TurnManager mode → {mode}")
+            if trace.level >= trace.DEBUG:
+                trace.record(trace.Event.TURN_MODE, mode)
         return tm_e
 
     tm_e = world.create_entity()
     tm_e.add(TurnState(phase=Phase.AWAIT_INPUT, current_player=0, mode=mode))
-    logger.debug(f"[Turn] Created TurnManager with mode={mode}")
+    if trace.level >= trace.DEBUG:
+        trace.record(trace.Event.TURN_CREATED, mode)
     return tm_e
 
 
@@ -82,7 +84,8 @@ def consume_action(entity: Entity) -> Action | None:
     """
     act = entity.get(Action)
     if act:
-        logger.debug(f"[Turn] Consuming {act.type} from Ball {entity.id}")
+        if trace.level >= trace.DEBUG:
+            trace.record(trace.Event.TURN_CONSUME, act.type, entity.id)
         entity.remove(Action)
         return act
 
@@ -94,7 +97,8 @@ def apply_action_to_body(action: Action, body) -> None:
     - reset: stop movement entirely
     - other: ignored
     """
-    logger.debug(f"[Turn] Applying {action.type} with vel={action.velocity}")
+    if trace.level >= trace.DEBUG:
+        trace.record(trace.Event.TURN_APPLY, action.type, action.velocity)
     if action.type == "strike":
         body.velocity = Vec2d(*action.velocity)
         body.angular_velocity = action.angular_velocity
@@ -106,66 +110,83 @@ def apply_action_to_body(action: Action, body) -> None:
 # Turn system entry point
 
 
-def turn_system(world: World, physics) -> None:
+def turn_system(
+    world: World,
+    physics,
+    *,
+    pending: dict[int, Action] | None = None,
+    turn_manager: Entity | None = None,
+) -> None:
     """
     Main gameplay loop logic for turn progression.
 
     Modes:
       - 'turn': strict turn-taking with phases.
       - 'realtime': apply actions every frame immediately.
+
+    `pending` (ball eid -> Action) and a cached `turn_manager` let the caller
+    skip the per-frame entity scans; see _realtime_tick.
     """
-    turn_manager: Entity = ensure_turn_manager(world)
+    if turn_manager is None:
+        turn_manager = ensure_turn_manager(world)
     turn: TurnState | None = turn_manager.get(TurnState)
-    players = list(world.all_with(Player)) or [None]
 
+    if turn.mode == "realtime":
+        _realtime_tick(world, physics, pending)
+        return
+
+    players = list(world.all_with(Player)) or [None]
     player_id: int = turn.current_player
     ball = get_player_ball(world=world, player_id=player_id)
     body = physics.eid_to_body[ball.id].body
 
-    if turn.mode == "realtime":
-        _realtime_tick(world, physics)
-        return
-
-    match turn.phase:
+    phase = turn.phase
+    match phase:
         case Phase.AWAIT_INPUT:
             if ball.get(Action):
-                logger.debug(f"[Turn] Player {player_id} provided an action")
                 turn.phase = Phase.APPLY_ACTION
 
         case Phase.APPLY_ACTION:
-            logger.debug(f"[Turn] Phase=APPLY_ACTION for player {player_id}")
             action = consume_action(ball)
             if action:
                 apply_action_to_body(action=action, body=body)
-                logger.debug("[Turn] Transition: APPLY_ACTION → BALL_IN_MOTION")
                 turn.phase = Phase.BALL_IN_MOTION
             else:
-                logger.debug("[Turn] No action found, reverting to AWAIT_INPUT")
                 turn.phase = Phase.AWAIT_INPUT
 
         case Phase.BALL_IN_MOTION:
             if body.velocity.length < STOPPING_VELOCITY:
                 if vel := ball.get(Velocity):
                     vel.dx, vel.dy = body.velocity
-                logger.debug("[Turn] Ball stopped, transitioning to RESOLVE")
                 turn.phase = Phase.RESOLVE
 
         case Phase.RESOLVE:
-            logger.debug(f"[Turn] Phase=RESOLVE, switching from player {player_id}")
             turn.current_player = (turn.current_player + 1) % len(players)
-            logger.debug(f"[Turn] Next player → {turn.current_player}")
             turn.phase = Phase.AWAIT_INPUT
 
+    if trace.level >= trace.DEBUG and turn.phase is not phase:
+        trace.record(trace.Event.TURN_PHASE, player_id, phase.name, turn.phase.name)
+
 
 # Realtime mode
 
 
-def _realtime_tick(world: World, physics) -> None:
+def _realtime_tick(
+    world: World, physics, pending: dict[int, Action] | None = None
+) -> None:
     """
     In realtime mode:
     - Any entity with an Action gets it applied immediately.
     - No phases or strict sequencing.
+
+    With a `pending` queue (ball eid -> Action), only the queued actions are
+    applied, in one pass, and the queue is emptied: cost scales with the
+    number of actions rather than the number of entities.
     """
+    if pending is not None:
+        apply_pending_actions(physics, pending)
+        return
+
     for e in world.entities.values():
         act = consume_action(e)
         if not act:
@@ -173,5 +194,17 @@ def _realtime_tick(world: World, physics) -> None:
         if e.id not in physics.eid_to_body:
             continue
         body = physics.eid_to_body[e.id].body
-        logger.debug(f"[Realtime] Applying action {act.type} to entity {e.id}")
+        if trace.level >= trace.DEBUG:
+            trace.record(trace.Event.REALTIME_APPLY, act.type, e.id)
         apply_action_to_body(act, body)
+
+
+def apply_pending_actions(physics, pending: dict[int, Action]) -> None:
+    """Apply every queued action to its ball's body, then clear the queue."""
+    bodies = physics.eid_to_body
+    for eid, act in pending.items():
+        phys_obj = bodies.get(eid)
+        if phys_obj is None:
+            continue
+        apply_action_to_body(act, phys_obj.body)
+    pending.clear()
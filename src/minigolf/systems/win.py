@@ -1,19 +1,26 @@
 from dataclasses import dataclass
 from math import hypot
+from typing import TYPE_CHECKING
 
 from loguru import logger
 
+from minigolf import trace
 from minigolf.components import Circle, Collider, Hole, Position, Velocity
 from minigolf.consts import (
     FUNNEL_DAMPING,
-    FUNNEL_EXTRA,
     FUNNEL_RADIUS,
+    FUNNEL_REFERENCE_DT,
     FUNNEL_STRENGTH,
     VELOCITY_THRESHOLD,
 )
 from minigolf.entity import Entity
 from minigolf.world import World
 
+if TYPE_CHECKING:
+    import pymunk
+
+    from minigolf.systems.physics import PhysicsSpace
+
 # Numerical guard for zero-length vectors
 EPS = 1e-6
 
@@ -34,25 +41,26 @@ def _first(world: World, *types) -> Entity | None:
 
 
 def apply_funnel(
-    ball: Entity,
-    hole: Entity,
+    body: "pymunk.Body",
+    centre: tuple[float, float],
+    dt: float,
     radius: float = FUNNEL_RADIUS,
     strength: float = FUNNEL_STRENGTH,
     damping: float = FUNNEL_DAMPING,
 ) -> None:
     """
-    Funnel mechanic:
+    Funnel mechanic, applied to a pymunk body once per physics substep:
     - If a ball is within `radius` of the hole centre, apply a gentle force
       nudging it toward the hole.
     - Force is proportional to distance, direction is normalised toward hole.
     - Damping reduces velocity each step so it doesn’t spiral endlessly.
-    """
-    ball_pos, ball_vel = ball.get(Position), ball.get(Velocity)
-    hole_pos = hole.get(Position)
 
-    # Offset vector
-    ox = hole_pos.x - ball_pos.x
-    oy = hole_pos.y - ball_pos.y
+    `strength` and `damping` are defined per FUNNEL_REFERENCE_DT and rescaled
+    to `dt`, so the pull is the same whatever the substep count.
+    """
+    bx, by = body.position
+    ox = centre[0] - bx
+    oy = centre[1] - by
     sep_sq = ox * ox + oy * oy
     if sep_sq > radius * radius:
         # Outside funnel zone
@@ -65,31 +73,42 @@ def apply_funnel(
         return
 
     # Unit direction * scaled pull
-    pull_mag = strength * sep
+    scale = dt / FUNNEL_REFERENCE_DT
+    pull_mag = strength * sep * scale
     inv_sep = 1.0 / sep
     nx, ny = ox * inv_sep, oy * inv_sep
 
     # Damped current velocity + pull
-    ball_vel.dx = ball_vel.dx * damping + nx * pull_mag
-    ball_vel.dy = ball_vel.dy * damping + ny * pull_mag
+    keep = damping**scale
+    vx, vy = body.velocity
+    body.velocity = (vx * keep + nx * pull_mag, vy * keep + ny * pull_mag)
 
 
-def win_condition_system(world: World) -> list[WinEvent]:
+def win_condition_system(
+    world: World, physics: "PhysicsSpace | None" = None
+) -> list[WinEvent]:
     """
     Check if balls have been sunk into the hole.
 
-    Behaviour:
-    - Funnel: any ball within a funnel radius is gently pulled toward hole centre.
+    With a PhysicsSpace, holes are pymunk sensors and captures have already
+    been detected at substep granularity during `physics.step`; this only
+    drains them and mirrors the result onto the ball components.
+
+    Without one (e.g. worlds that were never simulated), fall back to a
+    geometric check over all balls (the funnel pull only exists in physics):
     - Win: a ball counts as sunk when:
         1. Ball + hole colliders overlap (distance ≤ combined radii).
         2. Ball is moving slower than VELOCITY_THRESHOLD.
     - On win: ball is snapped to hole centre and frozen.
     - Multiple balls are supported: return a list of WinEvent, possibly empty.
 
-    Contracts:
+    Contracts (fallback only; sensors handle any number of holes):
     - Exactly one hole must exist.
     - Hole collider must be a Circle.
     """
+    if physics is not None:
+        return _resolve_captures(world, physics)
+
     hole = _first(world, Hole, Position, Collider)
     if not hole or hole.id is None:
         logger.error("No hole found in the world")
@@ -129,16 +148,11 @@ def win_condition_system(world: World) -> list[WinEvent]:
         oy = ball_pos.y - hole_pos.y
         sep_sq = ox * ox + oy * oy
         r_contact = hole_radius + ball_radius
-        r_funnel = r_contact + FUNNEL_EXTRA
 
         # Kinematics
         vx, vy = ball_vel.dx, ball_vel.dy
         speed_sq = vx * vx + vy * vy
 
-        # Funnel zone
-        if sep_sq <= r_funnel * r_funnel:
-            apply_funnel(ball, hole)
-
         # Win condition check
         in_hole = sep_sq <= r_contact * r_contact
         slow_enough = speed_sq <= VELOCITY_THRESHOLD * VELOCITY_THRESHOLD
@@ -146,18 +160,32 @@ def win_condition_system(world: World) -> list[WinEvent]:
         if in_hole:
             sep = hypot(ox, oy)
             speed = hypot(vx, vy)
-            logger.debug(
-                f"[HoleEntry] Ball {ball.id} -> Hole {hole.id}"
-                f" dist={sep:.2f}, speed={speed:.2f}"
-            )
+            if trace.level >= trace.DEBUG:
+                trace.record(trace.Event.HOLE_ENTRY, ball.id, hole.id, sep, speed)
             if slow_enough:
-                logger.info(
-                    f"[Win] Ball {ball.id} captured in Hole {hole.id} "
-                    f" dist={sep:.2f}, speed={speed:.2f}"
-                )
+                if trace.level >= trace.INFO:
+                    trace.record(trace.Event.WIN, ball.id, hole.id, sep, speed)
                 # Snap + freeze
                 ball_pos.x, ball_pos.y = hole_pos.x, hole_pos.y
                 ball_vel.dx = ball_vel.dy = 0.0
                 events.append(WinEvent(ball.id, hole.id, sep, speed))
 
     return events
+
+
+def _resolve_captures(world: World, physics: "PhysicsSpace") -> list[WinEvent]:
+    """Snap + freeze the components of every ball the hole sensors captured."""
+    events = physics.drain_captures()
+    for evt in events:
+        ball_pos = world.get_entity(evt.ball_eid).get(Position)
+        ball_vel = world.get_entity(evt.ball_eid).get(Velocity)
+        hole_pos = world.get_entity(evt.hole_eid).get(Position)
+        if trace.level >= trace.INFO:
+            trace.record(
+                trace.Event.WIN, evt.ball_eid, evt.hole_eid, evt.distance, evt.speed
+            )
+        if ball_pos is not None and hole_pos is not None:
+            ball_pos.x, ball_pos.y = hole_pos.x, hole_pos.y
+        if ball_vel is not None:
+            ball_vel.dx = ball_vel.dy = 0.0
+    return events
@@ -0,0 +1,110 @@
+"""
+Structured tracing for the simulation hot paths.
+
+Turn, win and controller code used to build f-strings for logger.debug on
+every call, whether or not anything was listening. Instead they guard on the
+module-level `level` and record a typed event:
+
+    if trace.level >= trace.DEBUG:
+        trace.record(trace.Event.TURN_CONSUME, act.type, entity.id)
+
+With tracing off (the default) that is one attribute load and a compare: no
+arguments are built and nothing is formatted. When on, each event is stored
+as a plain tuple (event, *args) in a bounded ring buffer, and only turned
+into text by dump() / flush_to_logger().
+
+MINIGOLF_TRACE=info|debug enables tracing at import, e.g. for a script.
+"""
+
+import os
+from collections import deque
+from enum import IntEnum
+
+from loguru import logger
+
+OFF = 0
+INFO = 1
+DEBUG = 2
+LEVELS = {"off": OFF, "info": INFO, "debug": DEBUG}
+# loguru level each trace level is flushed at
+LOG_LEVELS = {INFO: "INFO", DEBUG: "DEBUG"}
+
+DEFAULT_CAPACITY = 10_000
+
+
+class Event(IntEnum):
+    TURN_CREATED = 1
+    TURN_MODE = 2
+    TURN_CONSUME = 3
+    TURN_APPLY = 4
+    TURN_PHASE = 5
+    REALTIME_APPLY = 6
+    HOLE_ENTRY = 7
+    WIN = 8
+    SEQUENCE_MOVE = 9
+
+
+# Event -> (level it is recorded at, message template for its args)
+TEMPLATES: dict[Event, tuple[int, str]] = {
+    Event.TURN_CREATED: (DEBUG, "[Turn] Created TurnManager with mode={}"),
+    Event.TURN_MODE: (DEBUG, "[Turn] Switched TurnManager mode → {}"),
+    Event.TURN_CONSUME: (DEBUG, "[Turn] Consuming {} from Ball {}"),
+    Event.TURN_APPLY: (DEBUG, "[Turn] Applying {} with vel={}"),
+    Event.TURN_PHASE: (DEBUG, "[Turn] Player {}: {} → {}"),
+    Event.REALTIME_APPLY: (DEBUG, "[Realtime] Applying action {} to entity {}"),
+    Event.HOLE_ENTRY: (
+        DEBUG,
+        "[HoleEntry] Ball {} -> Hole {} dist={:.2f}, speed={:.2f}",
+    ),
+    Event.WIN: (INFO, "[Win] Ball {} captured in Hole {} dist={:.2f}, speed={:.2f}"),
+    Event.SEQUENCE_MOVE: (DEBUG, "[SeqCtrl] Player {} move {}"),
+}
+
+level: int = LEVELS.get(os.environ.get("MINIGOLF_TRACE", "off").lower(), OFF)
+_buffer: deque[tuple] = deque(maxlen=DEFAULT_CAPACITY)
+
+
+def enable(at: int = DEBUG, capacity: int = DEFAULT_CAPACITY) -> None:
+    """Start recording events up to level `at`, keeping the last `capacity`."""
+    global level, _buffer
+    level = at
+    if capacity != _buffer.maxlen:
+        _buffer = deque(_buffer, maxlen=capacity)
+
+
+def disable() -> None:
+    global level
+    level = OFF
+
+
+def record(event: Event, *args) -> None:
+    """Append an event; callers check `level` first so this is never a no-op."""
+    _buffer.append((event, *args))
+
+
+def events() -> list[tuple]:
+    return list(_buffer)
+
+
+def clear() -> None:
+    _buffer.clear()
+
+
+def format_event(entry: tuple) -> str:
+    event, *args = entry
+    return TEMPLATES[event][1].format(*args)
+
+
+def dump(*, reset: bool = True) -> list[str]:
+    """Format the buffered events, oldest first."""
+    lines = [format_event(entry) for entry in _buffer]
+    if reset:
+        _buffer.clear()
+    return lines
+
+
+def flush_to_logger() -> None:
+    """Send the buffered events to loguru at their own levels, then clear."""
+    for entry in _buffer:
+        logger.log(LOG_LEVELS[TEMPLATES[entry[0]][0]], format_event(entry))
+    _buffer.clear()
@@ -1,6 +1,8 @@
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from minigolf.components import Position, Shape
 
 
@@ -20,3 +22,27 @@ def from_pymunk_position(shape: "Shape", pos: tuple[int, int]) -> tuple[int, int
 def to_pymunk_position(shape: "Shape", pos: "Position") -> tuple[int, int]:
     offset = shape.pymunk_offset()
     return add_tuples((pos.x, pos.y), offset)
+
+
+def drop_partial_line(path: "Path", block: int = 4096) -> None:
+    """
+    Truncate a line-based file back to its last newline, dropping a line a
+    crash cut off, so an append-only writer can resume it.
+    """
+    if not path.exists():
+        return
+    with path.open("rb+") as f:
+        end = f.seek(0, 2)
+        pos = end
+        while pos > 0:
+            start = max(0, pos - block)
+            f.seek(start)
+            newline = f.read(pos - start).rfind(b"\n")
+            if newline != -1:
+                keep = start + newline + 1
+                break
+            pos = start
+        else:
+            keep = 0
+        if keep != end:
+            f.truncate(keep)
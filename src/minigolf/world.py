@@ -11,6 +11,15 @@ from minigolf.game.state import GameState
 T = TypeVar("T", bound=BaseModel)
 
 
+def component_types() -> dict[str, type[BaseModel]]:
+    """Component classes by name, as used in serialized worlds."""
+    return {
+        name: obj
+        for name, obj in vars(components).items()
+        if isinstance(obj, type) and issubclass(obj, BaseModel)
+    }
+
+
 class World:
     def __init__(self):
         self._next_id: int = 0
@@ -89,12 +98,7 @@ class World:
     @classmethod
     def from_json_dict(cls, data: dict[str, Any]) -> "World":
         world = cls()
-
-        component_classes: dict[str, type[BaseModel]] = {
-            name: obj
-            for name, obj in vars(components).items()
-            if isinstance(obj, type) and issubclass(obj, BaseModel)
-        }
+        component_classes = component_types()
 
         for eid_str in data["entities"]:
             eid = int(eid_str)
@@ -0,0 +1,78 @@
+import csv
+import json
+
+from click.testing import CliRunner
+
+from minigolf.batch.main import cli
+from minigolf.batch.runner import Job, ResultWriter, play
+from minigolf.game.levels import create_level1
+from minigolf.world import World
+
+
+def _levels_dir(tmp_path):
+    levels = tmp_path / "levels"
+    levels.mkdir()
+    world = World()
+    create_level1(world)
+    world.to_json(levels / "level1.json")
+    return levels
+
+
+def test_sequence_controller_solves_level1(tmp_path):
+    level = _levels_dir(tmp_path) / "level1.json"
+
+    result = play(Job(str(level), "sequence", 0))
+
+    assert result.won
+    assert result.strokes == 4
+    assert result.frames > 0
+    assert result.rollouts_per_s > 0
+
+
+def test_batch_cli_streams_jsonl_and_resumes(tmp_path):
+    levels = _levels_dir(tmp_path)
+    out = tmp_path / "results.jsonl"
+    args = [str(levels), "-c", "sequence", "--seeds", "2", "--workers", "1"]
+    args += ["-o", str(out), "--max-strokes", "4"]
+
+    assert CliRunner().invoke(cli, args).exit_code == 0
+    rows = [json.loads(line) for line in out.read_text().splitlines()]
+    assert [(r["seed"], r["won"]) for r in rows] == [(0, True), (1, True)]
+
+    # Simulate a crash mid-write of a third game, then resume with more seeds
+    with out.open("a") as f:
+        f.write('{"level": "trunc')
+    args[4] = "3"
+    assert CliRunner().invoke(cli, args).exit_code == 0
+    rows = [json.loads(line) for line in out.read_text().splitlines()]
+    assert sorted(r["seed"] for r in rows) == [0, 1, 2]
+
+
+def test_csv_writer_reads_back_done_keys(tmp_path):
+    out = tmp_path / "results.csv"
+    level = str(_levels_dir(tmp_path) / "level1.json")
+    writer = ResultWriter(out)
+    writer.write(play(Job(level, "sequence", 7), max_strokes=1))
+    writer.close()
+
+    assert ResultWriter(out).done == {(level, "sequence", 7)}
+    with out.open() as f:
+        assert list(csv.DictReader(f))[0]["strokes"] == "1"
+
+
+def test_csv_row_cut_off_after_its_key_is_re_run(tmp_path):
+    out = tmp_path / "results.csv"
+    level = str(_levels_dir(tmp_path) / "level1.json")
+    writer = ResultWriter(out)
+    writer.write(play(Job(level, "sequence", 0), max_strokes=1))
+    writer.close()
+    # A crash after the seed column: DictReader would fill the rest with None
+    with out.open("a") as f:
+        f.write(f"{level},sequence,1,")
+
+    resumed = ResultWriter(out)
+    resumed.close()
+
+    assert resumed.done == {(level, "sequence", 0)}
+    with out.open() as f:
+        assert [row["seed"] for row in csv.DictReader(f)] == ["0"]
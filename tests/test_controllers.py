@@ -0,0 +1,119 @@
+import threading
+import time
+from concurrent.futures import Future
+
+from pymunk import Vec2d
+
+from minigolf.components import Action, Mode, Phase, TurnState
+from minigolf.controllers import BackgroundController, SequenceController
+from minigolf.game.engine import Game
+from minigolf.objects import EntityBuilder
+from minigolf.world import World
+
+STRIKE = Action(type="strike", velocity=(50.0, 0.0))
+FALLBACK = Action(type="strike", velocity=(0.0, 50.0))
+
+
+class SlowController:
+    def __init__(self, delay: float, action: Action = STRIKE):
+        self.delay = delay
+        self.action = action
+        self.release = threading.Event()
+
+    def act(self, world, player_id):
+        self.release.wait(self.delay)
+        return self.action
+
+
+class BrokenController:
+    def act(self, world, player_id):
+        raise RuntimeError("planner crashed")
+
+
+def _poll_until(ctrl, world, timeout: float = 2.0):
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        act = ctrl.act(world, 0)
+        if act is not None:
+            return act
+        time.sleep(0.005)
+    raise AssertionError("no action produced")
+
+
+def test_game_keeps_stepping_while_decision_is_pending():
+    world = World()
+    world.add_entity(EntityBuilder().hole(900, 900).build())
+    world.add_entity(EntityBuilder().ball(100, 100).build())
+    slow = SlowController(delay=5.0)
+    ctrl = BackgroundController(slow, deadline=None)
+    game = Game(world=world, mode=Mode.TURN)
+    game.add_player(ctrl)
+
+    started = time.monotonic()
+    for _ in range(10):
+        game.step(1 / 60)
+    assert time.monotonic() - started < 1.0
+    assert ctrl.pending(0)
+    assert game.physics.frame == 10
+
+    slow.release.set()
+    for _ in range(200):
+        game.step(1 / 60)
+        if game._turn_manager.get(TurnState).phase is not Phase.AWAIT_INPUT:
+            break
+        time.sleep(0.001)
+    assert not ctrl.pending(0)
+    ctrl.close()
+
+
+def test_deadline_plays_fallback_action():
+    ctrl = BackgroundController(
+        SlowController(delay=1.0), deadline=0.05, fallback=FALLBACK
+    )
+    assert _poll_until(ctrl, World()) == FALLBACK
+    ctrl.close()
+
+
+def test_missed_deadline_does_not_hold_up_the_next_decision():
+    class StuckOnce:
+        def __init__(self):
+            self.calls = 0
+            self.release = threading.Event()
+
+        def act(self, world, player_id):
+            self.calls += 1
+            if self.calls == 1:
+                self.release.wait(2.0)
+            return STRIKE
+
+    inner = StuckOnce()
+    ctrl = BackgroundController(inner, deadline=0.05, fallback=FALLBACK)
+    assert _poll_until(ctrl, World()) == FALLBACK
+    # The first decision is still running; the second gets a fresh worker
+    assert _poll_until(ctrl, World()) == STRIKE
+    inner.release.set()
+    ctrl.close()
+
+
+def test_failure_falls_back_to_controller():
+    ctrl = BackgroundController(
+        BrokenController(), fallback=SequenceController(moves=[[Vec2d(1.0, 2.0), 0.0]])
+    )
+    act = _poll_until(ctrl, World())
+    assert act.velocity == (1.0, 2.0)
+    ctrl.close()
+
+
+def test_async_controller_futures_are_used_directly():
+    class FutureController:
+        def __init__(self):
+            self.future: Future = Future()
+
+        def submit(self, world, player_id):
+            return self.future
+
+    inner = FutureController()
+    ctrl = BackgroundController(inner, deadline=None)
+    assert ctrl.act(World(), 0) is None
+    inner.future.set_result(STRIKE)
+    assert ctrl.act(World(), 0) == STRIKE
@@ -0,0 +1,100 @@
+import threading
+from pathlib import Path
+
+import pytest
+from pymunk import Vec2d
+
+from minigolf.components import Action
+from minigolf.controllers import (
+    BackgroundController,
+    Controller,
+    SequenceController,
+)
+from minigolf.game import course as course_module
+from minigolf.game.course import Course, CourseSession
+from minigolf.objects import EntityBuilder
+from minigolf.world import World
+
+
+class Putt(Controller):
+    """Strikes straight along +x at a fixed speed, every turn."""
+
+    def __init__(self, speed: float):
+        self.speed = speed
+
+    def act(self, world: World, player_id: int) -> Action | None:
+        return Action(type="strike", velocity=(self.speed, 0.0))
+
+
+def _hole(path: Path, hole_x: float) -> Path:
+    world = World()
+    world.add_entity(EntityBuilder().ball(200, 500).build())
+    world.add_entity(EntityBuilder().hole(hole_x, 500).build())
+    world.to_json(path)
+    return path
+
+
+def test_next_hole_is_built_in_the_background(tmp_path, monkeypatch):
+    built_on: dict[int, str] = {}
+    load_hole = course_module.load_hole
+
+    def spy(index, source, physics_profile=None):
+        built_on[index] = threading.current_thread().name
+        return load_hole(index, source, physics_profile)
+
+    monkeypatch.setattr(course_module, "load_hole", spy)
+    paths = [_hole(tmp_path / f"{i}.json", 300) for i in range(3)]
+
+    with Course(paths) as course:
+        first = course.current
+        second = course.advance()
+        third = course.advance()
+
+        assert course.advance() is None
+        assert [h.index for h in (first, second, third)] == [0, 1, 2]
+        assert second.physics.world is second.world is not first.world
+
+    assert built_on[0] == threading.main_thread().name
+    assert built_on[1].startswith("course-preload")
+    assert built_on[2].startswith("course-preload")
+
+
+def test_session_scores_every_hole(tmp_path):
+    paths = [_hole(tmp_path / "a.json", 300), _hole(tmp_path / "b.json", 100)]
+
+    with Course.from_dir(tmp_path) as course:
+        session = CourseSession(course, [Putt(150.0)], max_strokes=3)
+        session.play()
+
+    card = session.scorecards[0]
+    assert session.finished
+    assert len(card.strokes) == len(paths)
+    # Hole ahead sunk in one; the one behind the ball is never reached
+    assert card.sunk == [True, False]
+    assert card.strokes == [1, 3]
+    assert card.total == 4
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_controllers_are_reset_for_every_hole(tmp_path, background):
+    for name in ("a", "b", "c"):
+        _hole(tmp_path / f"{name}.json", 300)
+    controller = SequenceController(moves=[[Vec2d(150.0, 0.0), 0.0]])
+    if background:
+        controller = BackgroundController(controller, deadline=None)
+
+    with Course.from_dir(tmp_path) as course:
+        session = CourseSession(course, [controller], max_strokes=1)
+        session.play(max_frames=600)
+    if background:
+        controller.close()
+
+    # The one move is played again on every hole, not only the first
+    assert session.scorecards[0].sunk == [True, True, True]
+
+
+def test_empty_course_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        Course([])
+    with pytest.raises(FileNotFoundError, match="No level files"):
+        Course.from_dir(tmp_path)
@@ -0,0 +1,76 @@
+import pytest
+
+from minigolf.components import Action, Mode, Player
+from minigolf.game.engine import Game
+from minigolf.objects import EntityBuilder
+from minigolf.world import World
+
+
+class CountingController:
+    """Strikes right once, then goes quiet; counts how often it was polled."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def act(self, world, player_id):
+        self.calls += 1
+        if self.calls == 1:
+            return Action(type="strike", velocity=(100.0, 0.0))
+        return None
+
+
+def _world_with_balls(n: int) -> World:
+    world = World()
+    world.add_entity(EntityBuilder().hole(5000, 5000).build())
+    for i in range(n):
+        world.add_entity(EntityBuilder().ball(20 * i, 0).build())
+    return world
+
+
+def test_add_player_claims_each_ball_once():
+    game = Game(world=_world_with_balls(3), mode=Mode.TURN)
+
+    pids = [game.add_player(CountingController()) for _ in range(3)]
+
+    assert pids == [0, 1, 2]
+    balls = {game.player_balls[pid].id for pid in pids}
+    assert len(balls) == 3
+    assert all(game.player_balls[pid].get(Player).id == pid for pid in pids)
+    with pytest.raises(RuntimeError):
+        game.add_player(CountingController())
+
+
+def test_realtime_polls_every_controller_and_applies_in_one_pass():
+    n = 200
+    game = Game(world=_world_with_balls(n), mode=Mode.REALTIME)
+    ctrls = [CountingController() for _ in range(n)]
+    for ctrl in ctrls:
+        game.add_player(ctrl)
+
+    game.step(1 / 60)
+
+    assert all(c.calls == 1 for c in ctrls)
+    assert game.pending_actions == {}
+    for ball in game.player_balls.values():
+        assert game.physics.eid_to_body[ball.id].body.velocity.x == 100.0
+        assert ball.get(Action) is None
+
+
+def test_realtime_poll_batch_round_robin():
+    game = Game(world=_world_with_balls(5), mode=Mode.REALTIME, poll_batch=2)
+    ctrls = [CountingController() for _ in range(5)]
+    for ctrl in ctrls:
+        game.add_player(ctrl)
+
+    game.step(1 / 60)
+    assert [c.calls for c in ctrls] == [1, 1, 0, 0, 0]
+
+    game.step(1 / 60)
+    game.step(1 / 60)
+    assert [c.calls for c in ctrls] == [2, 1, 1, 1, 1]
+
+
+@pytest.mark.parametrize("poll_batch", [0, -1])
+def test_poll_batch_must_poll_someone(poll_batch):
+    with pytest.raises(ValueError, match="poll_batch"):
+        Game(world=_world_with_balls(1), mode=Mode.REALTIME, poll_batch=poll_batch)
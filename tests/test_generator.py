@@ -0,0 +1,52 @@
+import json
+
+from minigolf.generator.maze import generate_layout
+from minigolf.generator.runner import INDEX_NAME, LevelWriter, generate_levels
+from minigolf.world import World
+
+
+def test_layout_is_deterministic_and_fully_connected():
+    a, b = generate_layout(42), generate_layout(42)
+
+    assert a == b
+    assert a != generate_layout(43)
+    cells = {(c, r) for c in range(a.cols) for r in range(a.rows)}
+    assert all(a.path(a.ball, cell)[-1] == cell for cell in cells)
+
+
+def test_generated_levels_stream_to_disk_and_resume(tmp_path):
+    writer = LevelWriter(tmp_path)
+    attempted, accepted = generate_levels(range(2), writer)
+    writer.close()
+
+    assert (attempted, accepted) == (2, 2)
+    index = [json.loads(line) for line in (tmp_path / INDEX_NAME).read_text().split()]
+    assert [m["seed"] for m in index] == [0, 1]
+    for meta in index:
+        assert 1 <= meta["strokes"] <= meta["rollouts"]
+        world = World.from_json(tmp_path / meta["file"])
+        assert len(world.get_balls()) == 1
+
+    writer = LevelWriter(tmp_path)
+    assert generate_levels(range(3), writer) == (1, 1)
+    writer.close()
+    level = (tmp_path / "level_000000.json").read_text()
+    assert generate_levels(range(1), LevelWriter(tmp_path / "again")) == (1, 1)
+    assert (tmp_path / "again" / "level_000000.json").read_text() == level
+
+
+def test_index_entry_cut_off_by_a_crash_is_regenerated(tmp_path):
+    writer = LevelWriter(tmp_path)
+    generate_levels(range(2), writer)
+    writer.close()
+    index_path = tmp_path / INDEX_NAME
+    lines = index_path.read_text().splitlines(keepends=True)
+    # Seed 1's entry, cut off before its newline
+    index_path.write_text(lines[0] + lines[1][:-1])
+
+    writer = LevelWriter(tmp_path)
+    assert writer.done == {0}
+    assert generate_levels(range(2), writer) == (1, 1)
+    writer.close()
+
+    assert index_path.read_text() == "".join(lines)
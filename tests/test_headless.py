@@ -0,0 +1,22 @@
+import subprocess
+import sys
+
+HEADLESS_MODULES = [
+    "minigolf.game.engine",
+    "minigolf.game.rollout",
+    "minigolf.batch.runner",
+    "minigolf.generator.runner",
+    "minigolf.observation",
+    "minigolf.serialization",
+]
+
+
+def test_simulation_core_imports_without_pygame():
+    code = (
+        f"import sys\nfor m in {HEADLESS_MODULES!r}: __import__(m)\n"
+        "print(sorted(m for m in sys.modules if m.startswith('pygame')))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    assert out.strip() == "[]"
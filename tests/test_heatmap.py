@@ -0,0 +1,122 @@
+import numpy as np
+import pytest
+
+from minigolf import serialization
+from minigolf.analysis import heatmap as heatmap_module
+from minigolf.analysis.heatmap import (
+    Chunk,
+    DifficultyStore,
+    RestHeatmap,
+    analyse_level,
+    build_heatmap,
+    sample_chunk,
+)
+from minigolf.analysis.overlay import render_overlay
+from minigolf.objects import EntityBuilder
+from minigolf.world import World
+
+
+def _level(tmp_path, name="level.json", balls=1):
+    world = World()
+    world.add_entity(EntityBuilder().wall(0, 0, 400, 10).build())
+    world.add_entity(EntityBuilder().wall(0, 390, 400, 10).build())
+    world.add_entity(EntityBuilder().wall(0, 0, 10, 400).build())
+    world.add_entity(EntityBuilder().wall(390, 0, 10, 400).build())
+    for i in range(balls):
+        world.add_entity(EntityBuilder().ball(100, 200 + 50 * i).build())
+    world.add_entity(EntityBuilder().hole(250, 200).build())
+    path = tmp_path / name
+    world.to_json(path)
+    return path
+
+
+def test_add_bins_rests_and_counts_captures():
+    heatmap = RestHeatmap((0, 0, 100, 100), bins=10)
+    heatmap.add((5, 95), won=False)
+    heatmap.add((50, 50), won=True)
+    heatmap.add((150, 50), won=False)
+
+    assert heatmap.rests[9, 0] == 1 and heatmap.rests.sum() == 1
+    assert (heatmap.strokes, heatmap.captures, heatmap.escaped) == (3, 1, 1)
+    with pytest.raises(ValueError):
+        heatmap.merge(RestHeatmap((0, 0, 100, 100), bins=5))
+
+
+def test_chunked_and_parallel_runs_merge_to_the_same_heatmap(tmp_path):
+    level = _level(tmp_path)
+    whole = build_heatmap(level, 12, policy="aimed", bins=16, chunk=12)
+    chunked = build_heatmap(level, 12, policy="aimed", bins=16, chunk=5, workers=2)
+
+    assert chunked.strokes == whole.strokes == 12
+    assert chunked.captures > 0
+    # Chunks are seeded separately, so only the totals line up
+    assert chunked.rests.sum() + chunked.captures + chunked.escaped == 12
+
+
+def test_chunk_does_not_depend_on_chunks_run_before_it(tmp_path):
+    level = _level(tmp_path, balls=2)
+    first, second = (ball.id for ball in World.from_json(level).get_balls())
+
+    def run(chunk):
+        return sample_chunk(chunk, level=str(level), policy="random", bins=16)
+
+    heatmap_module._load.cache_clear()
+    alone = run(Chunk(second, "1", 10))
+    # Same worker, after strokes that knocked the other ball around
+    heatmap_module._load.cache_clear()
+    run(Chunk(first, "x1", 10))
+    after = run(Chunk(second, "1", 10))
+
+    np.testing.assert_array_equal(after.rests, alone.rests)
+    assert after.captures == alone.captures
+
+
+def test_save_and_load_round_trip(tmp_path):
+    heatmap = build_heatmap(_level(tmp_path), 6, bins=8)
+    heatmap.save(tmp_path / "h.npz")
+    loaded = RestHeatmap.load(tmp_path / "h.npz")
+
+    np.testing.assert_array_equal(loaded.rests, heatmap.rests)
+    assert (loaded.bounds, loaded.strokes, loaded.captures) == (
+        heatmap.bounds,
+        heatmap.strokes,
+        heatmap.captures,
+    )
+
+
+def test_reports_are_keyed_by_level_hash(tmp_path):
+    first = _level(tmp_path, "a.json")
+    copy = _level(tmp_path, "b.json")
+    store = DifficultyStore(tmp_path / "difficulty.json")
+
+    report = analyse_level(first, 6, store, tmp_path, policy="aimed", bins=8)
+    assert report.level_hash == serialization.level_hash(World.from_json(first))
+    assert (tmp_path / f"{report.level_hash}.aimed.npz").exists()
+    assert 0 <= report.spread <= 1 and report.difficulty >= 0
+
+    # Same contents under another name: already analysed
+    reloaded = DifficultyStore(tmp_path / "difficulty.json")
+    again = analyse_level(copy, 6, reloaded, tmp_path, policy="aimed", bins=8)
+    assert again == report
+
+
+def test_resume_counts_strokes_per_ball_and_matches_settings(tmp_path):
+    level = _level(tmp_path, balls=2)
+    store = DifficultyStore(tmp_path / "difficulty.json")
+    first = analyse_level(level, 4, store, tmp_path, bins=8)
+    assert first.strokes == 8 and first.bins == 8
+
+    # 8 strokes in total is only 4 per ball: 6 per ball needs a rerun
+    assert analyse_level(level, 4, store, tmp_path, bins=8) == first
+    assert analyse_level(level, 6, store, tmp_path, bins=8).strokes == 12
+    # Same strokes, different grid or seed
+    assert analyse_level(level, 6, store, tmp_path, bins=16).bins == 16
+    assert analyse_level(level, 6, store, tmp_path, bins=16, seed=1).seed == 1
+
+
+def test_overlay_covers_the_level(tmp_path):
+    level = _level(tmp_path)
+    heatmap = build_heatmap(level, 4, bins=8)
+
+    surface = render_overlay(World.from_json(level), heatmap)
+    assert surface.get_size() == (400, 400)
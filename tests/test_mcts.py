@@ -0,0 +1,109 @@
+import math
+
+import pytest
+
+from minigolf.components import Mode, Position
+from minigolf.controllers.mcts import STALL_LIMIT, MCTSController
+from minigolf.game.engine import Game
+from minigolf.objects import EntityBuilder
+from minigolf.systems.turn import get_player_ball
+from minigolf.world import World
+
+
+def _arena(hole_x: float = 600) -> World:
+    world = World()
+    world.add_entity(EntityBuilder().wall(0, 0, 1000, 10).build())
+    world.add_entity(EntityBuilder().wall(0, 990, 1000, 10).build())
+    world.add_entity(EntityBuilder().ball(200, 500).build())
+    world.add_entity(EntityBuilder().hole(hole_x, 500).build())
+    return world
+
+
+def _controller(world: World, **kwargs) -> MCTSController:
+    kwargs.setdefault("directions", 8)
+    kwargs.setdefault("reaches", (150.0, 400.0))
+    ctrl = MCTSController(seed=0, **kwargs)
+    Game(world=world, mode=Mode.TURN).add_player(ctrl)
+    return ctrl
+
+
+def test_finds_the_sinking_strike():
+    world = _arena()
+    ctrl = _controller(world, rollouts=30)
+
+    act = ctrl.act(world, 0)
+
+    vx, vy = act.velocity
+    assert vx > 0 and abs(vy) < 1e-6
+    assert ctrl.stats.rollouts == 30
+    assert ctrl.stats.tree_size > 1 and ctrl.stats.reused == 0
+    assert ctrl.stats.rollouts_per_s > 0
+
+
+def test_keeps_the_subtree_of_the_strike_played():
+    world = _arena(hole_x=900)
+    ctrl = _controller(world, rollouts=40)
+    ball = get_player_ball(world, 0)
+
+    act = ctrl.act(world, 0)
+    pos = ball.get(Position)
+    rest, won = ctrl.simulator.run((pos.x, pos.y), act.velocity)
+    assert not won
+    ball.add(Position(x=rest[0], y=rest[1]))
+    kept = ctrl.root.children[ctrl._played].size()
+
+    ctrl.act(world, 0)
+    assert ctrl.stats.reused == kept
+
+    # Somewhere the tree didn't predict: start over
+    ball.add(Position(x=rest[0] + 50, y=rest[1]))
+    ctrl.act(world, 0)
+    assert ctrl.stats.reused == 0
+
+
+def test_time_budget():
+    world = _arena(hole_x=900)
+    ctrl = _controller(world, rollouts=None, time_limit=0.2)
+
+    assert ctrl.act(world, 0) is not None
+    assert ctrl.stats.elapsed == pytest.approx(0.2, abs=0.2)
+
+
+def test_stops_once_nothing_is_left_to_expand():
+    world = _arena(hole_x=900)
+    # Two strikes, one stroke deep: the whole tree is two rollouts
+    ctrl = _controller(
+        world, directions=2, reaches=(150.0,), max_depth=1, rollouts=None, time_limit=5
+    )
+
+    assert ctrl.act(world, 0) is not None
+    assert ctrl.stats.rollouts == 2
+    assert ctrl.stats.elapsed < 1
+
+
+def test_revisits_are_not_rollouts():
+    world = _arena()
+    ctrl = _controller(world, rollouts=200)
+
+    ctrl.act(world, 0)
+
+    # Selection settles on the sinking line and only re-scores it from then on
+    assert ctrl.stats.revisits >= STALL_LIMIT
+    assert ctrl.stats.rollouts == ctrl.stats.tree_size - 1 < 200
+
+
+def test_needs_a_budget():
+    with pytest.raises(ValueError, match="budget"):
+        MCTSController(rollouts=None, time_limit=None)
+
+
+def test_leaf_parallel_workers():
+    world = _arena()
+    ctrl = _controller(world, rollouts=12, workers=2)
+    try:
+        act = ctrl.act(world, 0)
+    finally:
+        ctrl.close()
+
+    assert ctrl.stats.rollouts == 12
+    assert math.isclose(math.atan2(act.velocity[1], act.velocity[0]), 0, abs_tol=1e-6)
@@ -0,0 +1,106 @@
+import copy
+from types import SimpleNamespace
+
+import pytest
+
+from minigolf import memory
+from minigolf.game.levels import create_level1
+from minigolf.objects import EntityBuilder
+from minigolf.systems.physics import PhysicsSpace
+from minigolf.world import World
+
+
+@pytest.fixture
+def tracing():
+    memory.start()
+    yield
+    memory.stop()
+
+
+def _level1() -> World:
+    world = World()
+    create_level1(world)
+    return world
+
+
+def test_world_bytes_are_split_by_component_type():
+    world = _level1()
+    usage = memory.world_usage(world)
+
+    assert usage.entities == len(world.entities)
+    assert usage.components["Position"].count == len(world.entities)
+    assert usage.components["Hole"].count == 1
+    assert all(c.bytes > 0 for c in usage.components.values())
+
+    world.add_entity(EntityBuilder().wall(0, 0, 10, 10).build())
+    bigger = memory.world_usage(world)
+    assert bigger.components["Position"].bytes > usage.components["Position"].bytes
+
+
+def test_physics_counts_bodies_and_shapes():
+    physics = PhysicsSpace(_level1())
+    physics.populate()
+    usage = memory.physics_usage(physics)
+
+    assert usage.bodies == {"static": 12, "dynamic": 1}
+    # 11 walls, the ball, and the hole with its funnel gate
+    assert usage.shapes == {"Poly": 11, "Circle": 3}
+    assert usage.registered == (12, 1)
+
+
+def test_history_grows_with_each_snapshot():
+    world = _level1()
+    editor = SimpleNamespace(undo_stack=[], redo_stack=[])
+    empty = memory.history_usage(editor)
+
+    editor.undo_stack.append(copy.deepcopy(world.entities))
+    one = memory.history_usage(editor)
+    editor.undo_stack.append(copy.deepcopy(world.entities))
+    two = memory.history_usage(editor)
+
+    assert (one.undo_depth, two.undo_depth, two.redo_depth) == (1, 2, 0)
+    # Every snapshot is a full copy of the level
+    assert empty.undo_bytes < 100 < 10_000 < one.undo_bytes
+    assert two.undo_bytes > 1.8 * one.undo_bytes
+
+
+def test_subsystem_names_minigolf_modules():
+    assert (
+        memory.subsystem("/src/minigolf/editor/actions.py") == "minigolf.editor.actions"
+    )
+    assert memory.subsystem("/x/minigolf/systems/__init__.py") == "minigolf.systems"
+    assert memory.subsystem("/site-packages/pymunk/space.py") is None
+
+
+def test_diff_charges_allocations_to_the_calling_module(tracing):
+    before = memory.snapshot()
+    world = World()
+    for i in range(500):
+        world.add_entity(EntityBuilder().wall(i * 10, 0, 10, 10).build())
+    after = memory.snapshot()
+
+    changes = memory.diff(before, after)
+    # pydantic does the allocating, but on behalf of the builder
+    assert changes.get("minigolf.objects", 0) > 50_000
+    assert (
+        "pydantic" not in changes or changes["pydantic"] < changes["minigolf.objects"]
+    )
+    assert memory.growth()
+
+
+def test_log_report_includes_every_section(tracing):
+    world = _level1()
+    physics = PhysicsSpace(world)
+    physics.populate()
+    report = memory.report(
+        world=world,
+        physics=physics,
+        editor=SimpleNamespace(undo_stack=[], redo_stack=[]),
+    )
+    report.growth = memory.growth()
+
+    lines = memory.format_report(report)
+    assert lines[0].startswith("[Memory] World: 13 entities")
+    assert any(line.startswith("[Memory] Physics:") for line in lines)
+    assert any(line.startswith("[Memory] Editor history: undo 0") for line in lines)
+    assert any(line.startswith("[Memory] Allocated since start") for line in lines)
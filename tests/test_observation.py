@@ -0,0 +1,77 @@
+import numpy as np
+
+from minigolf.components import Position, Velocity
+from minigolf.game.levels import create_level1
+from minigolf.objects import EntityBuilder
+from minigolf.observation import (
+    BALL_CHANNEL,
+    HOLE_CHANNEL,
+    VECTOR_FIELDS,
+    WALL_CHANNEL,
+    ObservationEncoder,
+)
+from minigolf.world import World
+
+
+def _field(vec, name):
+    return vec[VECTOR_FIELDS.index(name)]
+
+
+def test_vector_tracks_ball_and_reuses_static_layer():
+    world = World()
+    create_level1(world)
+    enc = ObservationEncoder(grid_size=32)
+
+    vec = enc.vector(world)
+    assert (_field(vec, "ball_x"), _field(vec, "ball_y")) == (200, 800)
+    assert _field(vec, "hole_radius") == 25
+    assert _field(vec, "to_hole_distance") == np.hypot(300, 300).astype(np.float32)
+
+    layer = enc.static(world)
+    ball = world.get_balls()[0]
+    ball.add(Position(x=480, y=500))
+    ball.add(Velocity(dx=3, dy=-4))
+    vec = enc.vector(world)
+    assert enc.static(world) is layer
+    assert vec is enc.vector(world)
+    assert (_field(vec, "ball_vx"), _field(vec, "to_hole_x")) == (3, 20)
+
+
+def test_grid_channels_and_wall_cache():
+    world = World()
+    world.add_entity(EntityBuilder().wall(0, 0, 100, 10).build())
+    world.add_entity(EntityBuilder().ball(50, 50).build())
+    world.add_entity(EntityBuilder().hole(80, 80, radius=5).build())
+    enc = ObservationEncoder(grid_size=10, bounds=(0, 0, 100, 100))
+
+    grid = enc.grid(world)
+
+    assert grid.shape == (3, 10, 10)
+    assert grid[WALL_CHANNEL, 0].all() and grid[WALL_CHANNEL, 1:].sum() == 0
+    assert grid[BALL_CHANNEL].sum() == 1 and grid[BALL_CHANNEL, 5, 5] == 1
+    assert grid[HOLE_CHANNEL, 7:9, 7:9].all()
+
+    # Walls added after the first call only show up once invalidated
+    world.add_entity(EntityBuilder().wall(0, 90, 100, 10).build())
+    assert enc.grid(world)[WALL_CHANNEL, 9].sum() == 0
+    enc.invalidate(world)
+    assert enc.grid(world)[WALL_CHANNEL, 9].all()
+
+
+def test_batch_matches_single_encodings():
+    worlds = []
+    for x in (150, 250, 350):
+        world = World()
+        world.add_entity(EntityBuilder().ball(x, 100).build())
+        world.add_entity(EntityBuilder().hole(500, 500).build())
+        worlds.append(world)
+    enc = ObservationEncoder(grid_size=16)
+
+    batch = enc.vector_batch(worlds)
+    grids = enc.grid_batch(worlds[:2])
+
+    assert batch.shape == (3, len(VECTOR_FIELDS))
+    for row, world in zip(batch, worlds):
+        assert np.array_equal(row, enc.vector(world))
+    assert grids.shape == (2, 3, 16, 16)
+    assert np.array_equal(grids[1], enc.grid(worlds[1]))
@@ -0,0 +1,88 @@
+import numpy as np
+from pymunk import Vec2d
+
+from minigolf.components import Position, Velocity
+from minigolf.game.levels import create_level1
+from minigolf.objects import EntityBuilder
+from minigolf.systems.physics import STATE_WIDTH, PhysicsSpace
+from minigolf.world import World
+
+
+def _arena(balls: int) -> tuple[World, PhysicsSpace]:
+    world = World()
+    create_level1(world)
+    for i in range(balls - 1):
+        world.add_entity(EntityBuilder().ball(300 + 30 * i, 500).build())
+    physics = PhysicsSpace(world)
+    physics.populate()
+    return world, physics
+
+
+def test_bodies_are_split_into_static_and_dynamic():
+    world, physics = _arena(3)
+
+    assert set(physics.dynamic_bodies) == {b.id for b in world.get_balls()}
+    assert physics.static_bodies.keys() | physics.dynamic_bodies.keys() == (
+        physics.eid_to_body.keys()
+    )
+    assert len(physics.state) == 3 * STATE_WIDTH
+
+
+def test_state_buffer_mirrors_ball_components():
+    world, physics = _arena(3)
+    for phys_obj in physics.dynamic_bodies.values():
+        phys_obj.body.velocity = (200, -100)
+
+    physics.step()
+
+    rows = np.frombuffer(physics.state).reshape(-1, STATE_WIDTH)
+    for ball in world.get_balls():
+        pos, vel = ball.get(Position), ball.get(Velocity)
+        row = rows[physics.state_rows[ball.id]]
+        assert tuple(row) == (pos.x, pos.y, vel.dx, vel.dy)
+        assert (vel.dx, vel.dy) != (0.0, 0.0)
+
+
+def test_static_bodies_are_not_synced():
+    world, physics = _arena(1)
+    wall_id = next(iter(physics.static_bodies))
+    wall_pos = world.get_entity(wall_id).get(Position)
+    wall_pos.x = -1.0
+
+    physics.step()
+
+    assert wall_pos.x == -1.0
+
+
+def test_removing_a_ball_keeps_rows_aligned():
+    world, physics = _arena(3)
+    first, middle, last = world.get_balls()
+    physics.eid_to_body[last.id].body.position = Vec2d(777, 555)
+
+    physics.remove_entity(middle)
+    physics.step()
+
+    assert physics.state_rows == {first.id: 0, last.id: 1}
+    rows = np.frombuffer(physics.state).reshape(-1, STATE_WIDTH)
+    assert tuple(rows[1][:2]) == (777, 555)
+    assert last.get(Position).x == 777
+
+
+def test_populate_allocates_state_rows_once(monkeypatch):
+    arrays = []
+    grow = PhysicsSpace._grow_state
+
+    def counting(self):
+        grow(self)
+        arrays.append(self.state)
+
+    monkeypatch.setattr(PhysicsSpace, "_grow_state", counting)
+    world, physics = _arena(50)
+
+    assert len(arrays) == 1
+    assert len(physics.state) == 50 * STATE_WIDTH
+    assert sorted(physics.state_rows.values()) == list(range(50))
+
+    world.add_entity(ball := EntityBuilder().ball(100, 100).build())
+    physics.add_entity(ball)
+    assert len(physics.state) == 51 * STATE_WIDTH
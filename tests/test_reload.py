@@ -0,0 +1,76 @@
+import copy
+
+from pymunk import Vec2d
+
+from minigolf.components import Mode, Position
+from minigolf.controllers import SequenceController
+from minigolf.game.engine import Game
+from minigolf.game.levels import create_level1
+from minigolf.game.reload import LevelWatcher, apply_level, diff_levels
+from minigolf.objects import EntityBuilder
+from minigolf.world import World
+
+
+def _playing() -> tuple[World, Game]:
+    level = World()
+    create_level1(level)
+    world = copy.deepcopy(level)
+    game = Game(world=world, mode=Mode.TURN)
+    game.add_player(SequenceController())
+    for _ in range(30):
+        game.step(1 / 60)
+    return level, game
+
+
+def test_unchanged_level_is_a_no_op():
+    level, game = _playing()
+
+    diff = diff_levels(game.world, level)
+
+    # The ball has moved and the game added its turn manager; neither counts
+    assert not diff
+    assert game.world.get_balls()[0].get(Position).x != 200
+
+
+def test_edits_touch_only_changed_entities_and_keep_the_ball():
+    level, game = _playing()
+    world, physics = game.world, game.physics
+    ball = world.get_balls()[0]
+    ball_pos = physics.eid_to_body[ball.id].body.position
+
+    walls = [e.id for e in world.entities.values() if e.id in physics.static_bodies]
+    moved, deleted = walls[0], walls[1]
+    level.get_entity(moved).get(Position).y += 50
+    del level.entities[deleted]
+    # The next free id in the file is the one the game's turn manager took
+    added = level.add_entity(EntityBuilder().wall(500, 500, 10, 100).build())
+    turn_manager = game._get_turn_manager()
+    assert turn_manager.id == added
+    untouched = physics.eid_to_body[walls[2]].body
+
+    diff = apply_level(world, physics, level)
+
+    assert (diff.added, diff.removed, diff.changed) == ([added], [deleted], [moved])
+    assert deleted not in world.entities and deleted not in physics.eid_to_body
+    assert added in physics.static_bodies
+    assert turn_manager.id != added
+    assert world.entities[turn_manager.id] is turn_manager
+    assert physics.eid_to_body[walls[2]].body is untouched
+    moved_body = physics.eid_to_body[moved].body
+    assert moved_body.position.y == level.get_entity(moved).get(Position).y + 1
+
+    # The ball is still the same entity, where it was, and still rolling
+    assert world.get_balls()[0] is ball
+    assert physics.eid_to_body[ball.id].body.position == Vec2d(*ball_pos)
+    game.step(1 / 60)
+
+
+def test_watcher_reports_each_rewrite_once(tmp_path):
+    path = tmp_path / "level.json"
+    path.write_text("{}")
+    watcher = LevelWatcher(path, interval=0)
+
+    assert not watcher.changed()
+    path.write_text('{"entities": []}')
+    assert watcher.changed()
+    assert not watcher.changed()
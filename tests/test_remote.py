@@ -0,0 +1,144 @@
+import os
+import socket
+import threading
+from contextlib import contextmanager
+
+import pytest
+
+from minigolf.components import Action
+from minigolf.controllers import RemoteController
+from minigolf.objects import EntityBuilder
+from minigolf.remote import Observation, PolicyServer
+from minigolf.remote.policies import aim_at_hole
+from minigolf.remote.protocol import (
+    decode_requests,
+    decode_response,
+    encode_request,
+    encode_response,
+)
+from minigolf.world import World
+
+
+def _world() -> World:
+    world = World()
+    world.add_entity(EntityBuilder().hole(500, 100, radius=25).build())
+    world.add_entity(EntityBuilder().ball(100, 100).build())
+    return world
+
+
+@contextmanager
+def _serving(path, policy, **kwargs):
+    srv = PolicyServer(path, policy, **kwargs)
+    srv.start()
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield srv
+    finally:
+        srv.stop()
+        thread.join(timeout=2)
+
+
+@pytest.fixture
+def server(tmp_path):
+    batches: list[int] = []
+
+    def policy(observations):
+        batches.append(len(observations))
+        return aim_at_hole(observations)
+
+    with _serving(tmp_path / "policy.sock", policy, batch_window=0.2) as srv:
+        yield srv, batches
+
+
+def test_protocol_round_trip():
+    buffer = bytearray(encode_request(7, Observation(3, (1.0, 2.5))))
+    buffer += encode_request(8, Observation(4, ()))[:5]  # partial frame
+
+    assert decode_requests(buffer) == [(7, Observation(3, (1.0, 2.5)))]
+    assert len(buffer) == 5
+
+    action = Action(type="strike", velocity=(1.5, -2.0), angular_velocity=3.0)
+    assert decode_response(encode_response(9, action)) == (9, action)
+    assert decode_response(encode_response(10, None)) == (10, None)
+
+
+def test_remote_controller_gets_policy_action(server):
+    srv, _ = server
+    ctrl = RemoteController(srv.path)
+
+    action = ctrl.act(_world(), 0)
+    ctrl.close()
+
+    assert action.type == "strike"
+    vx, vy = action.velocity
+    assert vx > 0 and vy == 0
+
+
+def test_timeout_drops_the_connection_and_the_late_reply(server):
+    srv, _ = server
+    # The server batches for 0.2s before answering
+    ctrl = RemoteController(srv.path, timeout=0.05)
+    with pytest.raises(TimeoutError):
+        ctrl.act(_world(), 0)
+
+    ctrl.timeout = 2.0
+    action = ctrl.act(_world(), 0)
+    ctrl.close()
+
+    assert action.type == "strike"
+
+
+def test_requests_from_many_games_share_one_policy_call(server):
+    srv, batches = server
+    results: list[Action | None] = []
+
+    def play():
+        ctrl = RemoteController(srv.path)
+        results.append(ctrl.act(_world(), 0))
+        ctrl.close()
+
+    threads = [threading.Thread(target=play) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=5)
+
+    assert len(results) == 8
+    assert sum(batches) == 8
+    assert max(batches) > 1
+
+
+def test_failing_policy_answers_every_request_with_no_action(tmp_path):
+    calls = []
+
+    def policy(observations):
+        calls.append(len(observations))
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        # One action short of the batch
+        return aim_at_hole(observations)[1:]
+
+    with _serving(tmp_path / "policy.sock", policy) as srv:
+        ctrl = RemoteController(srv.path, timeout=2.0)
+        assert ctrl.act(_world(), 0) is None
+        assert ctrl.act(_world(), 0) is None
+        ctrl.close()
+
+    assert calls == [1, 1]
+
+
+def test_client_that_never_reads_does_not_stall_the_others(server):
+    srv, _ = server
+    # 1.7 MB of replies: far more than fits in the socket's buffers
+    request = encode_request(0, Observation(0, (100, 100, 0, 0, 500, 100, 25)))
+    stuck = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stuck.connect(os.fspath(srv.path))
+    stuck.sendall(request * 100_000)
+
+    ctrl = RemoteController(srv.path, timeout=2.0)
+    action = ctrl.act(_world(), 0)
+    ctrl.close()
+    stuck.close()
+
+    assert action.type == "strike"
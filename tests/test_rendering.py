@@ -5,6 +5,7 @@ import pytest
 
 from minigolf.components import Circle, Position, Rect, Renderable
 from minigolf.entity import Entity
+from minigolf.systems import rendering
 from minigolf.systems.rendering import render_system
 from minigolf.world import World
 
@@ -34,24 +35,24 @@ def screen():
     pygame.quit()
 
 
-def test_render_system_mocks_draw_at(screen):
+def test_render_system_mocks_shape_drawers(screen):
     world = DummyWorld()
     with (
-        patch.object(Rect, "draw_at", autospec=True) as mock_rect_draw_at,
-        patch.object(Circle, "draw_at", autospec=True) as mock_circle_draw_at,
+        patch.object(rendering, "draw_rect", autospec=True) as mock_draw_rect,
+        patch.object(rendering, "draw_circle", autospec=True) as mock_draw_circle,
     ):
         render_system(world, screen)
-        # Assert draw_at was called for both shapes
-        assert mock_rect_draw_at.called
-        assert mock_circle_draw_at.called
+        # Assert the shape drawer was called for both shapes
+        assert mock_draw_rect.called
+        assert mock_draw_circle.called
         # Check call args for Rect
-        rect_args, rect_kwargs = mock_rect_draw_at.call_args
-        assert rect_args[1] is screen  # self, screen, pos, colour
+        rect_args, rect_kwargs = mock_draw_rect.call_args
+        assert rect_args[0] is screen  # screen, shape, pos, colour
         assert isinstance(rect_args[2], Position)
         assert rect_args[3] == (255, 0, 0)
         # Check call args for Circle
-        circ_args, circ_kwargs = mock_circle_draw_at.call_args
-        assert circ_args[1] is screen
+        circ_args, circ_kwargs = mock_draw_circle.call_args
+        assert circ_args[0] is screen
         assert isinstance(circ_args[2], Position)
         assert circ_args[3] == (0, 255, 0)
 
@@ -63,13 +64,13 @@ def test_render_system_no_renderable_entities(screen):
 
     world = EmptyWorld()
     with (
-        patch.object(Rect, "draw_at", autospec=True) as mock_rect_draw_at,
-        patch.object(Circle, "draw_at", autospec=True) as mock_circle_draw_at,
+        patch.object(rendering, "draw_rect", autospec=True) as mock_draw_rect,
+        patch.object(rendering, "draw_circle", autospec=True) as mock_draw_circle,
     ):
         render_system(world, screen)
-        # Assert draw_at was not called for either shape
-        assert not mock_rect_draw_at.called
-        assert not mock_circle_draw_at.called
+        # Assert no shape drawer was called for either shape
+        assert not mock_draw_rect.called
+        assert not mock_draw_circle.called
 
 
 def test_render_system_multiple_entities_each_shape(screen):
@@ -92,21 +93,21 @@ def test_render_system_multiple_entities_each_shape(screen):
 
     world = MultiWorld()
     with (
-        patch.object(Rect, "draw_at", autospec=True) as mock_rect_draw_at,
-        patch.object(Circle, "draw_at", autospec=True) as mock_circle_draw_at,
+        patch.object(rendering, "draw_rect", autospec=True) as mock_draw_rect,
+        patch.object(rendering, "draw_circle", autospec=True) as mock_draw_circle,
     ):
         render_system(world, screen)
-        # Assert draw_at was called twice for each shape
-        assert mock_rect_draw_at.call_count == 2
-        assert mock_circle_draw_at.call_count == 2
+        # Assert the shape drawer was called twice for each shape
+        assert mock_draw_rect.call_count == 2
+        assert mock_draw_circle.call_count == 2
         # Check that all calls have correct arguments
-        for call in mock_rect_draw_at.call_args_list:
+        for call in mock_draw_rect.call_args_list:
             args, kwargs = call
-            assert args[1] is screen
+            assert args[0] is screen
             assert isinstance(args[2], Position)
             assert args[3] == (255, 0, 0)
-        for call in mock_circle_draw_at.call_args_list:
+        for call in mock_draw_circle.call_args_list:
             args, kwargs = call
-            assert args[1] is screen
+            assert args[0] is screen
             assert isinstance(args[2], Position)
             assert args[3] == (0, 255, 0)
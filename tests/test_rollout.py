@@ -0,0 +1,183 @@
+import math
+
+from minigolf.components import Action, Position
+from minigolf.game.levels import create_level1
+from minigolf.game.rollout import place_ball, simulate_stroke, stroke_bounds
+from minigolf.objects import EntityBuilder
+from minigolf.systems.contacts import BALL_CONTACT, WALL_CONTACT
+from minigolf.systems.physics import PhysicsSpace
+from minigolf.world import World
+
+
+def _strike(dx: float, dy: float, spin: float = 0.0) -> Action:
+    return Action(type="strike", velocity=(dx, dy), angular_velocity=spin)
+
+
+def _corridor(record_contacts: bool) -> tuple[World, PhysicsSpace, int, int]:
+    world = World()
+    wall = world.add_entity(EntityBuilder().wall(300, 0, 20, 200).build())
+    ball = world.add_entity(EntityBuilder().ball(100, 100).build())
+    physics = PhysicsSpace(world, record_contacts=record_contacts)
+    physics.populate()
+    return world, physics, ball, wall
+
+
+def test_stroke_records_wall_hit_with_position_and_impulse():
+    world, physics, ball, wall = _corridor(record_contacts=True)
+
+    result = simulate_stroke(world, physics, _strike(600, 0))
+
+    assert not result.won
+    assert result.rest[0] < 300
+    assert result.contacts is not None
+    assert result.contacts.wall_hits == 1
+    assert result.contacts.ball_hits == 0
+    assert result.contacts.max_impulse > 0
+    x, y = result.contacts.first_wall_hit
+    assert 290 <= x <= 305
+    evt = physics.contacts.events()[0]
+    assert (evt.eid_a, evt.eid_b, evt.kind) == (ball, wall, WALL_CONTACT)
+    assert evt.frame < result.frames
+
+
+def test_contact_recording_off_registers_nothing():
+    world, physics, _, _ = _corridor(record_contacts=False)
+
+    result = simulate_stroke(world, physics, _strike(600, 0))
+
+    assert result.contacts is None
+    assert len(physics.contacts) == 0
+
+    physics.set_contact_recording(True)
+    simulate_stroke(world, physics, _strike(600, 0))
+    assert len(physics.contacts) == 1
+
+
+def test_ball_ball_contacts_and_buffer_growth():
+    world = World()
+    world.add_entity(EntityBuilder().ball(100, 100).build())
+    world.add_entity(EntityBuilder().ball(150, 100).build())
+    physics = PhysicsSpace(world, record_contacts=True)
+    physics.contacts = type(physics.contacts)(capacity=1)
+    physics.populate()
+
+    result = simulate_stroke(world, physics, _strike(300, 0))
+
+    assert result.contacts.ball_hits == 1
+    assert physics.contacts.events()[0].kind == BALL_CONTACT
+    for i in range(5):
+        physics.contacts.record(i, 0, 0, 1, 0.0, 0.0, 1.0, WALL_CONTACT)
+    assert len(physics.contacts) == 6
+
+
+def test_level1_default_sequence_wins_headless():
+    from minigolf.consts import DEFAULT_MOVES
+
+    world = World()
+    create_level1(world)
+    physics = PhysicsSpace(world)
+    physics.populate()
+
+    results = [
+        simulate_stroke(world, physics, _strike(v.x, v.y, spin))
+        for v, spin in DEFAULT_MOVES
+    ]
+
+    assert [r.won for r in results] == [False, False, False, True]
+    assert results[-1].rest == (500.0, 500.0)
+
+
+def _boxed(hole_x: float = 300) -> tuple[World, PhysicsSpace, int]:
+    world = World()
+    for wall in [
+        (0, 0, 400, 10),
+        (0, 390, 400, 10),
+        (0, 0, 10, 400),
+        (390, 0, 10, 400),
+    ]:
+        world.add_entity(EntityBuilder().wall(*wall).build())
+    ball = world.add_entity(EntityBuilder().ball(100, 200).build())
+    world.add_entity(EntityBuilder().hole(hole_x, 200).build())
+    physics = PhysicsSpace(world)
+    physics.populate()
+    return world, physics, ball
+
+
+def test_hopeless_stroke_stops_early_at_the_predicted_rest():
+    world, physics, ball = _boxed()
+    start = (100.0, 200.0)
+    full = simulate_stroke(world, physics, _strike(0, 150), early_exit=False)
+    place_ball(physics, ball, start)
+
+    early = simulate_stroke(world, physics, _strike(0, 150))
+
+    assert early.predicted and not full.predicted
+    assert early.frames < full.frames / 2
+    assert math.dist(early.rest, full.rest) < 5
+    pos = world.get_entity(ball).get(Position)
+    assert (pos.x, pos.y) == early.rest
+
+
+def test_early_exit_never_gives_up_on_a_sink():
+    world, physics, ball = _boxed()
+    for speed in (100, 150, 200, 250, 400):
+        outcomes = []
+        for early_exit in (False, True):
+            place_ball(physics, ball, (100.0, 200.0))
+            physics.release(ball)
+            result = simulate_stroke(
+                world, physics, _strike(speed, 0), early_exit=early_exit
+            )
+            outcomes.append(result.won)
+        assert outcomes[0] == outcomes[1]
+
+
+def test_ball_leaving_the_walls_is_aborted():
+    world, physics, ball = _boxed()
+    # Open the right-hand side: the box of the walls is unchanged
+    physics.remove_entity(world.get_entity(3))
+    place_ball(physics, ball, (100.0, 100.0))
+
+    result = simulate_stroke(world, physics, _strike(2000, 0))
+
+    assert result.escaped and not result.won
+    assert result.rest[0] > 400
+
+
+def test_open_level_is_not_an_escape():
+    # A single obstacle wall: the ball starts outside its box
+    world = World()
+    world.add_entity(EntityBuilder().wall(400, 300, 10, 100).build())
+    world.add_entity(EntityBuilder().ball(200, 500).build())
+    world.add_entity(EntityBuilder().hole(600, 500).build())
+    physics = PhysicsSpace(world)
+    physics.populate()
+    ball = world.get_balls()[0].id
+
+    results = []
+    for early_exit in (False, True):
+        place_ball(physics, ball, (200.0, 500.0))
+        physics.release(ball)
+        results.append(
+            simulate_stroke(world, physics, _strike(400, 0), early_exit=early_exit)
+        )
+
+    assert results[0].won and results[1].won
+    assert not results[1].escaped
+    assert results[1].frames == results[0].frames
+
+
+def test_bounds_follow_layout_changes():
+    world, physics, _ = _boxed()
+    assert stroke_bounds(physics).walls == (0.0, 0.0, 400.0, 400.0)
+    assert stroke_bounds(physics).decay is not None
+
+    for built in (
+        EntityBuilder().wall(0, 0, 800, 10).build(),
+        EntityBuilder().ice(20, 20, 100, 100).build(),
+    ):
+        physics.add_entity(world.get_entity(world.add_entity(built)))
+
+    assert stroke_bounds(physics).walls == (0.0, 0.0, 800.0, 400.0)
+    # Ice keeps a ball rolling further than the floor would
+    assert stroke_bounds(physics).decay is None
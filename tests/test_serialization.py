@@ -0,0 +1,69 @@
+import pytest
+
+from minigolf.components import Phase, Position, TurnState, Velocity
+from minigolf.game.levels import create_level1
+from minigolf.objects import EntityBuilder
+from minigolf.serialization import BINARY_MAGIC, Snapshot, dumps, load_delta, loads
+from minigolf.systems.physics import PhysicsSpace
+from minigolf.systems.turn import ensure_turn_manager
+from minigolf.world import World
+
+
+def _level() -> World:
+    world = World()
+    create_level1(world)
+    ensure_turn_manager(world)
+    return world
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_full_roundtrip_is_compact(binary):
+    world = _level()
+
+    data = dumps(world, binary=binary)
+
+    assert data.startswith(BINARY_MAGIC) == binary
+    assert b"\n" not in data or binary
+    assert loads(data).to_json_dict() == world.to_json_dict()
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_delta_holds_only_changed_components(binary):
+    world = _level()
+    physics = PhysicsSpace(world)
+    physics.populate()
+    base = Snapshot(world)
+    ball = world.get_balls()[0]
+
+    physics.eid_to_body[ball.id].body.velocity = (300, -200)
+    for _ in range(5):
+        physics.step(1 / 60)
+    turn = ensure_turn_manager(world).get(TurnState)
+    turn.phase = Phase.BALL_IN_MOTION
+    delta = base.delta(world)
+
+    assert set(delta["components"]) == {"Position", "Velocity", "TurnState"}
+    assert list(delta["components"]["Position"]) == [str(ball.id)]
+
+    restored = load_delta(base.dumps(binary), base.dumps_delta(world, binary))
+    assert restored.to_json_dict() == world.to_json_dict()
+    assert len(base.dumps_delta(world)) < len(dumps(world)) / 10
+
+
+def test_delta_tracks_added_and_removed_entities_and_components():
+    world = World()
+    wall = world.add_entity(EntityBuilder().wall(0, 0, 10, 10).build())
+    ball = world.add_entity(EntityBuilder().ball(50, 50).build())
+    base = Snapshot(world)
+
+    world.remove_entity(wall)
+    world.get_entity(ball).remove(Velocity)
+    world.add_entity(EntityBuilder().hole(80, 80).build())
+    world.get_entity(ball).add(Position(x=1, y=2))
+
+    restored = base.apply(base.dumps_delta(world))
+    assert restored.to_json_dict() == world.to_json_dict()
+    assert restored._next_id == world._next_id
+
+    with pytest.raises(ValueError):
+        Snapshot(restored).apply(base.delta(world))
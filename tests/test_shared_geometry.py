@@ -0,0 +1,77 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from minigolf.components import Action
+from minigolf.game.levels import create_level1
+from minigolf.game.rollout import place_ball, simulate_stroke
+from minigolf.objects import EntityBuilder
+from minigolf.systems.physics import PhysicsSpace
+from minigolf.systems.shared_geometry import SharedLevel
+from minigolf.world import World
+
+
+def _level1() -> World:
+    world = World()
+    create_level1(world)
+    return world
+
+
+def _stroke(world: World, physics: PhysicsSpace, velocity) -> tuple:
+    ball = world.get_balls()[0].id
+    place_ball(physics, ball, (120, 480))
+    physics.release(ball)
+    result = simulate_stroke(
+        world, physics, Action(type="strike", velocity=velocity), ball_eid=ball
+    )
+    return result.rest, result.won, result.frames
+
+
+def _attached_stroke(name: str, velocity) -> tuple:
+    with SharedLevel.attach(name) as shared:
+        world, physics = shared.build()
+    return _stroke(world, physics, velocity)
+
+
+def test_built_level_strokes_like_the_original():
+    original = _level1()
+    physics = PhysicsSpace(original)
+    physics.populate()
+
+    with SharedLevel.publish(original) as shared:
+        walls = {int(eid) for eid in shared.walls[:, 0]}
+        world, built = shared.build()
+
+    # Walls only exist as bodies; everything else is in the World
+    assert walls and walls.isdisjoint(world.entities)
+    assert len(world.entities) + len(walls) == len(original.entities)
+    assert built.static_bodies.keys() == physics.static_bodies.keys()
+    for velocity in [(400, -250), (-300, 100), (50, 600)]:
+        assert _stroke(world, built, velocity) == _stroke(original, physics, velocity)
+
+
+def test_tuning_is_resolved_against_the_full_level():
+    world = _level1()
+    world.add_entity(EntityBuilder().wall(400, 400, 100, 0.5).build())
+
+    with SharedLevel.publish(world, "auto") as shared:
+        _, physics = shared.build()
+        assert shared.tuning.collision_slop == pytest.approx(0.025)
+    assert physics.space.collision_slop == pytest.approx(0.025)
+
+
+def test_workers_attach_by_name():
+    world = _level1()
+    physics = PhysicsSpace(world)
+    physics.populate()
+    expected = _stroke(world, physics, (400, -250))
+
+    with SharedLevel.publish(world) as shared:
+        with ProcessPoolExecutor(2) as pool:
+            results = list(
+                pool.map(_attached_stroke, [shared.name] * 2, [(400, -250)] * 2)
+            )
+
+    assert results == [expected, expected]
+    with pytest.raises(FileNotFoundError):
+        SharedLevel.attach(shared.name)
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from minigolf.game.surrogate import ShotSample, ShotSurrogate
+from minigolf.objects import EntityBuilder
+from minigolf.world import World
+
+START = (200.0, 500.0)
+
+
+def _arena() -> World:
+    world = World()
+    world.add_entity(EntityBuilder().wall(0, 0, 2000, 10).build())
+    world.add_entity(EntityBuilder().ball(*START).build())
+    world.add_entity(EntityBuilder().hole(1800, 1800).build())
+    return world
+
+
+def test_interpolates_between_simulated_shots_and_falls_back_far_away():
+    surrogate = ShotSurrogate(_arena(), threshold=30.0)
+    for speed in np.linspace(100, 400, 9):
+        surrogate.simulate(START, (float(speed), 0.0))
+    assert (len(surrogate), surrogate.simulations) == (9, 9)
+
+    guess = surrogate.predict(START, (275.0, 0.0))
+    exact = surrogate.simulate(START, (275.0, 0.0))
+    assert not guess.simulated and guess.uncertainty <= 30.0
+    assert abs(guess.rest[0] - exact.rest[0]) < 5
+    assert not guess.won
+
+    far = surrogate.predict(START, (0.0, 300.0))
+    assert far.simulated
+    assert len(surrogate) == 11
+
+
+def test_fit_from_logged_samples_and_save_load(tmp_path):
+    samples = [
+        ShotSample((x, 0.0), (100.0, 0.0), (x + 50.0, 0.0), x > 500)
+        for x in np.linspace(0, 1000, 11)
+    ]
+    surrogate = ShotSurrogate(_arena(), capacity=2).fit(samples)
+    surrogate.save(tmp_path / "shots.npz")
+
+    loaded = ShotSurrogate(_arena()).load(tmp_path / "shots.npz")
+    guess = loaded.estimate((1000.0, 0.0), (100.0, 0.0))
+    assert len(loaded) == 11
+    assert guess.rest == pytest.approx((1050.0, 0.0))
+    assert guess.won and guess.uncertainty < 1
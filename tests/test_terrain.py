@@ -0,0 +1,81 @@
+import math
+
+from minigolf.components import Position, Terrain
+from minigolf.consts import ICE_DAMPING, SAND_DAMPING
+from minigolf.objects import EntityBuilder
+from minigolf.systems.physics import PhysicsSpace
+from minigolf.systems.terrain import TerrainGrid
+from minigolf.world import World
+
+
+def _roll(world: World, frames: int = 120) -> PhysicsSpace:
+    physics = PhysicsSpace(world)
+    physics.populate()
+    for _ in range(frames):
+        physics.step()
+    return physics
+
+
+def _ball_travel(zone: EntityBuilder | None) -> float:
+    world = World()
+    if zone is not None:
+        world.add_entity(zone.build())
+    ball = EntityBuilder().ball(100, 100).velocity(200, 0).build()
+    world.add_entity(ball)
+    _roll(world)
+    return ball.get(Position).x - 100
+
+
+def test_grid_samples_zones_and_defaults():
+    world = World()
+    world.add_entity(EntityBuilder().sand(0, 0, 100, 50).build())
+    world.add_entity(EntityBuilder().ice(50, 0, 50, 50).build())
+
+    grid = TerrainGrid.from_world(world)
+
+    assert grid is not None
+    assert grid.sample(10, 10) == ((0.0, 0.0), SAND_DAMPING)
+    # Later zones win where they overlap
+    assert grid.sample(75, 10) == ((0.0, 0.0), ICE_DAMPING)
+    assert grid.sample(150, 10) is None
+    assert grid.sample(10, -5) is None
+
+
+def test_no_zones_means_no_grid():
+    world = World()
+    world.add_entity(EntityBuilder().wall(0, 0, 10, 10).build())
+    assert TerrainGrid.from_world(world) is None
+
+
+def test_sand_and_ice_change_rolling_distance():
+    floor = _ball_travel(None)
+    sand = _ball_travel(EntityBuilder().sand(0, 0, 1000, 200))
+    ice = _ball_travel(EntityBuilder().ice(0, 0, 1000, 200))
+
+    assert sand < floor < ice
+
+
+def test_slope_accelerates_resting_ball():
+    world = World()
+    world.add_entity(EntityBuilder().slope(0, 0, 200, 200, downhill=(0, 1)).build())
+    ball = EntityBuilder().ball(100, 50).build()
+    world.add_entity(ball)
+
+    _roll(world, frames=30)
+
+    pos = ball.get(Position)
+    assert pos.y > 50
+    assert math.isclose(pos.x, 100)
+
+
+def test_terrain_has_no_physics_body_and_round_trips():
+    world = World()
+    eid = world.add_entity(EntityBuilder().slope(0, 0, 50, 50).build())
+    physics = PhysicsSpace(world)
+    physics.populate()
+
+    assert eid not in physics.eid_to_body
+    assert physics.terrain is not None
+
+    loaded = World.from_json_dict(world.to_json_dict())
+    assert loaded.get_entity(eid).get(Terrain) == world.get_entity(eid).get(Terrain)
@@ -0,0 +1,68 @@
+import pytest
+
+from minigolf import trace
+from minigolf.components import Action
+from minigolf.controllers import SequenceController
+from minigolf.game.engine import Game
+from minigolf.game.levels import create_level1
+from minigolf.game.rollout import simulate_stroke
+from minigolf.systems.physics import PhysicsSpace
+from minigolf.world import World
+
+
+@pytest.fixture(autouse=True)
+def _reset_trace():
+    yield
+    trace.enable(trace.OFF)
+    trace.clear()
+
+
+def _stroke() -> None:
+    world = World()
+    create_level1(world)
+    physics = PhysicsSpace(world)
+    physics.populate()
+    simulate_stroke(world, physics, Action(type="strike", velocity=(300, 0)))
+
+
+def test_nothing_is_recorded_when_off():
+    trace.disable()
+    _stroke()
+    assert trace.events() == []
+
+
+def test_events_are_typed_tuples_formatted_on_dump():
+    trace.enable(trace.DEBUG)
+    _stroke()
+
+    assert trace.events() == [(trace.Event.TURN_APPLY, "strike", (300.0, 0.0))]
+    assert trace.dump() == ["[Turn] Applying strike with vel=(300.0, 0.0)"]
+    assert trace.events() == []
+
+
+def test_turn_phases_are_traced():
+    trace.enable(trace.DEBUG)
+    world = World()
+    create_level1(world)
+    game = Game(world=world, mode="turn")
+    game.add_player(SequenceController())
+    for _ in range(3):
+        game.step(1 / 60)
+
+    phases = [e[2:] for e in trace.events() if e[0] is trace.Event.TURN_PHASE]
+    assert phases[:2] == [
+        ("AWAIT_INPUT", "APPLY_ACTION"),
+        ("APPLY_ACTION", "BALL_IN_MOTION"),
+    ]
+    assert "[SeqCtrl] Player 0 move 1" in trace.dump()
+
+
+def test_info_level_skips_debug_events_and_buffer_is_bounded():
+    trace.enable(trace.INFO)
+    _stroke()
+    assert trace.events() == []
+
+    trace.enable(trace.DEBUG, capacity=2)
+    for _ in range(3):
+        _stroke()
+    assert len(trace.events()) == 2
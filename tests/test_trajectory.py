@@ -0,0 +1,49 @@
+from pymunk import Vec2d
+
+from minigolf.components import Action
+from minigolf.game.levels import create_level1
+from minigolf.game.rollout import place_ball, simulate_stroke
+from minigolf.game.trajectory import predict_action, rank_actions
+from minigolf.objects import EntityBuilder
+from minigolf.systems.physics import PhysicsSpace
+from minigolf.world import World
+
+
+def _level1() -> tuple[World, PhysicsSpace, int]:
+    world = World()
+    create_level1(world)
+    physics = PhysicsSpace(world)
+    physics.populate()
+    return world, physics, world.get_balls()[0].id
+
+
+def test_prediction_tracks_simulated_rest_through_bounces():
+    world, physics, ball = _level1()
+
+    for velocity, bounces in [((300, 0), 1), ((800, 0), 1), ((600, -100), 2)]:
+        action = Action(type="strike", velocity=velocity)
+        place_ball(physics, ball, (200, 800))
+        predicted = predict_action(world, physics, action)
+        simulated = simulate_stroke(world, physics, action)
+
+        assert predicted.bounces == bounces
+        assert Vec2d(*predicted.rest).get_distance(simulated.rest) < 15
+
+
+def test_rank_actions_puts_the_sinking_shot_first():
+    world = World()
+    world.add_entity(EntityBuilder().ball(100, 100).build())
+    world.add_entity(EntityBuilder().hole(400, 100, radius=25).build())
+    physics = PhysicsSpace(world)
+    physics.populate()
+    miss = Action(type="strike", velocity=(0.0, 300.0))
+    short = Action(type="strike", velocity=(30.0, 0.0))
+    # Arrives over the hole just under VELOCITY_THRESHOLD
+    sink = Action(type="strike", velocity=(110.0, 0.0))
+
+    ranked = rank_actions(world, physics, [miss, short, sink])
+
+    assert [a for a, _ in ranked] == [sink, short, miss]
+    assert ranked[0][1].sinks and not ranked[1][1].sinks
+    assert ranked[0][1].closest_approach == 0.0
+    assert simulate_stroke(world, physics, sink).won
@@ -0,0 +1,65 @@
+import pytest
+
+from minigolf.game.levels import create_level1
+from minigolf.objects import EntityBuilder
+from minigolf.systems import tuning
+from minigolf.systems.physics import PhysicsSpace
+from minigolf.systems.tuning import PhysicsTuning, resolve_tuning
+from minigolf.world import World
+
+
+def _level1() -> World:
+    world = World()
+    create_level1(world)
+    return world
+
+
+def test_auto_keeps_pymunk_defaults_on_ordinary_levels():
+    assert resolve_tuning(None, _level1()) == PhysicsTuning()
+
+
+def test_slop_stays_below_the_thinnest_wall():
+    world = _level1()
+    world.add_entity(EntityBuilder().wall(400, 400, 100, 0.5).build())
+
+    assert resolve_tuning("auto", world).collision_slop == pytest.approx(0.025)
+
+
+def test_hash_profile_sizes_cells_from_typical_wall():
+    world = World()
+    for i in range(5):
+        world.add_entity(EntityBuilder().wall(100 + 40 * i, 100, 30, 30).build())
+    world.add_entity(EntityBuilder().ball(500, 500).build())
+
+    dim, count = resolve_tuning("hash", world).spatial_hash
+    assert dim == 30
+    assert count == tuning.HASH_CELLS_PER_SHAPE * 6
+
+
+def test_threads_only_for_crowded_levels_with_spare_cores(monkeypatch):
+    world = World()
+    for i in range(tuning.THREADED_MIN_BALLS):
+        world.add_entity(EntityBuilder().ball(100 + i, 100).build())
+
+    monkeypatch.setattr(tuning.os, "cpu_count", lambda: 1)
+    assert PhysicsTuning.for_world(world).threads == 1
+    monkeypatch.setattr(tuning.os, "cpu_count", lambda: 4)
+    assert PhysicsTuning.for_world(world).threads == tuning.THREADS
+
+
+def test_unknown_profile_is_rejected():
+    with pytest.raises(ValueError, match="Unknown physics profile"):
+        resolve_tuning("turbo", _level1())
+
+
+def test_physics_space_applies_profile_at_populate():
+    physics = PhysicsSpace(_level1(), tuning="threaded")
+    physics.populate()
+
+    assert physics.space.threaded
+    assert physics.space.threads == tuning.THREADS
+    assert physics.tuning.threads == tuning.THREADS
+
+    lean = PhysicsSpace(_level1(), tuning="lean")
+    lean.populate()
+    assert lean.space.iterations == tuning.LEAN_ITERATIONS
@@ -1,7 +1,7 @@
 # TODO: Explore multiple controllers at once
 import math
 
-from minigolf.components import Circle, Collider
+from minigolf.components import Circle, Collider, Position
 from minigolf.consts import STOPPING_VELOCITY, VELOCITY_THRESHOLD
 from minigolf.objects import EntityBuilder
 from minigolf.systems.win import win_condition_system
@@ -89,3 +89,94 @@ def test_requires_hole_present():
     world = World()
     _add_ball(world, 100, 100, dx=0, dy=0)
     assert len(win_condition_system(world)) == 0
+
+
+def _simulate(world: World, frames: int, substeps: int = 50):
+    from minigolf.systems.physics import PhysicsSpace
+
+    physics = PhysicsSpace(world)
+    physics.populate()
+    events = []
+    for _ in range(frames):
+        physics.step(substeps=substeps)
+        events += win_condition_system(world, physics)
+    return physics, events
+
+
+def test_sensor_captures_slow_ball_and_snaps_to_centre():
+    world = World()
+    hole = _add_hole(world, 100, 100, r=15)
+    ball = _add_ball(world, 60, 100, dx=40, dy=0)
+
+    physics, events = _simulate(world, 120)
+
+    assert [(e.ball_eid, e.hole_eid) for e in events] == [(ball.id, hole.id)]
+    assert events[0].speed <= VELOCITY_THRESHOLD
+    pos = ball.get(Position)
+    assert (pos.x, pos.y) == (100, 100)
+    assert physics.eid_to_body[ball.id].body.velocity.length == 0
+
+
+def test_sensor_lets_fast_ball_roll_over_hole():
+    world = World()
+    _add_hole(world, 100, 100, r=15)
+    ball = _add_ball(world, 0, 100, dx=3000, dy=0)
+
+    _, events = _simulate(world, 60)
+
+    assert events == []
+    pos = ball.get(Position)
+    assert pos.x > 200
+    assert math.isclose(pos.y, 100)
+
+
+def test_sensor_handles_multiple_holes_and_balls():
+    world = World()
+    hole_a = _add_hole(world, 100, 100, r=15)
+    hole_b = _add_hole(world, 400, 100, r=15)
+    ball_a = _add_ball(world, 100, 80, dx=0, dy=30)
+    ball_b = _add_ball(world, 420, 100, dx=-30, dy=0)
+
+    _, events = _simulate(world, 120)
+
+    assert {(e.ball_eid, e.hole_eid) for e in events} == {
+        (ball_a.id, hole_a.id),
+        (ball_b.id, hole_b.id),
+    }
+
+
+def test_funnel_pulls_passing_ball_into_hole():
+    world = World()
+    _add_hole(world, 100, 100, r=15)
+    # Passes 30px from the centre: outside the contact radius, inside the funnel
+    ball = _add_ball(world, 0, 130, dx=150, dy=0)
+
+    _, events = _simulate(world, 120)
+
+    assert [e.ball_eid for e in events] == [ball.id]
+
+
+def test_funnel_only_active_near_hole():
+    world = World()
+    _add_hole(world, 100, 100, r=15)
+    ball = _add_ball(world, 0, 300, dx=150, dy=0)
+
+    physics, _ = _simulate(world, 30)
+
+    assert physics.funnels == {}
+    assert math.isclose(ball.get(Position).y, 300)
+
+
+def test_funnel_independent_of_substeps():
+    finals = []
+    for substeps in (25, 50, 100):
+        world = World()
+        _add_hole(world, 100, 100, r=15)
+        ball = _add_ball(world, 40, 150, dx=120, dy=0)
+        _simulate(world, 20, substeps=substeps)
+        pos = ball.get(Position)
+        finals.append((pos.x, pos.y))
+
+    for x, y in finals[1:]:
+        assert math.isclose(x, finals[0][0], abs_tol=1.0)
+        assert math.isclose(y, finals[0][1], abs_tol=1.0)